@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import subprocess
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -20,19 +21,21 @@ from .executor import resolve_executor_policy
 from .gh_ops import get_pr_number_for_head, post_final_comment
 from .git_ops import (
     StashConflictError,
-    ensure_gh_alias,
+    close_git_coprocesses,
     git_add,
     git_branch_exists,
     git_commit,
     git_current_branch,
-    git_default_branch,
     git_has_staged_changes,
     git_push_branch,
     git_root,
     git_stage_all,
     git_stash_worktree,
     git_status_snapshot,
+    invalidate_branch_refs,
+    open_git_coprocess,
     parse_owner_repo_from_git,
+    preflight,
     print_codex_diagnostics,
     safe_stash_pop,
 )
@@ -46,6 +49,8 @@ from .utils import extract_called_process_error_details, now_stamp, slugify
 
 PRD_NOT_FOUND_ERROR = "PRD path not found: {path}"
 PRD_NOT_FILE_ERROR = "PRD path must be a file: {path}"
+# How long run() waits at exit for the background final PR comment.
+FINAL_COMMENT_JOIN_TIMEOUT_SECONDS = 5.0
 
 
 def _is_path_within(path: Path, parent: Path) -> bool:
@@ -70,6 +75,7 @@ def run(args) -> None:
     repo_root = Path(args.repo).resolve() if args.repo else git_root()
     register_safe_cwd(repo_root)
     os.chdir(repo_root)
+    final_comment_thread: threading.Thread | None = None
     try:
         if args.log_file:
             log_path = Path(args.log_file).expanduser()
@@ -115,7 +121,9 @@ def run(args) -> None:
 
         _, _, _ = resolve_executor_policy(args.executor_policy)
 
-        ensure_gh_alias()
+        preflight_info = preflight(repo_root, need_owner_repo=not args.repo_slug)
+        # HEAD is re-read after every agent pass; share one git process for it.
+        open_git_coprocess(repo_root)
 
         prd_candidate = Path(args.prd)
         if prd_candidate.is_absolute():
@@ -164,15 +172,21 @@ def run(args) -> None:
             session_id = generate_session_id(prd_path)
             logger.info("Creating new session %s", session_id)
 
-        owner_repo = args.repo_slug or parse_owner_repo_from_git()
-        repo_default_branch = git_default_branch(repo_root)
+        owner_repo = (
+            args.repo_slug or preflight_info.owner_repo or parse_owner_repo_from_git()
+        )
+        repo_default_branch = preflight_info.default_branch
         base_branch = args.base or repo_default_branch or "main"
         needs_branch_setup = include("local") or include("pr")
         should_checkout_base = include("local") or args.sync_git
         if needs_branch_setup:
             new_branch = args.branch or f"codex/{slugify(prd_path.stem)}-{now_stamp()}"
         else:
-            new_branch = args.branch or git_current_branch(repo_root)
+            new_branch = (
+                args.branch
+                or preflight_info.current_branch
+                or git_current_branch(repo_root)
+            )
 
         base_branch_exists = git_branch_exists(repo_root, base_branch)
         if not base_branch_exists:
@@ -183,7 +197,9 @@ def run(args) -> None:
                 base_branch = repo_default_branch
                 base_branch_exists = git_branch_exists(repo_root, base_branch)
         if not base_branch_exists:
-            current_branch = git_current_branch(repo_root)
+            current_branch = preflight_info.current_branch or git_current_branch(
+                repo_root
+            )
             print(
                 f"Base branch '{base_branch}' still not found; falling back to current branch '{current_branch}'."
             )
@@ -198,7 +214,7 @@ def run(args) -> None:
         stash_selector: str | None = None
         branch_pushed = False
         if not args.dry_run:
-            dirty_entries = git_status_snapshot(repo_root)
+            dirty_entries = sorted(git_status_snapshot(repo_root))
             if dirty_entries:
                 if active_phases_with_commit_risk:
                     print("⚠️  WARNING: Workspace has uncommitted changes!")
@@ -282,6 +298,7 @@ def run(args) -> None:
                         f"Base branch '{base_branch}' missing; staying on existing branch '{new_branch}'."
                     )
                     run_cmd(["git", "checkout", "-B", new_branch], cwd=repo_root)
+                invalidate_branch_refs()
                 new_branch = git_current_branch(repo_root)
             except subprocess.CalledProcessError as exc:
                 details = extract_called_process_error_details(exc)
@@ -542,12 +559,14 @@ def run(args) -> None:
                 mark_phase_complete(checkpoint, "review_fix")
                 save_checkpoint(checkpoint)
                 # Only post final success comment when review loop completed successfully
-                post_final_comment(
+                # Posted in the background; joined with a timeout before returning.
+                final_comment_thread = post_final_comment(
                     pr_number=pr_number,
                     owner_repo=owner_repo,
                     prd_path=prd_path,
                     repo_root=repo_root,
                     dry_run=args.dry_run,
+                    async_mode=True,
                 )
 
         # Mark session complete only if all phases succeeded.
@@ -573,4 +592,12 @@ def run(args) -> None:
         if appears_complete:
             print(f"Final TASKS_LEFT={tasks_left}", flush=True)
     finally:
+        if final_comment_thread is not None:
+            final_comment_thread.join(timeout=FINAL_COMMENT_JOIN_TIMEOUT_SECONDS)
+            if final_comment_thread.is_alive():
+                logger.info(
+                    "Final PR comment still posting after %.0fs; continuing",
+                    FINAL_COMMENT_JOIN_TIMEOUT_SECONDS,
+                )
+        close_git_coprocesses()
         os.chdir(original_cwd)
@@ -6,13 +6,16 @@ enabling recovery from interruptions and resume capability.
 
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
 import os
 import tempfile
+import threading
+from collections.abc import Callable
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, TypedDict
+from typing import IO, Any, TypedDict
 
 from .logging_utils import logger
 
@@ -283,16 +286,62 @@ def create_checkpoint(
     }
 
 
+def _write_checkpoint_file(
+    session_id: str, target_path: Path, write: Callable[[IO[str]], object]
+) -> None:
+    """Write a checkpoint through a 0600 temp file, fsync it, then rename it."""
+    # Write to temp file then rename for atomicity.
+    # fd is wrapped in try-finally immediately to prevent fd leak if an exception
+    # occurs before os.fdopen takes ownership of the file descriptor.
+    fd, temp_path = tempfile.mkstemp(
+        suffix=".json.tmp",
+        prefix=f"{session_id}-",
+        dir=target_path.parent,
+    )
+    fd_closed = False
+    try:
+        # os.fdopen takes ownership; fd will be closed by context manager.
+        # We only mark fd_closed = True AFTER os.fdopen succeeds to ensure
+        # we close the fd manually if os.fdopen itself raises an exception.
+        with os.fdopen(fd, "w") as f:
+            fd_closed = True
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.rename(temp_path, target_path)
+        # Ensure final file has restrictive permissions (0600)
+        os.chmod(target_path, 0o600)
+        logger.debug("Saved checkpoint to %s", target_path)
+    except Exception:
+        # Close fd if os.fdopen was never called (prevents fd leak)
+        if not fd_closed:
+            try:
+                os.close(fd)
+            except OSError:
+                # Ignore errors closing fd; it may already be closed or invalid during cleanup.
+                pass
+        # Clean up temp file on failure
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            # Ignore errors deleting temp file; it may not exist or may have already been removed.
+            pass
+        raise
+
+
 def save_checkpoint(checkpoint: dict[str, Any]) -> None:
     """Atomically save checkpoint to disk with restricted permissions.
 
     Uses write-to-temp-then-rename pattern for atomicity. Checkpoint files are
     created with 0600 permissions (owner read/write only) since they may contain
     sensitive data such as PRD paths, session state, and repository information.
+    Any pending save_checkpoint_async() writes land first, so an older snapshot
+    never replaces this one.
 
     Args:
         checkpoint: Checkpoint dictionary to save.
     """
+    _wait_for_async_saves()
     checkpoint["updated_at"] = datetime.now(timezone.utc).isoformat()
     session_id = checkpoint["session_id"]
     target_path = get_checkpoint_path(session_id)
@@ -301,48 +350,99 @@ def save_checkpoint(checkpoint: dict[str, Any]) -> None:
     # This ensures the temp file is created with 0600 permissions by default.
     old_umask = os.umask(0o077)
     try:
-        # Write to temp file then rename for atomicity.
-        # fd is wrapped in try-finally immediately to prevent fd leak if an exception
-        # occurs before os.fdopen takes ownership of the file descriptor.
-        fd, temp_path = tempfile.mkstemp(
-            suffix=".json.tmp",
-            prefix=f"{session_id}-",
-            dir=target_path.parent,
+        _write_checkpoint_file(
+            session_id,
+            target_path,
+            lambda f: json.dump(checkpoint, f, indent=2, sort_keys=True),
         )
-        fd_closed = False
-        try:
-            # os.fdopen takes ownership; fd will be closed by context manager.
-            # We only mark fd_closed = True AFTER os.fdopen succeeds to ensure
-            # we close the fd manually if os.fdopen itself raises an exception.
-            with os.fdopen(fd, "w") as f:
-                fd_closed = True
-                json.dump(checkpoint, f, indent=2, sort_keys=True)
-                f.flush()
-                os.fsync(f.fileno())
-            os.rename(temp_path, target_path)
-            # Ensure final file has restrictive permissions (0600)
-            os.chmod(target_path, 0o600)
-            logger.debug("Saved checkpoint to %s", target_path)
-        except Exception:
-            # Close fd if os.fdopen was never called (prevents fd leak)
-            if not fd_closed:
-                try:
-                    os.close(fd)
-                except OSError:
-                    # Ignore errors closing fd; it may already be closed or invalid during cleanup.
-                    pass
-            # Clean up temp file on failure
-            try:
-                os.unlink(temp_path)
-            except OSError:
-                # Ignore errors deleting temp file; it may not exist or may have already been removed.
-                pass
-            raise
     finally:
         # Restore original umask
         os.umask(old_umask)
 
 
+# Background checkpoint writes: latest serialized payload per session, written by
+# one daemon thread. Superseded payloads are dropped before they reach disk.
+_async_cond = threading.Condition()
+_async_pending: dict[str, tuple[Path, str]] = {}
+_async_writing = 0
+_async_error: Exception | None = None
+_async_thread: threading.Thread | None = None
+
+
+def save_checkpoint_async(checkpoint: dict[str, Any]) -> None:
+    """Queue a checkpoint save and return without waiting for the disk.
+
+    The checkpoint is stamped and serialized immediately, so later changes to
+    the dictionary do not affect what is written. Only the newest queued
+    snapshot per session is written. The file is produced exactly as by
+    save_checkpoint(); call flush_checkpoint_saves() to wait for it.
+
+    Args:
+        checkpoint: Checkpoint dictionary to save.
+    """
+    global _async_thread
+    checkpoint["updated_at"] = datetime.now(timezone.utc).isoformat()
+    session_id = checkpoint["session_id"]
+    payload = json.dumps(checkpoint, indent=2, sort_keys=True)
+    target_path = get_checkpoint_path(session_id)
+    with _async_cond:
+        _async_pending[session_id] = (target_path, payload)
+        if _async_thread is None:
+            _async_thread = threading.Thread(
+                target=_async_save_loop, name="checkpoint-writer", daemon=True
+            )
+            _async_thread.start()
+        _async_cond.notify_all()
+
+
+def _async_save_loop() -> None:
+    global _async_error, _async_writing
+    while True:
+        with _async_cond:
+            while not _async_pending:
+                _async_cond.wait()
+            session_id, (target_path, payload) = _async_pending.popitem()
+            _async_writing += 1
+        try:
+            # mkstemp creates the temp file 0600 itself; the process umask is
+            # not touched from this thread.
+            _write_checkpoint_file(
+                session_id, target_path, lambda f, data=payload: f.write(data)
+            )
+        except Exception as e:
+            logger.warning("Failed to save checkpoint %s: %s", target_path, e)
+            with _async_cond:
+                _async_error = e
+        finally:
+            with _async_cond:
+                _async_writing -= 1
+                _async_cond.notify_all()
+
+
+def _wait_for_async_saves() -> Exception | None:
+    global _async_error
+    with _async_cond:
+        while _async_pending or _async_writing:
+            _async_cond.wait()
+        error, _async_error = _async_error, None
+    return error
+
+
+# Failures were already logged by the writer; exit only waits for the disk.
+atexit.register(_wait_for_async_saves)
+
+
+def flush_checkpoint_saves() -> None:
+    """Wait for queued save_checkpoint_async() writes to reach disk.
+
+    Raises:
+        Exception: The most recent background write failure, if any.
+    """
+    error = _wait_for_async_saves()
+    if error is not None:
+        raise error
+
+
 def _migrate_v0_to_v1(checkpoint: dict[str, Any]) -> None:
     """Migrate checkpoint from v0 (unversioned) to v1.
 
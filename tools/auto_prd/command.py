@@ -14,6 +14,7 @@ import tempfile
 import time
 from collections.abc import Sequence
 from pathlib import Path
+from typing import Literal, overload
 
 from .constants import (
     COMMAND_ALLOWLIST,
@@ -357,6 +358,65 @@ def ensure_claude_debug_dir() -> Path:
     return fallback
 
 
+def _stderr_retry_pattern(
+    patterns: Sequence[str] | re.Pattern[str] | None,
+) -> re.Pattern[str] | None:
+    """Fold retry substrings into one alternation so stderr is scanned once."""
+    if patterns is None or isinstance(patterns, re.Pattern):
+        return patterns
+    if not patterns:
+        return None
+    return re.compile("|".join(re.escape(pattern) for pattern in patterns))
+
+
+@overload
+def run_cmd(
+    cmd: Sequence[str],
+    *,
+    cwd: Path | None = ...,
+    check: bool = ...,
+    capture: bool = ...,
+    timeout: int | None = ...,
+    extra_env: dict | None = ...,
+    stdin: str | None = ...,
+    sanitize_args: bool = ...,
+    retries: int = ...,
+    retry_on_codes: set[int] | None = ...,
+    retry_on_stderr: list[str] | re.Pattern[str] | None = ...,
+    backoff_base: float = ...,
+    backoff_max: float = ...,
+    backoff_jitter: float = ...,
+    log_stdout: bool = ...,
+    discard_stdout: bool = ...,
+    timeout_exit_code: int | None = ...,
+    binary: Literal[False] = ...,
+) -> tuple[str, str, int]: ...
+
+
+@overload
+def run_cmd(
+    cmd: Sequence[str],
+    *,
+    cwd: Path | None = ...,
+    check: bool = ...,
+    capture: bool = ...,
+    timeout: int | None = ...,
+    extra_env: dict | None = ...,
+    stdin: str | None = ...,
+    sanitize_args: bool = ...,
+    retries: int = ...,
+    retry_on_codes: set[int] | None = ...,
+    retry_on_stderr: list[str] | re.Pattern[str] | None = ...,
+    backoff_base: float = ...,
+    backoff_max: float = ...,
+    backoff_jitter: float = ...,
+    log_stdout: bool = ...,
+    discard_stdout: bool = ...,
+    timeout_exit_code: int | None = ...,
+    binary: Literal[True],
+) -> tuple[bytes, str, int]: ...
+
+
 def run_cmd(
     cmd: Sequence[str],
     *,
@@ -370,11 +430,15 @@ def run_cmd(
     # Retry parameters (backward compatible defaults)
     retries: int = 0,
     retry_on_codes: set[int] | None = None,
-    retry_on_stderr: list[str] | None = None,
+    retry_on_stderr: list[str] | re.Pattern[str] | None = None,
     backoff_base: float = 1.0,
     backoff_max: float = 60.0,
     backoff_jitter: float = 0.5,
-) -> tuple[str, str, int]:
+    log_stdout: bool = True,
+    discard_stdout: bool = False,
+    timeout_exit_code: int | None = None,
+    binary: bool = False,
+) -> tuple[str | bytes, str, int]:
     """Execute a command with optional retry logic for transient failures.
 
     Args:
@@ -388,10 +452,20 @@ def run_cmd(
         sanitize_args: If True, sanitize shell-sensitive characters.
         retries: Number of retry attempts (0 = no retry, backward compatible).
         retry_on_codes: Exit codes that should trigger a retry.
-        retry_on_stderr: Stderr patterns that should trigger a retry.
+        retry_on_stderr: Stderr substrings (or one precompiled regex) that should
+            trigger a retry.
         backoff_base: Base delay in seconds for exponential backoff.
         backoff_max: Maximum delay in seconds between retries.
         backoff_jitter: Random jitter factor (0.0-1.0) to add to delay.
+        log_stdout: If False, never write captured stdout to the log. Use for
+            commands that print credentials (e.g. ``gh auth token``).
+        discard_stdout: If True, send stdout to DEVNULL and return it empty. Use
+            for exit-code-only probes; stderr is still captured for diagnostics.
+        timeout_exit_code: If set, a timeout returns the partial output with this
+            exit code (124 mirrors coreutils ``timeout``) instead of raising
+            TimeoutExpired.
+        binary: If True, return stdout as raw bytes instead of decoded text. Useful
+            for callers that hand the output straight to a JSON parser.
 
     Returns:
         Tuple of (stdout, stderr, returncode).
@@ -438,6 +512,10 @@ def run_cmd(
         stdin_bytes = stdin.encode("utf-8")
 
     # Execute with retry logic
+    stderr_retry_re = _stderr_retry_pattern(retry_on_stderr)
+    stdout_target: int | None = subprocess.PIPE if capture else None
+    if discard_stdout:
+        stdout_target = subprocess.DEVNULL
     attempt = 0
 
     while True:
@@ -461,17 +539,26 @@ def run_cmd(
                 sanitized_cmd,
                 cwd=str(cwd) if cwd else None,
                 check=False,
-                capture_output=capture,
+                stdout=stdout_target,
+                stderr=subprocess.PIPE if capture else None,
                 text=False,
                 timeout=timeout,
                 env=env,
                 input=stdin_bytes,
             )
-        except subprocess.TimeoutExpired:
+        except subprocess.TimeoutExpired as exc:
             duration = time.monotonic() - start_time
             logger.warning("Command timed out after %.2fs: %s", duration, cmd_display)
             # Timeouts are generally not retryable (would just timeout again)
-            raise
+            if timeout_exit_code is None:
+                raise
+            # subprocess.run has already killed the child; keep what it printed.
+            partial_stdout = exc.stdout or b""
+            return (
+                partial_stdout if binary else decode_output(partial_stdout),
+                decode_output(exc.stderr or b""),
+                timeout_exit_code,
+            )
         except Exception:
             duration = time.monotonic() - start_time
             logger.exception(
@@ -482,11 +569,17 @@ def run_cmd(
         duration = time.monotonic() - start_time
         stdout_bytes = proc.stdout or b""
         stderr_bytes = proc.stderr or b""
-        stdout_text = decode_output(stdout_bytes)
         stderr_text = decode_output(stderr_bytes)
+        # In binary mode stdout is only decoded when debug logging will show it.
+        stdout_text = (
+            ""
+            if binary and not logger.isEnabledFor(logging.DEBUG)
+            else decode_output(stdout_bytes)
+        )
+        stdout_result: str | bytes = stdout_bytes if binary else stdout_text
 
         if capture:
-            if stdout_text:
+            if stdout_text and log_stdout:
                 logger.debug("Command stdout: %s", truncate_for_log(stdout_text))
             if stderr_text:
                 level = logging.ERROR if proc.returncode != 0 else logging.DEBUG
@@ -496,7 +589,7 @@ def run_cmd(
 
         if proc.returncode == 0:
             logger.info("Command succeeded in %.2fs: %s", duration, cmd_display)
-            return stdout_text, stderr_text, proc.returncode
+            return stdout_result, stderr_text, proc.returncode
 
         # Command failed - check if we should retry
         level = logging.ERROR if check else logging.WARNING
@@ -518,12 +611,11 @@ def run_cmd(
                 retry_reason = f"exit code {proc.returncode} in retry_on_codes"
 
             # Check if stderr contains retryable patterns
-            if retry_on_stderr and not should_retry:
-                for pattern in retry_on_stderr:
-                    if pattern in stderr_text:
-                        should_retry = True
-                        retry_reason = f"stderr contains '{pattern}'"
-                        break
+            if stderr_retry_re is not None and not should_retry:
+                match = stderr_retry_re.search(stderr_text)
+                if match:
+                    should_retry = True
+                    retry_reason = f"stderr contains '{match.group(0)}'"
 
         if should_retry:
             # Calculate backoff delay with jitter
@@ -546,7 +638,7 @@ def run_cmd(
                 proc.returncode, sanitized_cmd, output=stdout_bytes, stderr=stderr_bytes
             )
 
-        return stdout_text, stderr_text, proc.returncode
+        return stdout_result, stderr_text, proc.returncode
 
 
 def safe_popen(
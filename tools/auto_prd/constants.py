@@ -13,6 +13,9 @@ from types import MappingProxyType
 CHECKBOX_ANY_RE = re.compile(r"^\s*[-*]\s*\[[ xX]\]", flags=re.MULTILINE)
 CHECKBOX_UNCHECKED_RE = re.compile(r"^\s*[-*]\s*\[\s\]", flags=re.MULTILINE)
 TASKS_LEFT_RE = re.compile(r"TASKS_LEFT\s*=\s*(\d+)", flags=re.IGNORECASE)
+# Runners are told to finish with TASKS_LEFT=<N>, so look for it in this many
+# trailing characters of the transcript before scanning the whole thing.
+TASKS_LEFT_TAIL_SCAN_CHARS = 8192
 CODEX_READONLY_PATTERNS = (
     "sandbox is read-only",
     "sandbox: read-only",
@@ -22,6 +25,11 @@ CODEX_READONLY_PATTERNS = (
     "blocked because the repo is mounted read-only",
     'approval policy "never" prevents escalation',
 )
+# Single case-insensitive scan for any of the phrases above.
+CODEX_READONLY_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in CODEX_READONLY_PATTERNS),
+    flags=re.IGNORECASE,
+)
 CODEX_READONLY_ERROR_MSG = (
     "Codex reported it cannot modify the workspace (detected phrase: {pattern!r}). "
     "Confirm your sandbox/approval settings in ~/.codex/config.toml or via `codex --help` so the agent has write access."
@@ -164,6 +172,14 @@ VALID_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
 ACCEPTED_LOG_LEVELS = (*VALID_LOG_LEVELS, "WARN")
 
 RATE_LIMIT_STATUS = {"403", "429"}
+# GitHub rate-limit hints that `gh api` can surface in its output. Retry-After is sent
+# with secondary rate limits; X-RateLimit-Reset (epoch seconds) with primary limits.
+RETRY_AFTER_RE = re.compile(r"Retry-After:\s*(\d+)", flags=re.IGNORECASE)
+RATE_LIMIT_RESET_RE = re.compile(r"X-RateLimit-Reset:\s*(\d+)", flags=re.IGNORECASE)
+# GitHub asks clients to wait at least a minute after a secondary rate limit when no
+# Retry-After header is available.
+SECONDARY_RATE_LIMIT_WAIT_SECONDS = 60.0
+RATE_LIMIT_MAX_WAIT_SECONDS = 900.0
 CODERABBIT_REVIEW_LOGINS = {
     login.lower()
     for login in {
@@ -1,11 +1,46 @@
-"""GitHub CLI helpers and review thread utilities."""
+"""GitHub CLI/API helpers and review thread utilities."""
 
 from __future__ import annotations
 
+import atexit
 import json
+import os
+import re
 import subprocess
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cache
 from pathlib import Path
+from urllib.parse import urlparse
+
+# ciso8601 is optional - C-accelerated RFC 3339 parsing with a stdlib fallback
+try:
+    from ciso8601 import parse_datetime as _ciso_parse_datetime
+
+    HAS_CISO8601 = True
+except ImportError:
+    HAS_CISO8601 = False
+
+# orjson is optional - parses the raw gh stdout bytes without an intermediate str
+# and encodes request bodies
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# httpx is optional - one persistent (HTTP/2 when available) connection to the GitHub
+# API instead of spawning `gh api` and a fresh TLS handshake per request
+try:
+    import httpx
+
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
 
 from .command import run_cmd
 from .constants import (
@@ -16,28 +51,93 @@ from .constants import (
 from .logging_utils import logger
 from .utils import call_with_backoff, extract_called_process_error_details
 
-GATHER_THREAD_COMMENTS_QUERY = """
-query($threadId:ID!,$cursor:String){
-  node(id:$threadId){
-    ... on PullRequestReviewThread{
-      comments(first:20,after:$cursor){
-        nodes{
-          author{login}
-          body
-          url
-          commit{oid}
-          databaseId
-        }
-        pageInfo{
-          hasNextPage
-          endCursor
-        }
+# Per-thread comment selection. _thread_comments_batch_query() instantiates it once
+# per alias, suffixing $threadId/$cursor with the alias index, so several threads'
+# comments are fetched in a single GraphQL request.
+THREAD_COMMENTS_SELECTION = """
+node(id:$threadId){
+  ... on PullRequestReviewThread{
+    comments(first:100,after:$cursor){
+      nodes{
+        author{login}
+        body
+        url
+        commit{oid}
+        databaseId
       }
+      pageInfo{
+        hasNextPage
+        endCursor
+      }
+    }
+  }
+}
+"""
+
+# Per-thread resolve selection, aliased m0, m1, ... by _resolve_threads_batch_mutation()
+# so one GraphQL request resolves many threads.
+RESOLVE_THREAD_SELECTION = """
+resolveReviewThread(input:{threadId:$threadId}){
+  thread{
+    id
+    isResolved
+  }
+}
+"""
+RESOLVE_THREADS_BATCH_SIZE = 25
+
+# Concurrent gh invocations when resolving review threads individually (fallback
+# for failed batches); kept small to stay clear of GitHub's secondary rate limits
+# on mutations.
+ACK_MAX_WORKERS = 8
+
+# Full comment lists of recently seen review threads, keyed by thread ID and tagged
+# with the change signature from REVIEW_THREADS_QUERY (comment count + latest
+# comment updatedAt). Unchanged threads reuse their comments instead of being
+# re-fetched on every poll; threads with a truncated listing are never cached.
+# Bounded FIFO, guarded by a lock.
+_THREAD_COMMENTS_CACHE_MAX_SIZE = 500
+_thread_comments_cache: OrderedDict[str, tuple[tuple, list[dict]]] = OrderedDict()
+_THREAD_COMMENTS_CACHE_LOCK = threading.Lock()
+
+# Per-PR endCursor of the leading run of full review-thread pages in which every
+# thread was already resolved, with the number of polls that may still skip it.
+# reviewThreads has no orderBy and lists threads in creation order, so on
+# long-lived PRs the resolved history forms a prefix that later polls skip by
+# starting pagination after this cursor. A thread in that prefix can be unresolved
+# or gain comments again, so once the budget runs out the next poll rescans from
+# the start and rebuilds the prefix.
+RESOLVED_PREFIX_MAX_REUSES = 5
+_resolved_thread_prefix: dict[tuple[str, int], tuple[str, int]] = {}
+_RESOLVED_PREFIX_LOCK = threading.Lock()
+
+# Full details for individual review comments by node ID. The thread listing
+# already carries every first-page comment's author, so only bot-authored
+# comments are fetched here instead of every comment in every candidate thread.
+COMMENT_NODES_QUERY = """
+query($ids:[ID!]!){
+  nodes(ids:$ids){
+    ... on PullRequestReviewComment{
+      id
+      author{login}
+      body
+      url
+      commit{oid}
+      databaseId
     }
   }
 }
 """
+# GitHub caps nodes(ids:) at 100 IDs per request.
+COMMENT_NODES_BATCH_SIZE = 100
 
+# Threads per batched comment query; keeps each document's node budget well below
+# GitHub's limits while collapsing typical PRs into a single request.
+THREAD_COMMENTS_BATCH_SIZE = 25
+
+# Review threads with a short first page of comment authors. GitHub budgets the
+# listing at threads x comments nodes per page, and nearly every thread fits in
+# 20 comments; longer threads are paged through THREAD_COMMENTS_SELECTION.
 REVIEW_THREADS_QUERY = """
 query($owner:String!,$name:String!,$number:Int!,$cursor:String){
   repository(owner:$owner,name:$name){
@@ -47,12 +147,11 @@ query($owner:String!,$name:String!,$number:Int!,$cursor:String){
           id
           isResolved
           comments(first:20){
+            totalCount
             nodes{
+              id
               author{login}
-              body
-              url
-              commit{oid}
-              databaseId
+              updatedAt
             }
             pageInfo{
               hasNextPage
@@ -118,6 +217,236 @@ query($owner:String!,$name:String!,$number:Int!){
 }
 """
 
+RESOLVE_REVIEW_THREAD_MUTATION = """
+mutation($threadId:ID!){
+  resolveReviewThread(input:{threadId:$threadId}){
+    thread{
+      id
+      isResolved
+    }
+  }
+}
+"""
+
+ADD_REVIEW_THREAD_REPLY_MUTATION = """
+mutation($threadId:ID!,$body:String!){
+  addPullRequestReviewThreadReply(input:{pullRequestReviewThreadId:$threadId,body:$body}){
+    comment{
+      id
+    }
+  }
+}
+"""
+
+# (name field, state field) per statusCheckRollup context __typename.
+_STATUS_CONTEXT_FIELDS: dict[str | None, tuple[str, str]] = {
+    "CheckRun": ("name", "conclusion"),
+    "StatusContext": ("context", "state"),
+}
+_DEFAULT_STATUS_CONTEXT_FIELDS = ("name", "state")
+
+_GRAPHQL_WHITESPACE_RE = re.compile(r"\s+")
+_GRAPHQL_PUNCTUATOR_SPACE_RE = re.compile(r" ?([{}():,!$]) ?")
+
+
+def _minify_graphql(query: str) -> str:
+    """Collapse a GraphQL document onto one line without changing its meaning."""
+    collapsed = _GRAPHQL_WHITESPACE_RE.sub(" ", query).strip()
+    return _GRAPHQL_PUNCTUATOR_SPACE_RE.sub(r"\1", collapsed)
+
+
+@cache
+def _graphql_payload_prefix(query: str) -> str:
+    """Return the JSON-encoded ``{"query": ...,"variables":`` prefix for a query.
+
+    Query documents are module constants, so minifying and JSON-encoding them once
+    leaves only the variables to serialize per request.
+    """
+    return '{"query":' + json.dumps(_minify_graphql(query)) + ',"variables":'
+
+
+def _dumps_json(value: object) -> str:
+    """Serialize compact JSON, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _graphql_payload(query: str, variables: dict) -> str:
+    return _graphql_payload_prefix(query) + _dumps_json(variables) + "}"
+
+
+GITHUB_API_URL = "https://api.github.com"
+# Hosts served by GITHUB_API_URL. Any other host (GitHub Enterprise via GH_HOST or
+# an enterprise origin remote) keeps going through `gh api`, which resolves its
+# own API endpoints and credentials for that host.
+GITHUB_DOTCOM_HOSTS = frozenset({"github.com", "www.github.com", "ssh.github.com"})
+# Tokens the gh CLI itself honors, checked first. Without one, the token gh is
+# logged in with is borrowed via `gh auth token`; that call passes
+# log_stdout=False because run_cmd otherwise logs captured stdout at DEBUG level,
+# which would write the token to disk.
+GITHUB_TOKEN_ENV_VARS = ("GH_TOKEN", "GITHUB_TOKEN")
+# Short-lived memoization of identical gh_graphql requests within a poll cycle.
+# Keyed by the serialized request payload; bounded FIFO like the review loop's
+# warned-comment cache. AUTO_PRD_GQL_CACHE_TTL overrides the TTL (0 disables).
+GRAPHQL_CACHE_TTL_ENV = "AUTO_PRD_GQL_CACHE_TTL"
+DEFAULT_GRAPHQL_CACHE_TTL_SECONDS = 5.0
+_GRAPHQL_CACHE_MAX_SIZE = 128
+_graphql_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+_GRAPHQL_CACHE_LOCK = threading.Lock()
+
+_HTTP_CLIENT = None
+_HTTP_CLIENT_INITIALIZED = False
+_HTTP_CLIENT_LOCK = threading.Lock()
+
+
+def _gh_auth_token() -> str:
+    """Return the token the gh CLI is logged in with, or "" if unavailable.
+
+    gh has no long-lived request mode, so borrowing its credentials once is what
+    lets every later API call share one persistent HTTP connection instead of
+    spawning ``gh api`` per request. stdout is kept out of the command log.
+    """
+    try:
+        out, _, rc = run_cmd(
+            ["gh", "auth", "token", "--hostname", "github.com"],
+            check=False,
+            timeout=10,
+            log_stdout=False,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return ""
+    return out.strip() if rc == 0 else ""
+
+
+def _remote_host(url: str) -> str | None:
+    """Return the lowercased host of a git remote URL, or None for local paths."""
+    if "://" in url:
+        return (urlparse(url).hostname or "").lower() or None
+    if ":" in url and not url.startswith(("/", ".")):
+        # scp-like form: [user@]host:path
+        return url.split(":", 1)[0].rsplit("@", 1)[-1].lower() or None
+    return None
+
+
+def _github_host() -> str:
+    """Return the host gh would talk to: GH_HOST, else origin's host, else github.com."""
+    host = os.environ.get("GH_HOST", "").strip().lower()
+    if host:
+        return host
+    try:
+        out, _, rc = run_cmd(["git", "remote", "get-url", "origin"], check=False)
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return "github.com"
+    if rc != 0:
+        return "github.com"
+    return _remote_host(out.strip()) or "github.com"
+
+
+def _http_client():
+    """Return the shared GitHub API client, or None to use the gh CLI instead.
+
+    The client is created once per process when httpx is installed, the repository
+    lives on github.com, and a token is available in GITHUB_TOKEN_ENV_VARS or from
+    ``gh auth token``.
+    """
+    global _HTTP_CLIENT, _HTTP_CLIENT_INITIALIZED
+    with _HTTP_CLIENT_LOCK:
+        if _HTTP_CLIENT_INITIALIZED:
+            return _HTTP_CLIENT
+        _HTTP_CLIENT_INITIALIZED = True
+        if not HAS_HTTPX:
+            return None
+        host = _github_host()
+        if host not in GITHUB_DOTCOM_HOSTS:
+            logger.debug("GitHub host %s is not github.com; using gh CLI", host)
+            return None
+        token = ""
+        for env_var in GITHUB_TOKEN_ENV_VARS:
+            token = os.environ.get(env_var, "").strip()
+            if token:
+                break
+        if not token:
+            token = _gh_auth_token()
+        if not token:
+            logger.debug("No GitHub token available; using gh CLI for API calls")
+            return None
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "Content-Type": "application/json",
+        }
+        try:
+            client = httpx.Client(base_url=GITHUB_API_URL, headers=headers, http2=True)
+        except ImportError:
+            # HTTP/2 needs the optional h2 package; HTTP/1.1 keep-alive still avoids
+            # the per-call process spawn and TLS handshake.
+            client = httpx.Client(base_url=GITHUB_API_URL, headers=headers)
+        atexit.register(client.close)
+        _HTTP_CLIENT = client
+        return client
+
+
+def _rate_limit_hint_lines(headers) -> list[str]:
+    """Return the rate-limit headers worth carrying into HTTP error text.
+
+    call_with_backoff honors these hints. GitHub sends X-RateLimit-Reset on every
+    response, so it is only forwarded once the primary quota is exhausted;
+    otherwise a plain 403 (permissions, SSO) would wait for the window to reset
+    before surfacing.
+    """
+    lines = []
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        lines.append(f"Retry-After: {retry_after}")
+    reset = headers.get("X-RateLimit-Reset")
+    if reset and headers.get("X-RateLimit-Remaining") == "0":
+        lines.append(f"X-RateLimit-Reset: {reset}")
+    return lines
+
+
+def _github_api_request(
+    method: str, path: str, payload: str, *, timeout: float
+) -> bytes | None:
+    """Send a GitHub API request over the shared HTTP client.
+
+    Returns the response body, or None when no client is available and the caller
+    should fall back to ``gh api``. Failures raise CalledProcessError with gh-style
+    ``HTTP <status>`` stderr so existing error handling and call_with_backoff treat
+    both transports the same way.
+    """
+    client = _http_client()
+    if client is None:
+        return None
+    cmd = ["gh-http", method, path]
+    logger.info("GitHub API request: %s %s", method, path)
+    start_time = time.monotonic()
+    try:
+        response = client.request(
+            method, path, content=payload.encode("utf-8"), timeout=timeout
+        )
+    except httpx.HTTPError as exc:
+        raise subprocess.CalledProcessError(
+            1, cmd, output=b"", stderr=f"GitHub API request failed: {exc}"
+        ) from exc
+    duration = time.monotonic() - start_time
+    if response.status_code >= 400:
+        lines = [f"HTTP {response.status_code}: {response.reason_phrase}"]
+        lines.extend(_rate_limit_hint_lines(response.headers))
+        lines.append(response.text)
+        logger.warning(
+            "GitHub API %s %s failed with HTTP %s after %.2fs",
+            method,
+            path,
+            response.status_code,
+            duration,
+        )
+        raise subprocess.CalledProcessError(
+            1, cmd, output=response.content, stderr="\n".join(lines)
+        )
+    logger.info("GitHub API %s %s succeeded in %.2fs", method, path, duration)
+    return response.content
+
 
 def _parse_owner_repo(owner_repo: str) -> tuple[str, str]:
     stripped = (owner_repo or "").strip()
@@ -133,16 +462,88 @@ def _parse_owner_repo(owner_repo: str) -> tuple[str, str]:
     return owner, name
 
 
+def _graphql_cache_ttl() -> float:
+    """Return the gh_graphql memoization TTL in seconds (0 disables caching)."""
+    raw = os.getenv(GRAPHQL_CACHE_TTL_ENV)
+    if raw is None:
+        return DEFAULT_GRAPHQL_CACHE_TTL_SECONDS
+    try:
+        ttl = float(raw.strip())
+    except ValueError:
+        logger.warning(
+            "Invalid %s value %r; falling back to %s",
+            GRAPHQL_CACHE_TTL_ENV,
+            raw,
+            DEFAULT_GRAPHQL_CACHE_TTL_SECONDS,
+        )
+        return DEFAULT_GRAPHQL_CACHE_TTL_SECONDS
+    return max(0.0, ttl)
+
+
+def invalidate_graphql_cache() -> None:
+    """Drop all memoized gh_graphql results (call after GitHub mutations)."""
+    with _GRAPHQL_CACHE_LOCK:
+        _graphql_cache.clear()
+
+
 def gh_graphql(query: str, variables: dict) -> dict:
-    payload = json.dumps({"query": query, "variables": variables})
+    """Run a GraphQL query, memoizing identical requests for a short TTL.
+
+    Cached results are shared between callers and must be treated as read-only.
+    """
+    payload = _graphql_payload(query, variables)
+    ttl = _graphql_cache_ttl()
+    if ttl > 0:
+        with _GRAPHQL_CACHE_LOCK:
+            cached = _graphql_cache.get(payload)
+            if cached is not None:
+                expires_at, result = cached
+                if expires_at > time.monotonic():
+                    logger.debug("Reusing cached GraphQL response (ttl %.1fs)", ttl)
+                    return result
+                del _graphql_cache[payload]
 
     def action() -> dict:
-        out, _, _ = run_cmd(
-            ["gh", "api", "graphql", "--input", "-"], stdin=payload, timeout=60
-        )
-        return json.loads(out)
+        out = _github_api_request("POST", "/graphql", payload, timeout=60)
+        if out is None:
+            out, _, _ = run_cmd(
+                ["gh", "api", "graphql", "--input", "-"],
+                stdin=payload,
+                timeout=60,
+                binary=True,
+            )
+        # Both parsers accept bytes directly, skipping a separate UTF-8 decode pass.
+        return orjson.loads(out) if HAS_ORJSON else json.loads(out)
+
+    result = call_with_backoff(action)
+    if ttl > 0:
+        with _GRAPHQL_CACHE_LOCK:
+            _graphql_cache[payload] = (time.monotonic() + ttl, result)
+            if len(_graphql_cache) > _GRAPHQL_CACHE_MAX_SIZE:
+                _graphql_cache.popitem(last=False)
+    return result
 
-    return call_with_backoff(action)
+
+def _graphql_mutation(query: str, variables: dict) -> dict:
+    """Run a GraphQL mutation (never cached) and drop cached query results."""
+    payload = _graphql_payload(query, variables)
+
+    def action() -> bytes:
+        out = _github_api_request("POST", "/graphql", payload, timeout=30)
+        if out is None:
+            out, _, _ = run_cmd(
+                ["gh", "api", "graphql", "--input", "-"],
+                stdin=payload,
+                timeout=30,
+                binary=True,
+            )
+        return out
+
+    try:
+        out = call_with_backoff(action)
+    finally:
+        invalidate_graphql_cache()
+    return orjson.loads(out) if HAS_ORJSON else json.loads(out)
 
 
 def get_pr_number_for_head(head_branch: str, repo_root: Path) -> int | None:
@@ -172,16 +573,13 @@ def get_pr_number_for_head(head_branch: str, repo_root: Path) -> int | None:
 
 def branch_has_commits_since(base_branch: str, repo_root: Path) -> bool:
     """Return True when HEAD has commits newer than base_branch (compares base_branch..HEAD)."""
+    # Only truthiness matters: stop the walk at the first commit and skip decoding.
     out, _, _ = run_cmd(
-        ["git", "rev-list", "--count", f"{base_branch}..HEAD"], cwd=repo_root
+        ["git", "rev-list", "--max-count=1", f"{base_branch}..HEAD"],
+        cwd=repo_root,
+        binary=True,
     )
-    try:
-        return int(out.strip() or "0") > 0
-    except ValueError:
-        logger.warning(
-            "Could not parse commit count for %s..HEAD: %r", base_branch, out.strip()
-        )
-        return False
+    return bool(out.strip())
 
 
 def trigger_copilot(owner_repo: str, pr_number: int, repo_root: Path) -> None:
@@ -201,31 +599,172 @@ def trigger_copilot(owner_repo: str, pr_number: int, repo_root: Path) -> None:
         )
 
 
-def _gather_thread_comments(thread_id: str, initial_block: dict | None) -> list[dict]:
-    if not thread_id:
-        return []
-    comments_block = initial_block or {}
-    results = list(comments_block.get("nodes") or [])
-    page_info = comments_block.get("pageInfo") or {}
-    cursor = page_info.get("endCursor")
-    while page_info.get("hasNextPage"):
-        data = gh_graphql(
-            GATHER_THREAD_COMMENTS_QUERY, {"threadId": thread_id, "cursor": cursor}
+# Lower-cased once at import so per-comment checks are a single hash lookup.
+_REVIEW_BOT_LOGINS_LC = frozenset(login.lower() for login in REVIEW_BOT_LOGINS)
+
+
+def _is_review_bot_comment(comment: dict) -> bool:
+    login = ((comment.get("author") or {}).get("login") or "").strip()
+    return login.lower() in _REVIEW_BOT_LOGINS_LC
+
+
+def _thread_mentions_review_bot(comments_block: dict | None) -> bool:
+    """Return True when a thread's comment listing may contain review-bot comments.
+
+    REVIEW_THREADS_QUERY only fetches comment authors, so a thread is worth a full
+    comment fetch when a known review bot authored a first-page comment or when
+    further pages exist that have not been inspected yet.
+    """
+    block = comments_block or {}
+    if (block.get("pageInfo") or {}).get("hasNextPage"):
+        return True
+    return any(_is_review_bot_comment(node) for node in block.get("nodes") or [])
+
+
+def _fetch_comment_nodes(node_ids: list[str]) -> dict[str, dict]:
+    """Return full review comments keyed by node ID, COMMENT_NODES_BATCH_SIZE per request."""
+    comments: dict[str, dict] = {}
+    for start in range(0, len(node_ids), COMMENT_NODES_BATCH_SIZE):
+        batch = node_ids[start : start + COMMENT_NODES_BATCH_SIZE]
+        data = gh_graphql(COMMENT_NODES_QUERY, {"ids": batch})
+        for node in (data.get("data") or {}).get("nodes") or []:
+            if isinstance(node, dict) and node.get("id"):
+                comments[node["id"]] = node
+    return comments
+
+
+@cache
+def _thread_comments_batch_query(count: int) -> str:
+    """Return a query document fetching comments for ``count`` threads at once."""
+    params = ",".join(f"$threadId{i}:ID!,$cursor{i}:String" for i in range(count))
+    selections = "\n".join(
+        f"t{i}:"
+        + THREAD_COMMENTS_SELECTION.replace("$threadId", f"$threadId{i}").replace(
+            "$cursor", f"$cursor{i}"
         )
-        comments = ((data.get("data") or {}).get("node") or {}).get("comments") or {}
-        extra_nodes = comments.get("nodes") or []
-        results.extend(extra_nodes)
-        page_info = comments.get("pageInfo") or {}
-        cursor = page_info.get("endCursor")
+        for i in range(count)
+    )
+    return f"query({params}){{{selections}}}"
+
+
+def _gather_comments_for_threads(thread_ids: list[str]) -> dict[str, list[dict]]:
+    """Return every comment of each review thread, keyed by thread ID.
+
+    Up to THREAD_COMMENTS_BATCH_SIZE threads share one aliased GraphQL request;
+    threads with further comment pages are carried into the next request with
+    their cursors, so K threads cost about ceil(K / batch size) round-trips
+    instead of K.
+    """
+    results: dict[str, list[dict]] = {
+        thread_id: [] for thread_id in thread_ids if thread_id
+    }
+    pending: list[tuple[str, str | None]] = [(thread_id, None) for thread_id in results]
+    while pending:
+        batch = pending[:THREAD_COMMENTS_BATCH_SIZE]
+        pending = pending[THREAD_COMMENTS_BATCH_SIZE:]
+        variables: dict[str, str | None] = {}
+        for index, (thread_id, cursor) in enumerate(batch):
+            variables[f"threadId{index}"] = thread_id
+            variables[f"cursor{index}"] = cursor
+        data = gh_graphql(_thread_comments_batch_query(len(batch)), variables)
+        aliases = data.get("data") or {}
+        for index, (thread_id, _cursor) in enumerate(batch):
+            comments = (aliases.get(f"t{index}") or {}).get("comments") or {}
+            results[thread_id].extend(comments.get("nodes") or [])
+            page_info = comments.get("pageInfo") or {}
+            next_cursor = page_info.get("endCursor")
+            if page_info.get("hasNextPage") and next_cursor:
+                pending.append((thread_id, next_cursor))
     return results
 
 
+def _thread_signature(comments_block: dict | None) -> tuple | None:
+    """Return a value that changes whenever a thread gains or edits comments.
+
+    Returns None for threads whose listing is truncated: review threads carry no
+    updatedAt of their own, so edits past the first page of comments cannot be
+    detected without fetching them, and such threads are never served from cache.
+    """
+    block = comments_block or {}
+    if (block.get("pageInfo") or {}).get("hasNextPage"):
+        return None
+    nodes = block.get("nodes") or []
+    latest = max((node.get("updatedAt") or "" for node in nodes), default="")
+    return (block.get("totalCount"), len(nodes), latest)
+
+
+def _comments_for_threads(candidates: dict[str, dict]) -> dict[str, list[dict]]:
+    """Return review-bot comments for each candidate thread, fetching only changes.
+
+    ``candidates`` maps thread IDs to their REVIEW_THREADS_QUERY comment listing.
+    Threads whose listing is complete only need the bot-authored comments it
+    names, fetched by node ID; threads with more than one page fall back to the
+    full paginated comment query.
+    """
+    signatures = {
+        thread_id: _thread_signature(block) for thread_id, block in candidates.items()
+    }
+    cached: dict[str, list[dict]] = {}
+    with _THREAD_COMMENTS_CACHE_LOCK:
+        for thread_id, signature in signatures.items():
+            if signature is None:
+                continue
+            entry = _thread_comments_cache.get(thread_id)
+            if entry is not None and entry[0] == signature:
+                cached[thread_id] = entry[1]
+    if cached:
+        logger.debug(
+            "Reusing cached comments for %d unchanged review thread(s)", len(cached)
+        )
+    overflow: list[str] = []
+    bot_comment_ids: dict[str, list[str]] = {}
+    for thread_id, block in candidates.items():
+        if thread_id in cached:
+            continue
+        block = block or {}
+        if (block.get("pageInfo") or {}).get("hasNextPage"):
+            overflow.append(thread_id)
+            continue
+        bot_comment_ids[thread_id] = [
+            node["id"]
+            for node in block.get("nodes") or []
+            if node.get("id") and _is_review_bot_comment(node)
+        ]
+    fetched = _gather_comments_for_threads(overflow)
+    nodes_by_id = _fetch_comment_nodes(
+        [node_id for node_ids in bot_comment_ids.values() for node_id in node_ids]
+    )
+    for thread_id, node_ids in bot_comment_ids.items():
+        fetched[thread_id] = [
+            nodes_by_id[node_id] for node_id in node_ids if node_id in nodes_by_id
+        ]
+    with _THREAD_COMMENTS_CACHE_LOCK:
+        for thread_id, comments in fetched.items():
+            _thread_comments_cache.pop(thread_id, None)
+            if signatures[thread_id] is not None:
+                _thread_comments_cache[thread_id] = (signatures[thread_id], comments)
+        while len(_thread_comments_cache) > _THREAD_COMMENTS_CACHE_MAX_SIZE:
+            _thread_comments_cache.popitem(last=False)
+    return {
+        thread_id: cached[thread_id] if thread_id in cached else fetched[thread_id]
+        for thread_id in candidates
+    }
+
+
 def get_unresolved_feedback(
     owner_repo: str, pr_number: int, commit_sha: str | None = None
 ) -> list[dict]:
     owner, name = _parse_owner_repo(owner_repo)
+    prefix_key = (owner_repo, pr_number)
     threads: list[dict] = []
-    cursor: str | None = None
+    with _RESOLVED_PREFIX_LOCK:
+        entry = _resolved_thread_prefix.pop(prefix_key, None)
+        if entry is not None and entry[1] > 0:
+            cursor, reuses_left = entry[0], entry[1] - 1
+            _resolved_thread_prefix[prefix_key] = (cursor, reuses_left)
+        else:
+            cursor, reuses_left = None, RESOLVED_PREFIX_MAX_REUSES
+    extending_prefix = True
     while True:
         data = gh_graphql(
             REVIEW_THREADS_QUERY,
@@ -237,80 +776,139 @@ def get_unresolved_feedback(
         nodes = review_threads.get("nodes") or []
         threads.extend(nodes)
         page_info = review_threads.get("pageInfo") or {}
-        if not page_info.get("hasNextPage"):
+        has_next_page = page_info.get("hasNextPage")
+        end_cursor = page_info.get("endCursor")
+        if extending_prefix:
+            if (
+                has_next_page
+                and end_cursor
+                and nodes
+                and all(node.get("isResolved") is True for node in nodes)
+            ):
+                with _RESOLVED_PREFIX_LOCK:
+                    _resolved_thread_prefix[prefix_key] = (end_cursor, reuses_left)
+            else:
+                extending_prefix = False
+        if not has_next_page:
             break
-        cursor = page_info.get("endCursor")
+        cursor = end_cursor
 
-    unresolved: list[dict] = []
+    # The thread listing only carries comment authors to keep the response small
+    # (resolved threads dominate on mature PRs); fetch full comment bodies only
+    # for the review-bot comments of unresolved threads.
+    # Threads whose signature is unchanged since the last poll reuse cached comments.
+    candidates: dict[str, dict] = {}
     for thread in threads:
         if thread.get("isResolved") is True:
             continue
         thread_id = thread.get("id")
         if not thread_id:
             continue
-        comments = _gather_thread_comments(thread_id, thread.get("comments"))
+        comments_block = thread.get("comments")
+        if not _thread_mentions_review_bot(comments_block):
+            continue
+        candidates[thread_id] = comments_block
+
+    # Pagination overlaps can surface the same comment twice; one entry per
+    # databaseId avoids redundant downstream replies and thread mutations.
+    seen_comment_ids: set[int] = set()
+    rows: list[tuple[str, int, str, str, str]] = []
+    comments_by_thread = _comments_for_threads(candidates)
+    for thread_id, comments in comments_by_thread.items():
         for comment in comments:
             login = ((comment.get("author") or {}).get("login") or "").strip()
-            if login.lower() not in REVIEW_BOT_LOGINS:
+            if login.lower() not in _REVIEW_BOT_LOGINS_LC:
+                continue
+            db_id = comment.get("databaseId")
+            if db_id is None or db_id in seen_comment_ids:
                 continue
             body = (comment.get("body") or "").strip()
             if not body:
                 continue
-            url = comment.get("url") or ""
-            commit_info = comment.get("commit") or {}
-            comment_commit = (
-                commit_info.get("oid") if isinstance(commit_info, dict) else None
-            )
-            if commit_sha and comment_commit and comment_commit != commit_sha:
-                continue
-            db_id = comment.get("databaseId")
-            if db_id is not None:
-                unresolved.append(
-                    {
-                        "summary": f"- {login or 'unknown'}: {body}\n  {url}",
-                        "thread_id": thread_id,
-                        "comment_id": db_id,
-                        "author": login or "unknown",
-                        "url": url,
-                        "is_resolved": False,
-                    }
+            if commit_sha:
+                commit_info = comment.get("commit")
+                comment_commit = (
+                    commit_info.get("oid") if isinstance(commit_info, dict) else None
                 )
-    return unresolved
+                if comment_commit and comment_commit != commit_sha:
+                    continue
+            seen_comment_ids.add(db_id)
+            rows.append((thread_id, db_id, login, body, comment.get("url") or ""))
+    # The bullet text is built lazily by format_feedback_summary; CodeRabbit
+    # bodies can be many KB and most polls only need the IDs to filter
+    # already-processed comments.
+    return [
+        {
+            "body": body,
+            "thread_id": thread_id,
+            "comment_id": db_id,
+            "author": login,
+            "url": url,
+            "is_resolved": False,
+        }
+        for thread_id, db_id, login, body, url in rows
+    ]
+
+
+def format_feedback_summary(item: dict) -> str | None:
+    """Return the display line for an unresolved feedback item.
+
+    Items from get_unresolved_feedback carry the raw author/body/url; items that
+    already have a ``summary`` string are returned unchanged. Returns None when
+    the item has neither a string summary nor a string body.
+    """
+    if "summary" in item:
+        summary = item["summary"]
+        return summary if isinstance(summary, str) else None
+    body = item.get("body")
+    if not isinstance(body, str):
+        return None
+    return f"- {item.get('author') or 'unknown'}: {body}\n  {item.get('url') or ''}"
 
 
 def reply_to_review_comment(
-    owner: str, name: str, pr_number: int, comment_id: int, body: str
+    owner: str,
+    name: str,
+    pr_number: int,
+    comment_id: int,
+    body: str,
+    *,
+    thread_id: str | None = None,
 ) -> None:
-    payload = json.dumps({"body": body, "in_reply_to": comment_id})
+    """Reply to a review comment.
+
+    With ``thread_id`` the reply goes through the addPullRequestReviewThreadReply
+    mutation on the shared GraphQL transport; otherwise it falls back to the REST
+    ``in_reply_to`` endpoint keyed by ``comment_id``.
+    """
+    if thread_id:
+        _graphql_mutation(
+            ADD_REVIEW_THREAD_REPLY_MUTATION, {"threadId": thread_id, "body": body}
+        )
+        return
+    payload = _dumps_json({"body": body, "in_reply_to": comment_id})
+    path = f"/repos/{owner}/{name}/pulls/{pr_number}/comments"
 
     def action():
+        if _github_api_request("POST", path, payload, timeout=30) is not None:
+            return
         run_cmd(
-            [
-                "gh",
-                "api",
-                "-X",
-                "POST",
-                f"/repos/{owner}/{name}/pulls/{pr_number}/comments",
-                "--input",
-                "-",
-            ],
+            ["gh", "api", "-X", "POST", path, "--input", "-"],
             stdin=payload,
             capture=False,
             timeout=30,
         )
 
     call_with_backoff(action)
+    invalidate_graphql_cache()
 
 
 def resolve_review_thread(thread_id: str) -> None:
-    payload = json.dumps(
-        {
-            "query": "mutation($threadId:ID!){resolveReviewThread(input:{threadId:$threadId}){thread{id isResolved}}}",
-            "variables": {"threadId": thread_id},
-        }
-    )
+    payload = _graphql_payload(RESOLVE_REVIEW_THREAD_MUTATION, {"threadId": thread_id})
 
     def action():
+        if _github_api_request("POST", "/graphql", payload, timeout=30) is not None:
+            return
         run_cmd(
             ["gh", "api", "graphql", "--input", "-"],
             stdin=payload,
@@ -319,6 +917,63 @@ def resolve_review_thread(thread_id: str) -> None:
         )
 
     call_with_backoff(action)
+    invalidate_graphql_cache()
+
+
+@cache
+def _resolve_threads_batch_mutation(count: int) -> str:
+    """Return a mutation document resolving ``count`` threads at once."""
+    params = ",".join(f"$threadId{i}:ID!" for i in range(count))
+    selections = "\n".join(
+        f"m{i}:" + RESOLVE_THREAD_SELECTION.replace("$threadId", f"$threadId{i}")
+        for i in range(count)
+    )
+    return f"mutation({params}){{{selections}}}"
+
+
+def _resolve_review_threads_batched(thread_ids: list[str]) -> list[str]:
+    """Resolve threads RESOLVE_THREADS_BATCH_SIZE at a time in aliased mutations.
+
+    Returns the IDs that were not confirmed resolved (failed batch or a null
+    alias), for the caller to retry one by one.
+    """
+    unresolved: list[str] = []
+    for start in range(0, len(thread_ids), RESOLVE_THREADS_BATCH_SIZE):
+        batch = thread_ids[start : start + RESOLVE_THREADS_BATCH_SIZE]
+        variables = {f"threadId{index}": tid for index, tid in enumerate(batch)}
+        try:
+            response = _graphql_mutation(
+                _resolve_threads_batch_mutation(len(batch)), variables
+            )
+        except (subprocess.CalledProcessError, OSError, ValueError) as exc:
+            detail = (
+                extract_called_process_error_details(exc)
+                if isinstance(exc, subprocess.CalledProcessError)
+                else str(exc)
+            )
+            logger.debug("Batched thread resolution failed: %s", detail)
+            unresolved.extend(batch)
+            continue
+        data = response.get("data") or {}
+        unresolved.extend(
+            thread_id
+            for index, thread_id in enumerate(batch)
+            if not ((data.get(f"m{index}") or {}).get("thread") or {}).get("isResolved")
+        )
+    return unresolved
+
+
+def _resolve_review_thread_logged(thread_id: str) -> None:
+    """Resolve a review thread, logging (not raising) expected gh/API failures."""
+    try:
+        resolve_review_thread(thread_id)
+    except (subprocess.CalledProcessError, OSError, ValueError) as exc:
+        detail = (
+            extract_called_process_error_details(exc)
+            if isinstance(exc, subprocess.CalledProcessError)
+            else str(exc)
+        )
+        logger.warning("Failed to resolve review thread %s: %s", thread_id, detail)
 
 
 def acknowledge_review_items(
@@ -332,25 +987,34 @@ def acknowledge_review_items(
     Tests can pass a pre-seeded ``processed_ids`` instance to maintain
     deterministic behaviour without relying on package-level globals. The same
     set instance is returned for chaining convenience.
+
+    Threads are resolved in aliased batch mutations; any the batch could not
+    confirm are retried individually and concurrently on up to ACK_MAX_WORKERS
+    threads. ``processed_ids`` is only updated from the calling thread.
     """
-    owner, name = _parse_owner_repo(owner_repo)
+    _parse_owner_repo(owner_repo)
+    # Several items usually share a thread; resolve each thread only once.
+    thread_ids: dict[str, None] = {}
     for item in items:
         comment_id = item.get("comment_id")
         thread_id = item.get("thread_id")
         if isinstance(comment_id, int):
             processed_ids.add(comment_id)
         if thread_id and not item.get("is_resolved"):
-            try:
-                resolve_review_thread(thread_id)
-            except (subprocess.CalledProcessError, OSError, ValueError) as exc:
-                detail = (
-                    extract_called_process_error_details(exc)
-                    if isinstance(exc, subprocess.CalledProcessError)
-                    else str(exc)
-                )
-                logger.warning(
-                    "Failed to resolve review thread %s: %s", thread_id, detail
-                )
+            thread_ids[thread_id] = None
+    if not thread_ids:
+        return processed_ids
+    retry_ids = _resolve_review_threads_batched(list(thread_ids))
+    if len(retry_ids) <= 1:
+        for thread_id in retry_ids:
+            _resolve_review_thread_logged(thread_id)
+        return processed_ids
+    with ThreadPoolExecutor(
+        max_workers=min(ACK_MAX_WORKERS, len(retry_ids)),
+        thread_name_prefix="ack-review",
+    ) as pool:
+        # Consume the iterator so unexpected exceptions propagate to the caller.
+        list(pool.map(_resolve_review_thread_logged, retry_ids))
     return processed_ids
 
 
@@ -361,6 +1025,9 @@ def _parse_iso8601(value: str | None) -> datetime | None:
     if not text:
         return None
     try:
+        if HAS_CISO8601:
+            # ciso8601 understands the trailing "Z" natively, so no rewrite is needed.
+            return _ciso_parse_datetime(text)
         if text.endswith("Z"):
             text = text[:-1] + "+00:00"
         return datetime.fromisoformat(text)
@@ -407,17 +1074,17 @@ def _collect_commit_status_contexts(owner_repo: str, commit_sha: str) -> list[di
     for raw in contexts:
         if not isinstance(raw, dict):
             continue
-        entry = {"__typename": raw.get("__typename")}
-        if entry["__typename"] == "CheckRun":
-            entry["name"] = raw.get("name")
-            entry["state"] = raw.get("conclusion")
-        elif entry["__typename"] == "StatusContext":
-            entry["name"] = raw.get("context")
-            entry["state"] = raw.get("state")
-        else:
-            entry["name"] = raw.get("name")
-            entry["state"] = raw.get("state")
-        results.append(entry)
+        typename = raw.get("__typename")
+        name_key, state_key = _STATUS_CONTEXT_FIELDS.get(
+            typename, _DEFAULT_STATUS_CONTEXT_FIELDS
+        )
+        results.append(
+            {
+                "__typename": typename,
+                "name": raw.get(name_key),
+                "state": raw.get(state_key),
+            }
+        )
     return results
 
 
@@ -511,12 +1178,20 @@ def post_final_comment(
     prd_path: Path,
     repo_root: Path,
     dry_run: bool = False,
-) -> None:
+    async_mode: bool = False,
+) -> threading.Thread | None:
+    """Post the closing summary comment on the PR.
+
+    The comment is informational and failures only warn, so with ``async_mode``
+    the POST runs on a started non-daemon thread that is returned for the caller
+    to ``join`` (with a timeout) before exiting; otherwise it posts inline and
+    returns None.
+    """
     if pr_number is None:
-        return
+        return None
     if dry_run:
         logger.info("Dry run enabled; skipping final PR comment for #%s.", pr_number)
-        return
+        return None
 
     final_msg = (
         "✅ **All requested changes addressed.**\n\n"
@@ -526,27 +1201,30 @@ def post_final_comment(
         "- Ensured `make ci` is green; added/updated pipeline as needed.\n\n"
         "Thanks for the review, @CodeRabbitAI and @copilot-pull-request-reviewer[bot]! 🙏"
     )
-    payload = json.dumps({"body": final_msg})
-    try:
-        run_cmd(
-            [
-                "gh",
-                "api",
-                "-X",
-                "POST",
-                f"/repos/{owner_repo}/issues/{pr_number}/comments",
-                "--input",
-                "-",
-            ],
-            cwd=repo_root,
-            stdin=payload,
-            capture=False,
-            timeout=60,
-        )
-        print(f"Posted final comment on PR #{pr_number}. Done.")
-    except subprocess.CalledProcessError as exc:
-        logger.warning(
-            "Failed to post final PR comment for #%s: %s",
-            pr_number,
-            extract_called_process_error_details(exc),
-        )
+    payload = _dumps_json({"body": final_msg})
+    path = f"/repos/{owner_repo}/issues/{pr_number}/comments"
+
+    def post() -> None:
+        try:
+            if _github_api_request("POST", path, payload, timeout=60) is None:
+                run_cmd(
+                    ["gh", "api", "-X", "POST", path, "--input", "-"],
+                    cwd=repo_root,
+                    stdin=payload,
+                    capture=False,
+                    timeout=60,
+                )
+            print(f"Posted final comment on PR #{pr_number}. Done.")
+        except subprocess.CalledProcessError as exc:
+            logger.warning(
+                "Failed to post final PR comment for #%s: %s",
+                pr_number,
+                extract_called_process_error_details(exc),
+            )
+
+    if not async_mode:
+        post()
+        return None
+    thread = threading.Thread(target=post, name="final-pr-comment", daemon=False)
+    thread.start()
+    return thread
@@ -3,16 +3,32 @@
 from __future__ import annotations
 
 import os
+import re
+import shutil
 import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import TypeVar
 from urllib.parse import urlparse
 
-from .command import run_cmd
+from .command import popen_streaming, run_cmd
 from .constants import SAFE_ENV_VAR
 from .logging_utils import logger
 
 PARSE_OWNER_REPO_ERROR = "Cannot parse owner/repo from: {}"
 
+# Fast path for the regular two-segment remote forms (git@host[:port]:owner/repo,
+# scheme://[user@]host[:port]/owner/repo, optional .git or trailing slash). Anything
+# else falls through to the general parser in _owner_repo_for.
+_REMOTE_OWNER_REPO_RE = re.compile(
+    r"^(?:git@.*:/?|[A-Za-z][A-Za-z0-9+.-]*://[^/]+/)"
+    r"(?P<owner>[^/?#:]+)/(?P<repo>[^/?#]+?)(?:\.git|/)?$"
+)
+
 # Transient network/git errors that are typically recoverable via retry
 GIT_TRANSIENT_ERRORS = [
     "Connection reset by peer",
@@ -28,20 +44,103 @@ GIT_TRANSIENT_ERRORS = [
     "early EOF",
     "pack-objects died",
 ]
+# Single-pass matcher over GIT_TRANSIENT_ERRORS used as run_cmd's retry predicate;
+# the list stays around for readability and logging.
+GIT_TRANSIENT_RE = re.compile("|".join(re.escape(err) for err in GIT_TRANSIENT_ERRORS))
 
 # Exit codes that indicate transient failures (128 = git fatal error, often network-related)
 GIT_RETRY_EXIT_CODES = {128}
 
+# Marker recording that the gh alias exists; it is trusted while newer than both
+# the gh binary and gh's config.yml (where aliases live) so routine runs skip
+# the `gh alias list` round-trip.
+GH_ALIAS_MARKER_NAME = "gh_alias_ok"
+# Matches the alias's own line in `gh alias list` output in a single scan.
+_GH_ALIAS_LINE_RE = re.compile(r"^[ \t]*save-me-copilot[ \t]*:", re.MULTILINE)
+
+# `git status` output is reused for this long, so back-to-back status checks in
+# one phase share a single worktree scan. Writers below call _invalidate_status.
+STATUS_CACHE_TTL_SECONDS = 0.5
+_status_cache: dict[Path, tuple[float, bytes]] = {}
+_STATUS_CACHE_LOCK = threading.Lock()
+
+
+def _cache_marker_path(name: str) -> Path:
+    """Return ``~/.cache/aprd/<name>``, honouring XDG_CACHE_HOME."""
+    xdg_cache = os.getenv("XDG_CACHE_HOME", None)
+    if xdg_cache and xdg_cache.strip():
+        base_cache = Path(xdg_cache).expanduser()
+    else:
+        base_cache = Path.home() / ".cache"
+    return base_cache / "aprd" / name
+
+
+def _gh_config_file() -> Path:
+    """Return gh's config.yml, honouring GH_CONFIG_DIR and XDG_CONFIG_HOME."""
+    gh_config_dir = os.getenv("GH_CONFIG_DIR", "").strip()
+    if gh_config_dir:
+        return Path(gh_config_dir).expanduser() / "config.yml"
+    xdg_config = os.getenv("XDG_CONFIG_HOME", "").strip()
+    base_config = (
+        Path(xdg_config).expanduser() if xdg_config else Path.home() / ".config"
+    )
+    return base_config / "gh" / "config.yml"
+
+
+def _touch_marker(marker: Path) -> None:
+    try:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+    except OSError as exc:
+        logger.debug("Could not write cache marker %s: %s", marker, exc)
+
 
 def git_root() -> Path:
+    # Keyed by the working directory: the result is fixed for a given cwd, but
+    # callers may chdir between lookups.
+    return _git_root_for(os.getcwd())
+
+
+@lru_cache(maxsize=16)
+def _git_root_for(_cwd: str) -> Path:
     out, _, _ = run_cmd(["git", "rev-parse", "--show-toplevel"])
     return Path(out.strip())
 
 
 def parse_owner_repo_from_git() -> str:
-    """Return the owner/repo identifier for origin, handling SSH URLs with ports."""
+    """Return the owner/repo identifier for origin, handling SSH URLs with ports.
+
+    Memoized per working directory and keyed on the mtime of ``.git/config``,
+    so ``git remote set-url`` (which rewrites that file) invalidates the entry.
+    """
+    cwd = os.getcwd()
+    return _owner_repo_for(cwd, _git_config_mtime(cwd))
+
+
+def _git_config_mtime(cwd: str) -> int | None:
+    """Return the mtime of the enclosing repository's .git/config, if any.
+
+    Walks up from ``cwd`` without spawning git; worktrees (where ``.git`` is a
+    file) and non-repositories yield None.
+    """
+    start = Path(cwd)
+    for directory in (start, *start.parents):
+        dot_git = directory / ".git"
+        try:
+            return (dot_git / "config").stat().st_mtime_ns
+        except OSError:
+            if dot_git.exists():
+                return None
+    return None
+
+
+@lru_cache(maxsize=16)
+def _owner_repo_for(_cwd: str, _config_mtime: int | None) -> str:
     out, _, _ = run_cmd(["git", "remote", "get-url", "origin"])
     url = out.strip()
+    match = _REMOTE_OWNER_REPO_RE.match(url)
+    if match:
+        return f"{match['owner']}/{match['repo']}"
     if url.startswith("git@"):
         # Drop everything before the last colon so we support git@host:repo, git@host:port:repo,
         # and git@[ipv6-host]:repo forms without needing to special-case bracketed addresses.
@@ -70,39 +169,165 @@ def parse_owner_repo_from_git() -> str:
 
 
 def ensure_gh_alias() -> None:
+    gh_path = shutil.which("gh")
+    if gh_path is None:
+        logger.debug("gh CLI not available; skipping alias setup")
+        return
+    marker = _cache_marker_path(GH_ALIAS_MARKER_NAME)
+    try:
+        marker_mtime = marker.stat().st_mtime
+        if marker_mtime > Path(gh_path).stat().st_mtime:
+            try:
+                config_mtime = _gh_config_file().stat().st_mtime
+            except FileNotFoundError:
+                config_mtime = 0.0
+            if marker_mtime > config_mtime:
+                return
+    except OSError:
+        pass
     try:
         out, _, _ = run_cmd(["gh", "alias", "list"])
     except FileNotFoundError:
         logger.debug("gh CLI not available; skipping alias setup")
         return
-    if not any(
-        line.split(":")[0].strip() == "save-me-copilot"
-        for line in out.splitlines()
-        if ":" in line
-    ):
-        alias_command = 'api --method POST /repos/$1/pulls/$2/requested_reviewers -f "reviewers[]=copilot-pull-request-reviewer[bot]"'
-        try:
-            run_cmd(
-                [
-                    "gh",
-                    "alias",
-                    "set",
-                    "save-me-copilot",
-                    alias_command,
-                ]
-            )
-        except FileNotFoundError:
-            logger.debug("gh CLI not available during alias creation; skipping")
+    if _GH_ALIAS_LINE_RE.search(out):
+        _touch_marker(marker)
+        return
+    alias_command = 'api --method POST /repos/$1/pulls/$2/requested_reviewers -f "reviewers[]=copilot-pull-request-reviewer[bot]"'
+    try:
+        run_cmd(
+            [
+                "gh",
+                "alias",
+                "set",
+                "save-me-copilot",
+                alias_command,
+            ]
+        )
+    except FileNotFoundError:
+        logger.debug("gh CLI not available during alias creation; skipping")
+        return
+    _touch_marker(marker)
+
+
+def ensure_commit_graph(repo_root: Path) -> None:
+    """Write a commit-graph once so rev-list walks stay cheap on large histories.
+
+    git's own commit-graph file doubles as the "already done" marker; worktrees
+    (where ``.git`` is a file) and failures are skipped silently.
+    """
+    objects_info = repo_root / ".git" / "objects" / "info"
+    if not objects_info.is_dir():
+        return
+    if (objects_info / "commit-graph").exists() or (
+        objects_info / "commit-graphs"
+    ).exists():
+        return
+    try:
+        _, _, rc = run_cmd(
+            ["git", "commit-graph", "write", "--reachable", "--changed-paths"],
+            cwd=repo_root,
+            check=False,
+            discard_stdout=True,
+            timeout=120,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired) as exc:
+        logger.debug("Skipping commit-graph write: %s", exc)
+        return
+    if rc != 0:
+        logger.debug("git commit-graph write exited with %s; continuing", rc)
+
+
+def _cached_status(repo_root: Path) -> bytes:
+    """Return raw NUL-terminated ``git status`` output, reused for a short TTL."""
+    now = time.monotonic()
+    with _STATUS_CACHE_LOCK:
+        cached = _status_cache.get(repo_root)
+    if cached is not None and now - cached[0] < STATUS_CACHE_TTL_SECONDS:
+        return cached[1]
+    # --no-renames keeps every record a single "XY path" field.
+    out, _, _ = run_cmd(
+        [
+            "git",
+            "status",
+            "--porcelain",
+            "-z",
+            "--no-renames",
+            "--untracked-files=normal",
+        ],
+        cwd=repo_root,
+        binary=True,
+    )
+    with _STATUS_CACHE_LOCK:
+        _status_cache[repo_root] = (now, out)
+    return out
+
+
+def _invalidate_status(repo_root: Path) -> None:
+    with _STATUS_CACHE_LOCK:
+        _status_cache.pop(repo_root, None)
 
 
 def workspace_has_changes(repo_root: Path) -> bool:
-    out, _, _ = run_cmd(["git", "status", "--porcelain"], cwd=repo_root)
-    return bool(out.strip())
+    # Truthiness only: raw bytes, no per-entry decode or sort.
+    return bool(_cached_status(repo_root).strip())
+
+
+def git_status_snapshot(repo_root: Path) -> frozenset[str]:
+    # NUL-terminated records split in one pass on the raw bytes. Callers compare
+    # snapshots for equality, so an unordered set avoids sorting every entry;
+    # sort at display time instead.
+    return frozenset(
+        entry.decode("utf-8", errors="replace")
+        for entry in _cached_status(repo_root).split(b"\0")
+        if entry
+    )
+
 
+# Leading space-separated fields before the path in porcelain v2 records, keyed
+# by record type ("2" rename records cannot occur with --no-renames).
+_PORCELAIN_V2_PATH_FIELD = {b"1": 8, b"u": 10}
 
-def git_status_snapshot(repo_root: Path) -> tuple[str, ...]:
-    out, _, _ = run_cmd(["git", "status", "--porcelain"], cwd=repo_root)
-    return tuple(sorted(out.splitlines()))
+
+def git_status_and_head(repo_root: Path) -> tuple[frozenset[str], str]:
+    """Return the status snapshot and HEAD sha from a single ``git status`` run.
+
+    Entries use the same ``"XY path"`` form as :func:`git_status_snapshot`; the
+    sha comes from the ``# branch.oid`` header and is empty on an unborn branch.
+    """
+    out, _, _ = run_cmd(
+        [
+            "git",
+            "status",
+            "--porcelain=v2",
+            "--branch",
+            "-z",
+            "--no-renames",
+            "--untracked-files=normal",
+        ],
+        cwd=repo_root,
+        binary=True,
+    )
+    head = ""
+    entries = []
+    for record in out.split(b"\0"):
+        if not record:
+            continue
+        kind = record[:1]
+        if kind == b"#":
+            if record.startswith(b"# branch.oid "):
+                oid = record[len(b"# branch.oid ") :].decode("ascii", errors="replace")
+                head = "" if oid == "(initial)" else oid
+            continue
+        path_field = _PORCELAIN_V2_PATH_FIELD.get(kind)
+        if path_field is None:
+            # "? path" / "! path" map to the v1 "?? path" / "!! path" form.
+            entry = kind + kind + record[1:]
+        else:
+            fields = record.split(b" ", path_field)
+            entry = fields[1].replace(b".", b" ") + b" " + fields[path_field]
+        entries.append(entry.decode("utf-8", errors="replace"))
+    return frozenset(entries), head
 
 
 def git_current_branch(repo_root: Path) -> str:
@@ -111,24 +336,266 @@ def git_current_branch(repo_root: Path) -> str:
 
 
 def git_head_sha(repo_root: Path) -> str:
+    coprocess = _coprocesses.get(repo_root)
+    if coprocess is not None:
+        try:
+            sha = coprocess.resolve("HEAD")
+        except (OSError, RuntimeError, ValueError) as exc:
+            logger.debug("git cat-file coprocess unavailable: %s", exc)
+        else:
+            if sha:
+                return sha
     out, _, _ = run_cmd(["git", "rev-parse", "HEAD"], cwd=repo_root)
     return out.strip()
 
 
+class GitCoprocess:
+    """Long-lived ``git cat-file --batch-check`` used to resolve revisions.
+
+    One git startup is amortized over every lookup instead of paying a
+    fork/exec per rev-parse. Refs are re-read by git on each query, so commits
+    made by agents between lookups are observed.
+    """
+
+    _OBJECT_TYPES = frozenset({"commit", "tree", "blob", "tag"})
+
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = repo_root
+        self._proc: subprocess.Popen[str] | None = None
+        self._lock = threading.Lock()
+
+    def resolve(self, rev: str) -> str | None:
+        """Return the object name for ``rev``, or None if it does not resolve.
+
+        Raises:
+            ValueError: If ``rev`` spans more than one line.
+            OSError: If the coprocess cannot be started or has exited.
+        """
+        if not rev or "\n" in rev:
+            raise ValueError(f"Invalid revision for cat-file: {rev!r}")
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._proc, _ = popen_streaming(
+                    ["git", "cat-file", "--batch-check"], cwd=self.repo_root
+                )
+            proc = self._proc
+            assert proc.stdin is not None and proc.stdout is not None
+            try:
+                proc.stdin.write(rev + "\n")
+                proc.stdin.flush()
+                line = proc.stdout.readline()
+            except (BrokenPipeError, ValueError) as exc:
+                raise OSError(f"git cat-file coprocess failed: {exc}") from exc
+        if not line:
+            raise OSError("git cat-file coprocess exited")
+        fields = line.split()
+        if len(fields) >= 2 and fields[1] in self._OBJECT_TYPES:
+            return fields[0]
+        return None
+
+    def close(self) -> None:
+        with self._lock:
+            proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        if proc.stdin is not None:
+            proc.stdin.close()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        for stream in (proc.stdout, proc.stderr):
+            if stream is not None:
+                stream.close()
+
+
+_coprocesses: dict[Path, GitCoprocess] = {}
+
+
+def open_git_coprocess(repo_root: Path) -> GitCoprocess:
+    """Route revision lookups for ``repo_root`` through a shared coprocess.
+
+    The orchestrator owns the lifecycle and must call close_git_coprocesses()
+    on exit; until a coprocess is opened, helpers spawn git per call.
+    """
+    coprocess = _coprocesses.get(repo_root)
+    if coprocess is None:
+        coprocess = _coprocesses[repo_root] = GitCoprocess(repo_root)
+    return coprocess
+
+
+def close_git_coprocesses() -> None:
+    while _coprocesses:
+        _, coprocess = _coprocesses.popitem()
+        coprocess.close()
+
+
+@dataclass(frozen=True)
+class RevParseInfo:
+    """Repository root, HEAD commit and branch read by one git rev-parse.
+
+    Attributes:
+        toplevel: Absolute path of the working tree root.
+        head_sha: Full SHA of HEAD.
+        branch: Abbreviated branch name, or "HEAD" when detached.
+    """
+
+    toplevel: Path
+    head_sha: str
+    branch: str
+
+
+def git_rev_parse_bundle(repo_root: Path) -> RevParseInfo:
+    """Read toplevel, HEAD SHA and current branch with a single git process.
+
+    Not cached: HEAD moves whenever an agent commits, so callers that need
+    a fresh value must always pay for the spawn.
+    """
+    out, _, _ = run_cmd(
+        ["git", "rev-parse", "--show-toplevel", "HEAD", "--abbrev-ref", "HEAD"],
+        cwd=repo_root,
+    )
+    lines = out.splitlines()
+    if len(lines) < 3:
+        raise ValueError(f"Unexpected git rev-parse output: {out!r}")
+    return RevParseInfo(
+        toplevel=Path(lines[0].strip()),
+        head_sha=lines[1].strip(),
+        branch=lines[2].strip(),
+    )
+
+
+@lru_cache(maxsize=16)
+def _branch_ref_set(repo_root: Path) -> frozenset[str]:
+    """Return every local and origin branch ref, loaded with one git call."""
+    out, _, rc = run_cmd(
+        [
+            "git",
+            "for-each-ref",
+            "--format=%(refname)",
+            "refs/heads",
+            "refs/remotes/origin",
+        ],
+        cwd=repo_root,
+        check=False,
+    )
+    if rc != 0:
+        return frozenset()
+    return frozenset(out.split())
+
+
+@lru_cache(maxsize=16)
+def _packed_refs(packed_refs_path: Path, _mtime_ns: int) -> frozenset[str]:
+    """Return the ref names listed in packed-refs; keyed on its mtime."""
+    refs = set()
+    with packed_refs_path.open("rb") as handle:
+        for line in handle:
+            if line[:1] in (b"#", b"^"):
+                continue
+            _, _, name = line.rstrip(b"\n").partition(b" ")
+            if name:
+                refs.add(name.decode("utf-8", errors="replace"))
+    return frozenset(refs)
+
+
+def _branch_exists_fast(repo_root: Path, branch: str) -> bool | None:
+    """Answer git_branch_exists from the ref files, or None if that's unsafe.
+
+    Loose refs are a single stat each and packed-refs is parsed once per
+    modification. Worktrees (``.git`` file), reftable repositories and odd
+    names that could escape the refs directory defer to git.
+    """
+    git_dir = repo_root / ".git"
+    if ".." in branch or branch.startswith("/") or "\\" in branch:
+        return None
+    if not git_dir.is_dir() or (git_dir / "reftable").exists():
+        return None
+    candidates = (f"refs/heads/{branch}", f"refs/remotes/origin/{branch}")
+    if any((git_dir / ref).is_file() for ref in candidates):
+        return True
+    packed_refs_path = git_dir / "packed-refs"
+    try:
+        mtime_ns = packed_refs_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+    except OSError:
+        return None
+    packed = _packed_refs(packed_refs_path, mtime_ns)
+    return any(ref in packed for ref in candidates)
+
+
+def invalidate_branch_refs() -> None:
+    """Forget the cached branch listing after creating, fetching or pulling refs.
+
+    Callers that create branches with raw ``git`` commands must call this so
+    git_branch_exists sees the new refs.
+    """
+    _branch_ref_set.cache_clear()
+
+
 def git_branch_exists(repo_root: Path, branch: str) -> bool:
     if not branch or not branch.strip():
         return False
-    refs = [f"refs/heads/{branch}", f"refs/remotes/origin/{branch}"]
-    for ref in refs:
-        _, _, rc = run_cmd(
-            ["git", "show-ref", "--verify", "--quiet", ref], cwd=repo_root, check=False
-        )
-        if rc == 0:
-            return True
-    return False
+    exists = _branch_exists_fast(repo_root, branch)
+    if exists is not None:
+        return exists
+    refs = _branch_ref_set(repo_root)
+    return f"refs/heads/{branch}" in refs or f"refs/remotes/origin/{branch}" in refs
+
 
+# The default branch is also persisted under .git so cold runs skip both
+# lookups; the entry expires after a day or once a fetch or remote change
+# (FETCH_HEAD / config mtime) postdates it.
+DEFAULT_BRANCH_CACHE_NAME = "autodev_default_branch.txt"
+DEFAULT_BRANCH_CACHE_MAX_AGE_SECONDS = 24 * 60 * 60
 
+
+def _read_default_branch_cache(git_dir: Path) -> str | None:
+    cache_path = git_dir / DEFAULT_BRANCH_CACHE_NAME
+    try:
+        cached_at = cache_path.stat().st_mtime
+    except OSError:
+        return None
+    if time.time() - cached_at > DEFAULT_BRANCH_CACHE_MAX_AGE_SECONDS:
+        return None
+    for newer_source in ("FETCH_HEAD", "config"):
+        try:
+            if (git_dir / newer_source).stat().st_mtime > cached_at:
+                return None
+        except OSError:
+            continue
+    try:
+        return cache_path.read_text(encoding="utf-8").strip() or None
+    except OSError:
+        return None
+
+
+def _write_default_branch_cache(git_dir: Path, name: str) -> None:
+    cache_path = git_dir / DEFAULT_BRANCH_CACHE_NAME
+    tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+    try:
+        tmp_path.write_text(name + "\n", encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        logger.debug("Could not persist default branch cache: %s", exc)
+
+
+@lru_cache(maxsize=16)
 def git_default_branch(repo_root: Path) -> str | None:
+    git_dir = repo_root / ".git"
+    if not git_dir.is_dir():
+        return _lookup_default_branch(repo_root)
+    cached = _read_default_branch_cache(git_dir)
+    if cached:
+        return cached
+    name = _lookup_default_branch(repo_root)
+    if name:
+        _write_default_branch_cache(git_dir, name)
+    return name
+
+
+def _lookup_default_branch(repo_root: Path) -> str | None:
     out, _, rc = run_cmd(
         ["git", "symbolic-ref", "--quiet", "refs/remotes/origin/HEAD"],
         cwd=repo_root,
@@ -148,9 +615,67 @@ def git_default_branch(repo_root: Path) -> str | None:
     return None
 
 
+_T = TypeVar("_T")
+
+# One worker per independent startup lookup.
+PREFLIGHT_MAX_WORKERS = 5
+
+
+@dataclass(frozen=True)
+class PreflightInfo:
+    """Repository facts gathered concurrently at startup by preflight().
+
+    Attributes:
+        owner_repo: origin's owner/repo, or None if not requested or unresolved.
+        default_branch: Remote default branch, or None if it cannot be determined.
+        current_branch: Branch checked out when preflight ran, or None on failure.
+    """
+
+    owner_repo: str | None
+    default_branch: str | None
+    current_branch: str | None
+
+
+def _preflight_result(future: Future[_T] | None, name: str) -> _T | None:
+    if future is None:
+        return None
+    try:
+        return future.result()
+    except (subprocess.CalledProcessError, OSError, RuntimeError, ValueError) as exc:
+        logger.debug("Preflight %s lookup failed: %s", name, exc)
+        return None
+
+
+def preflight(repo_root: Path, *, need_owner_repo: bool = True) -> PreflightInfo:
+    """Run the independent startup git/gh lookups concurrently.
+
+    Each lookup is its own process spawn, so startup waits for the slowest one
+    instead of their sum. The memoized lookups (owner/repo, default branch)
+    stay cached for later callers. Failures are logged and reported
+    as None; callers that need a value can repeat the lookup to surface the
+    original error.
+    """
+    with ThreadPoolExecutor(
+        max_workers=PREFLIGHT_MAX_WORKERS, thread_name_prefix="preflight"
+    ) as pool:
+        setup_futures = {
+            "gh alias": pool.submit(ensure_gh_alias),
+            "commit-graph": pool.submit(ensure_commit_graph, repo_root),
+        }
+        owner_repo = pool.submit(parse_owner_repo_from_git) if need_owner_repo else None
+        default_branch = pool.submit(git_default_branch, repo_root)
+        current_branch = pool.submit(git_current_branch, repo_root)
+    for name, future in setup_futures.items():
+        _preflight_result(future, name)
+    return PreflightInfo(
+        owner_repo=_preflight_result(owner_repo, "owner/repo"),
+        default_branch=_preflight_result(default_branch, "default branch"),
+        current_branch=_preflight_result(current_branch, "current branch") or None,
+    )
+
+
 def git_stash_worktree(repo_root: Path, message: str) -> str | None:
-    status_out, _, _ = run_cmd(["git", "status", "--porcelain"], cwd=repo_root)
-    if not status_out.strip():
+    if not workspace_has_changes(repo_root):
         return None
     _, _, _ = run_cmd(
         [
@@ -163,17 +688,19 @@ def git_stash_worktree(repo_root: Path, message: str) -> str | None:
         ],
         cwd=repo_root,
     )
-    selector_out, _, rc = run_cmd(
-        ["git", "stash", "list", "-n1", "--format=%gd"], cwd=repo_root, check=False
-    )
-    if rc == 0:
-        selector = selector_out.strip() or "stash@{0}"
-        return selector
+    _invalidate_status(repo_root)
+    # A successful push always lands at the top of the stash reflog, so the
+    # selector is known without listing stashes. `git stash create` would hand
+    # back a SHA directly but cannot include untracked files.
     return "stash@{0}"
 
 
 def git_stash_pop(repo_root: Path, selector: str) -> None:
-    run_cmd(["git", "stash", "pop", selector], cwd=repo_root)
+    try:
+        run_cmd(["git", "stash", "pop", selector], cwd=repo_root)
+    finally:
+        # A conflicting pop still rewrites the worktree.
+        _invalidate_status(repo_root)
 
 
 class StashConflictError(Exception):
@@ -217,8 +744,11 @@ def safe_stash_pop(repo_root: Path, selector: str) -> None:
 
         if is_conflict:
             # Get list of conflicted files
+            # Unmerged entries are always tracked; skip the untracked-file walk.
             status_out, _, _ = run_cmd(
-                ["git", "status", "--porcelain"], cwd=repo_root, check=False
+                ["git", "status", "--porcelain", "--untracked-files=no"],
+                cwd=repo_root,
+                check=False,
             )
             conflicted_files = []
             for line in status_out.splitlines():
@@ -245,27 +775,44 @@ def safe_stash_pop(repo_root: Path, selector: str) -> None:
 
 def git_stage_all(repo_root: Path) -> None:
     run_cmd(["git", "add", "-A"], cwd=repo_root)
+    _invalidate_status(repo_root)
 
 
-def git_add(repo_root: Path, file_path: Path) -> None:
-    """Stage a specific file for commit.
+def git_add(repo_root: Path, *file_paths: Path) -> None:
+    """Stage specific files for commit with a single git invocation.
 
     Args:
         repo_root: Repository root directory.
-        file_path: Path to the file to stage (can be relative or absolute).
+        *file_paths: Paths to stage (can be relative or absolute). Nothing is
+            run when no paths are given.
     """
-    run_cmd(["git", "add", "--", str(file_path)], cwd=repo_root)
+    if not file_paths:
+        return
+    run_cmd(["git", "add", "--", *map(str, file_paths)], cwd=repo_root)
+    _invalidate_status(repo_root)
 
 
 def git_has_staged_changes(repo_root: Path) -> bool:
+    # Plumbing compare of index vs HEAD: stops at the first differing entry and
+    # skips the porcelain diff setup (textconv, attributes, pager config).
     _, _, rc = run_cmd(
-        ["git", "diff", "--cached", "--quiet"], cwd=repo_root, check=False
+        ["git", "diff-index", "--cached", "--quiet", "HEAD", "--"],
+        cwd=repo_root,
+        check=False,
+        discard_stdout=True,
     )
+    if rc == 128:
+        # No HEAD yet (unborn branch): anything in the index is staged.
+        out, _, _ = run_cmd(
+            ["git", "ls-files", "--cached"], cwd=repo_root, check=False, binary=True
+        )
+        return bool(out.strip())
     return rc != 0
 
 
 def git_commit(repo_root: Path, message: str) -> None:
     run_cmd(["git", "commit", "-m", message], cwd=repo_root)
+    _invalidate_status(repo_root)
 
 
 def git_push_branch(repo_root: Path, branch: str, retries: int = 3) -> None:
@@ -281,9 +828,10 @@ def git_push_branch(repo_root: Path, branch: str, retries: int = 3) -> None:
         cwd=repo_root,
         retries=retries,
         retry_on_codes=GIT_RETRY_EXIT_CODES,
-        retry_on_stderr=GIT_TRANSIENT_ERRORS,
+        retry_on_stderr=GIT_TRANSIENT_RE,
         backoff_base=2.0,
     )
+    invalidate_branch_refs()
 
 
 def git_fetch_with_retry(
@@ -301,9 +849,10 @@ def git_fetch_with_retry(
         cwd=repo_root,
         retries=retries,
         retry_on_codes=GIT_RETRY_EXIT_CODES,
-        retry_on_stderr=GIT_TRANSIENT_ERRORS,
+        retry_on_stderr=GIT_TRANSIENT_RE,
         backoff_base=2.0,
     )
+    invalidate_branch_refs()
 
 
 def git_pull_with_retry(
@@ -328,9 +877,11 @@ def git_pull_with_retry(
         cwd=repo_root,
         retries=retries,
         retry_on_codes=GIT_RETRY_EXIT_CODES,
-        retry_on_stderr=GIT_TRANSIENT_ERRORS,
+        retry_on_stderr=GIT_TRANSIENT_RE,
         backoff_base=2.0,
     )
+    invalidate_branch_refs()
+    _invalidate_status(repo_root)
 
 
 def print_codex_diagnostics(repo_root: Path) -> None:
@@ -360,6 +911,8 @@ def print_codex_diagnostics(repo_root: Path) -> None:
     if os.environ.get(SAFE_ENV_VAR) != "1":
         print(f"codex /status skipped (set {SAFE_ENV_VAR}=1 to enable).")
         return
+    # /status is a full `codex exec` with approvals bypassed, so it only runs
+    # once the version probe has shown the CLI is there.
     try:
         status_out, _ = codex_exec("/status", repo_root, allow_unsafe_execution=True)
         if status_out.strip():
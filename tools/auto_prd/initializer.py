@@ -10,14 +10,17 @@ This module implements the initializer agent pattern from Anthropic's
 
 from __future__ import annotations
 
+import hashlib
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from .checkpoint import save_checkpoint, update_phase_state
 from .command import run_cmd
-from .git_ops import git_add, git_commit, git_has_staged_changes
+from .git_ops import git_add, git_commit, git_has_staged_changes, git_head_sha
 from .logging_utils import logger
 from .tracker_generator import (
     generate_tracker,
@@ -28,6 +31,29 @@ from .tracker_generator import (
 )
 from .utils import extract_called_process_error_details
 
+# Fingerprint of the last tracker content known to be committed, together with
+# the HEAD it was committed at, kept inside .git so it never shows up in the
+# worktree. A branch switch or reset changes HEAD and so forces a real check.
+TRACKER_FINGERPRINT_NAME = "autodev_tracker.fp"
+
+# Only the tail of baseline test output is kept: enough to diagnose a failure
+# without carrying megabytes of noisy suite output into the checkpoint.
+BASELINE_OUTPUT_TAIL_CHARS = 64 * 1024
+BASELINE_TIMEOUT_SECONDS = 300
+# run_cmd reports a baseline timeout with this exit code (coreutils `timeout`).
+BASELINE_TIMEOUT_EXIT_CODE = 124
+
+
+def _output_tail(out: str, err: str, limit: int = BASELINE_OUTPUT_TAIL_CHARS) -> str:
+    """Return the last ``limit`` chars of ``out + "\n" + err`` without joining them first."""
+    err_part = "\n" + err if err else ""
+    if len(out) + len(err_part) <= limit:
+        return out + err_part
+    err_tail = err_part[-limit:]
+    budget = limit - len(err_tail)
+    out_tail = out[-budget:] if budget > 0 else ""
+    return "[... output truncated ...]\n" + out_tail + err_tail
+
 
 @dataclass
 class InitResult:
@@ -89,6 +115,8 @@ class InitializerAgent:
         self.executor = executor
         self.allow_unsafe_execution = allow_unsafe_execution
         self.dry_run = dry_run
+        self._cmd_exists_cache: dict[str, bool] = {}
+        self._pending_adds: list[Path] = []
 
     def run(
         self,
@@ -134,7 +162,9 @@ class InitializerAgent:
                 errors=errors,
             )
 
-        # Step 2: Commit tracker to git
+        # Step 2: Commit tracker to git. This runs before the baseline tests
+        # start: a suite or hook that touches git would otherwise race the
+        # commit for .git/index.lock.
         logger.info("Initializer: Step 2 - Commit tracker")
         try:
             self._commit_tracker()
@@ -142,24 +172,32 @@ class InitializerAgent:
             logger.warning("Failed to commit tracker: %s", e)
             # Non-fatal - continue even if commit fails
 
-        # Update checkpoint if provided
-        if checkpoint:
-            update_phase_state(
-                checkpoint,
-                "local",
-                {
-                    "tracker_generated": True,
-                    "tracker_path": str(tracker_path),
-                    "tracker_features": tracker["validation_summary"]["total_features"],
-                    "tracker_tasks": tracker["validation_summary"]["total_tasks"],
-                },
-            )
-            save_checkpoint(checkpoint)
+        # The tests never read the checkpoint, so it is saved while they run.
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="baseline-tests"
+        ) as pool:
+            logger.info("Initializer: Step 3 - Run baseline tests (background)")
+            baseline_future = pool.submit(self._run_baseline_tests)
+
+            # Update checkpoint if provided
+            if checkpoint:
+                update_phase_state(
+                    checkpoint,
+                    "local",
+                    {
+                        "tracker_generated": True,
+                        "tracker_path": str(tracker_path),
+                        "tracker_features": tracker["validation_summary"][
+                            "total_features"
+                        ],
+                        "tracker_tasks": tracker["validation_summary"]["total_tasks"],
+                    },
+                )
+                save_checkpoint(checkpoint)
 
-        # Step 3: Run baseline tests
-        logger.info("Initializer: Step 3 - Run baseline tests")
+        # Step 3: Collect baseline test results
         try:
-            baseline_result = self._run_baseline_tests()
+            baseline_result = baseline_future.result()
             if not baseline_result.success:
                 logger.warning(
                     "Baseline tests failed (exit code %d)", baseline_result.exit_code
@@ -245,7 +283,8 @@ class InitializerAgent:
         """Commit the tracker to git.
 
         Uses git_add helper for consistent staging behavior. Checks for
-        pre-existing staged changes to avoid bundling unrelated work.
+        pre-existing staged changes to avoid bundling unrelated work. Skips
+        git entirely when the tracker matches the last committed fingerprint.
         """
         if self.dry_run:
             logger.info("Dry run: skipping tracker commit")
@@ -256,10 +295,22 @@ class InitializerAgent:
             logger.warning("Tracker file does not exist, cannot commit")
             return
 
+        digest = hashlib.blake2b(tracker_path.read_bytes(), digest_size=16).digest()
+        fingerprint_path = self.repo_root / ".git" / TRACKER_FINGERPRINT_NAME
+        try:
+            recorded = fingerprint_path.read_bytes()
+        except OSError:
+            recorded = b""
+        if recorded and recorded == self._tracker_fingerprint(digest):
+            logger.debug("Tracker unchanged since last commit; skipping git add")
+            return
+
         try:
             # Check for pre-existing staged changes to avoid bundling
             # unrelated work with the tracker commit
             had_staged_before = git_has_staged_changes(self.repo_root)
+            self._pending_adds.append(tracker_path)
+            self._flush_pending_adds()
             if had_staged_before:
                 logger.warning(
                     "Pre-existing staged changes detected; "
@@ -267,9 +318,7 @@ class InitializerAgent:
                     "bundling unrelated work. Tracker file staged "
                     "but not committed."
                 )
-                git_add(self.repo_root, tracker_path)
             else:
-                git_add(self.repo_root, tracker_path)
                 if git_has_staged_changes(self.repo_root):
                     git_commit(
                         self.repo_root, "chore(aprd): initialize implementation tracker"
@@ -277,10 +326,36 @@ class InitializerAgent:
                     logger.info("Committed tracker to git")
                 else:
                     logger.debug("No tracker changes to commit")
+                self._write_tracker_fingerprint(
+                    fingerprint_path, self._tracker_fingerprint(digest)
+                )
         except subprocess.CalledProcessError as e:
             details = extract_called_process_error_details(e)
             logger.warning("Failed to commit tracker: %s", details)
 
+    def _flush_pending_adds(self) -> None:
+        """Stage every file queued in _pending_adds with one git add."""
+        pending, self._pending_adds = self._pending_adds, []
+        git_add(self.repo_root, *pending)
+
+    def _tracker_fingerprint(self, digest: bytes) -> bytes:
+        """Tie a tracker digest to the current HEAD ("" before the first commit)."""
+        try:
+            head = git_head_sha(self.repo_root)
+        except subprocess.CalledProcessError:
+            head = ""
+        return digest + head.encode("ascii", errors="replace")
+
+    @staticmethod
+    def _write_tracker_fingerprint(fingerprint_path: Path, fingerprint: bytes) -> None:
+        """Record the committed tracker fingerprint; best effort only."""
+        if not fingerprint_path.parent.is_dir():
+            return
+        try:
+            fingerprint_path.write_bytes(fingerprint)
+        except OSError as exc:
+            logger.debug("Could not write tracker fingerprint: %s", exc)
+
     def _run_baseline_tests(self) -> BaselineResult:
         """Run baseline tests to verify repo state.
 
@@ -293,56 +368,63 @@ class InitializerAgent:
                 success=True, output="DRY_RUN: Baseline tests skipped", exit_code=0
             )
 
-        # Try common test commands in order of preference
-        test_commands = [
-            ["make", "ci"],
-            ["make", "test"],
-            ["npm", "test"],
-            ["pnpm", "test"],
-            ["yarn", "test"],
-            ["pytest"],
-            ["go", "test", "./..."],
-            ["cargo", "test"],
+        # Try common test commands in order of preference. Each runner is only
+        # considered when one of its marker files exists, so the PATH lookup is
+        # skipped for toolchains the repo does not use.
+        test_commands: list[tuple[tuple[str, ...], list[str]]] = [
+            (("Makefile",), ["make", "ci"]),
+            (("Makefile",), ["make", "test"]),
+            (("package.json",), ["npm", "test"]),
+            (("package.json",), ["pnpm", "test"]),
+            (("package.json",), ["yarn", "test"]),
+            (
+                ("pyproject.toml", "pytest.ini", "setup.cfg", "tox.ini", "conftest.py"),
+                ["pytest"],
+            ),
+            (("go.mod",), ["go", "test", "./..."]),
+            (("Cargo.toml",), ["cargo", "test"]),
         ]
-
-        for cmd in test_commands:
-            # Check if command exists
-            if not self._command_exists(cmd[0]):
+        present_markers = {
+            name
+            for markers, _ in test_commands
+            for name in markers
+            if (self.repo_root / name).exists()
+        }
+
+        for markers, cmd in test_commands:
+            if present_markers.isdisjoint(markers):
                 continue
 
-            # For make targets, check if Makefile exists
-            if cmd[0] == "make" and not (self.repo_root / "Makefile").exists():
+            if not self._command_exists(cmd[0]):
                 continue
 
-            # For npm/pnpm/yarn, check if package.json exists
-            if cmd[0] in ("npm", "pnpm", "yarn"):
-                if not (self.repo_root / "package.json").exists():
-                    continue
-
             logger.info("Running baseline tests: %s", " ".join(cmd))
             try:
                 out, err, exit_code = run_cmd(
                     cmd,
                     cwd=self.repo_root,
                     check=False,
-                    timeout=300,  # 5 minute timeout for tests
-                )
-                output = out + ("\n" + err if err else "")
-                return BaselineResult(
-                    success=(exit_code == 0),
-                    output=output,
-                    exit_code=exit_code,
+                    timeout=BASELINE_TIMEOUT_SECONDS,
+                    timeout_exit_code=BASELINE_TIMEOUT_EXIT_CODE,
                 )
-            except subprocess.TimeoutExpired:
+            except Exception as e:
+                logger.warning("Baseline test command failed: %s", e)
+                continue
+            if exit_code == BASELINE_TIMEOUT_EXIT_CODE:
                 return BaselineResult(
                     success=False,
-                    output="Baseline tests timed out after 300 seconds",
+                    output=(
+                        f"Baseline tests timed out after {BASELINE_TIMEOUT_SECONDS} "
+                        f"seconds\n{_output_tail(out, err)}"
+                    ),
                     exit_code=-1,
                     errors=["Test timeout"],
                 )
-            except Exception as e:
-                logger.warning("Baseline test command failed: %s", e)
-                continue
+            return BaselineResult(
+                success=(exit_code == 0),
+                output=_output_tail(out, err),
+                exit_code=exit_code,
+            )
 
         # No test command found
         logger.info("No test command found, assuming baseline passes")
@@ -353,12 +435,12 @@ class InitializerAgent:
         )
 
     def _command_exists(self, cmd: str) -> bool:
-        """Check if a command exists in PATH."""
-        try:
-            run_cmd(["which", cmd], cwd=self.repo_root, check=True)
-            return True
-        except subprocess.CalledProcessError:
-            return False
+        """Check if a command exists in PATH (looked up in-process, cached)."""
+        exists = self._cmd_exists_cache.get(cmd)
+        if exists is None:
+            exists = shutil.which(cmd) is not None
+            self._cmd_exists_cache[cmd] = exists
+        return exists
 
 
 def run_initializer(
@@ -6,15 +6,97 @@ automation runs, enabling post-hoc analysis and debugging.
 
 from __future__ import annotations
 
+import atexit
 import json
+import math
 import os
-from datetime import datetime, timezone
+import queue
+import threading
+import time
+import weakref
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from datetime import datetime
 from enum import Enum
+from json.encoder import encode_basestring_ascii
 from pathlib import Path
 from typing import Any
 
 from .logging_utils import logger
 
+# orjson is optional - parses journal lines straight from bytes
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Entries are handed to a background writer thread, which appends whatever has
+# queued up (at most this many lines) with a single vectored write.
+JOURNAL_WRITE_BATCH_MAX = 256
+# os.writev is POSIX-only; elsewhere a batch is joined into one os.write.
+HAS_WRITEV = hasattr(os, "writev")
+# Upper bound on how long flush()/close() wait for the writer thread.
+JOURNAL_FLUSH_TIMEOUT_SECONDS = 5.0
+
+# Compact encoder shared by every entry; log() builds entries in a fixed field
+# order, so sorting keys per call would only add cost.
+_DUMPS = json.JSONEncoder(separators=(",", ":")).encode
+# String escaper _DUMPS uses internally; the per-iteration helpers fill fixed
+# JSON templates with it instead of encoding a dict.
+_ESC = encode_basestring_ascii
+
+# Journals to close at interpreter exit. Held weakly so a journal nobody
+# references any more can still be collected; a running writer thread keeps its
+# own journal alive until close().
+_OPEN_JOURNALS: weakref.WeakSet[Journal] = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_journals() -> None:
+    for journal in list(_OPEN_JOURNALS):
+        journal.close()
+
+
+# Runner prompts and outputs are journaled truncated to this many characters.
+PREVIEW_MAX_CHARS = 200
+
+
+def _preview(text: str, limit: int = PREVIEW_MAX_CHARS) -> str:
+    """Truncate text for the journal, returning short input unchanged."""
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "..."
+
+
+def _write_lines(fd: int, lines: list[bytes]) -> None:
+    """Append lines with vectored writes, resuming after short writes."""
+    if not HAS_WRITEV:
+        view = memoryview(b"".join(lines))
+        while view:
+            view = view[os.write(fd, view) :]
+        return
+    start = 0
+    while start < len(lines):
+        written = os.writev(fd, lines[start:])
+        while start < len(lines) and written >= len(lines[start]):
+            written -= len(lines[start])
+            start += 1
+        if written:
+            lines[start] = lines[start][written:]
+
+
+def _fmt_ts(ns: int) -> str:
+    """Format epoch nanoseconds as an ISO 8601 UTC timestamp.
+
+    Microsecond precision keeps the value parseable by datetime.fromisoformat.
+    """
+    seconds, rem = divmod(ns, 1_000_000_000)
+    return (
+        f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{rem // 1000:06d}Z"
+    )
+
 
 class ActionType(str, Enum):
     """Types of actions that can be journaled."""
@@ -36,24 +118,61 @@ class ActionType(str, Enum):
     MILESTONE = "milestone"
 
 
+# Members bound once at import: Enum attribute access goes through the
+# metaclass on every lookup, and the Journal helpers run on hot paths.
+_SESSION_START = ActionType.SESSION_START
+_SESSION_END = ActionType.SESSION_END
+_PHASE_START = ActionType.PHASE_START
+_PHASE_END = ActionType.PHASE_END
+_ITERATION_START = ActionType.ITERATION_START
+_ITERATION_END = ActionType.ITERATION_END
+_RUNNER_START = ActionType.RUNNER_START
+_RUNNER_END = ActionType.RUNNER_END
+_GIT_OP = ActionType.GIT_OP
+_API_CALL = ActionType.API_CALL
+_CHECKPOINT_SAVE = ActionType.CHECKPOINT_SAVE
+_CHECKPOINT_RESTORE = ActionType.CHECKPOINT_RESTORE
+_ERROR = ActionType.ERROR
+_WARNING = ActionType.WARNING
+_MILESTONE = ActionType.MILESTONE
+
+
 class Journal:
     """Session journal for progress tracking and observability.
 
     Writes structured JSONL entries to a journal file for each session.
+    Entries are written by a background thread; call flush() before reading
+    the file back in-process, and close() (done by session_end and at
+    interpreter exit) when finished.
     """
 
-    def __init__(self, session_id: str, journal_dir: Path | None = None):
+    def __init__(
+        self,
+        session_id: str,
+        journal_dir: Path | None = None,
+        *,
+        enabled: bool = True,
+    ):
         """Initialize journal for a session.
 
         Args:
             session_id: Unique session identifier.
             journal_dir: Optional directory for journal files.
+            enabled: When False, every logging call returns before formatting
+                its message and nothing is written.
         """
         self.session_id = session_id
+        self._session_json = _ESC(session_id)
+        self._enabled = enabled
         self._journal_dir = journal_dir or self._get_default_journal_dir()
-        self._journal_dir.mkdir(parents=True, exist_ok=True)
+        if enabled:
+            self._journal_dir.mkdir(parents=True, exist_ok=True)
         self._journal_path = self._journal_dir / f"{session_id}.jsonl"
         self._entry_count = 0
+        self._lock = threading.Lock()
+        self._queue: queue.SimpleQueue[bytes | threading.Event | None] | None = None
+        self._writer: threading.Thread | None = None
+        _OPEN_JOURNALS.add(self)
 
     @staticmethod
     def _get_default_journal_dir() -> Path:
@@ -65,18 +184,110 @@ class Journal:
             base_config = Path.home() / ".config"
         return base_config / "aprd" / "journals"
 
+    def _start_writer_locked(
+        self,
+    ) -> queue.SimpleQueue[bytes | threading.Event | None]:
+        """Start the writer thread if needed; the caller holds _lock."""
+        if self._queue is None:
+            # Each writer gets its own queue so a writer still draining after
+            # close() never competes with its replacement.
+            self._queue = queue.SimpleQueue()
+            self._writer = threading.Thread(
+                target=self._writer_loop,
+                args=(self._queue,),
+                name=f"journal-{self.session_id}",
+                daemon=True,
+            )
+            self._writer.start()
+        return self._queue
+
+    def _writer_loop(
+        self, q: queue.SimpleQueue[bytes | threading.Event | None]
+    ) -> None:
+        """Drain queued lines into the journal file until a None sentinel."""
+        fd: int | None = None
+        running = True
+        while running:
+            lines: list[bytes] = []
+            waiters: list[threading.Event] = []
+            item = q.get()
+            while True:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    lines.append(item)
+                if not running or len(lines) >= JOURNAL_WRITE_BATCH_MAX:
+                    break
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+            if lines:
+                try:
+                    if fd is None:
+                        fd = os.open(
+                            self._journal_path,
+                            os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                            0o644,
+                        )
+                    _write_lines(fd, lines)
+                except OSError as e:
+                    logger.warning("Failed to write journal entries: %s", e)
+            for waiter in waiters:
+                waiter.set()
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError as e:
+                logger.warning("Failed to close journal: %s", e)
+
     def _write_entry(self, entry: dict[str, Any]) -> None:
-        """Write a single entry to the journal file.
+        """Queue a single entry for the journal file.
 
         Args:
             entry: Dictionary to write as JSON line.
         """
-        try:
-            with open(self._journal_path, "a") as f:
-                f.write(json.dumps(entry, sort_keys=True) + "\n")
+        # Encode on the caller's thread so later mutation of the entry's
+        # contents cannot leak into what gets written.
+        self._enqueue(_DUMPS(entry).encode("utf-8") + b"\n")
+
+    def _enqueue(self, line: bytes) -> None:
+        with self._lock:
+            self._start_writer_locked().put(line)
             self._entry_count += 1
-        except OSError as e:
-            logger.warning("Failed to write journal entry: %s", e)
+
+    def _head_json(self, action: str, message: str) -> str:
+        """Open a templated entry with the fields log() always writes first."""
+        return (
+            f'{{"timestamp":"{_fmt_ts(time.time_ns())}",'
+            f'"session_id":{self._session_json},'
+            f'"action":"{action}","message":{_ESC(message)}'
+        )
+
+    def flush(self) -> None:
+        """Wait until queued entries have been written to the journal file."""
+        with self._lock:
+            q = self._queue
+            if q is None:
+                return
+            done = threading.Event()
+            q.put(done)
+        if not done.wait(JOURNAL_FLUSH_TIMEOUT_SECONDS):
+            logger.warning("Timed out flushing journal %s", self._journal_path)
+
+    def close(self) -> None:
+        """Write queued entries and stop the writer; later entries restart it."""
+        with self._lock:
+            q, writer = self._queue, self._writer
+            self._queue = self._writer = None
+            if q is not None:
+                q.put(None)
+        if writer is not None:
+            writer.join(JOURNAL_FLUSH_TIMEOUT_SECONDS)
+            if writer.is_alive():
+                logger.warning("Timed out closing journal %s", self._journal_path)
 
     def log(
         self,
@@ -100,20 +311,26 @@ class Journal:
             duration_ms: Duration in milliseconds if timed action.
             success: Whether the action succeeded.
         """
+        if not self._enabled:
+            return
         entry: dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _fmt_ts(time.time_ns()),
             "session_id": self.session_id,
-            "action": action_type.value,
+            # ActionType is a str subclass; the encoder writes its value as-is.
+            "action": action_type,
             "message": message,
         }
 
+        # Plain guarded stores: measurably cheaper than building the optional
+        # fields through a None-filtering comprehension for this few keys.
         if phase is not None:
             entry["phase"] = phase
         if iteration is not None:
             entry["iteration"] = iteration
         if details is not None:
             entry["details"] = details
-        if duration_ms is not None:
+        # NaN/Infinity have no JSON spelling, so such durations are dropped.
+        if duration_ms is not None and math.isfinite(duration_ms):
             entry["duration_ms"] = duration_ms
         if success is not None:
             entry["success"] = success
@@ -128,8 +345,10 @@ class Journal:
         resumed: bool = False,
     ) -> None:
         """Log session start."""
+        if not self._enabled:
+            return
         self.log(
-            ActionType.SESSION_START,
+            _SESSION_START,
             "Resumed session" if resumed else "Started new session",
             details={
                 "prd_path": prd_path,
@@ -141,26 +360,33 @@ class Journal:
 
     def session_end(self, success: bool, summary: str | None = None) -> None:
         """Log session end."""
+        if not self._enabled:
+            return
         self.log(
-            ActionType.SESSION_END,
+            _SESSION_END,
             summary
             or ("Session completed successfully" if success else "Session failed"),
             success=success,
             details={"total_entries": self._entry_count},
         )
+        self.close()
 
     def phase_start(self, phase: str) -> None:
         """Log phase start."""
+        if not self._enabled:
+            return
         self.log(
-            ActionType.PHASE_START,
+            _PHASE_START,
             f"Starting {phase} phase",
             phase=phase,
         )
 
     def phase_end(self, phase: str, success: bool, summary: str | None = None) -> None:
         """Log phase end."""
+        if not self._enabled:
+            return
         self.log(
-            ActionType.PHASE_END,
+            _PHASE_END,
             summary or f"Completed {phase} phase",
             phase=phase,
             success=success,
@@ -168,12 +394,28 @@ class Journal:
 
     def iteration_start(self, phase: str, iteration: int, max_iters: int) -> None:
         """Log iteration start."""
-        self.log(
-            ActionType.ITERATION_START,
-            f"Starting iteration {iteration}/{max_iters}",
-            phase=phase,
-            iteration=iteration,
-            details={"max_iterations": max_iters},
+        if not self._enabled:
+            return
+        message = f"Starting iteration {iteration}/{max_iters}"
+        if not (
+            isinstance(phase, str) and type(iteration) is int and type(max_iters) is int
+        ):
+            # The templates below only spell strings, plain ints and bools
+            # the way the encoder does; anything else takes the generic path.
+            self.log(
+                _ITERATION_START,
+                message,
+                phase=phase,
+                iteration=iteration,
+                details={"max_iterations": max_iters},
+            )
+            return
+        # Fixed shape: filled as a template, byte-identical to what log() writes
+        # for the field types checked above.
+        head = self._head_json(_ITERATION_START.value, message)
+        self._enqueue(
+            f'{head},"phase":{_ESC(phase)},"iteration":{iteration},'
+            f'"details":{{"max_iterations":{max_iters}}}}}\n'.encode()
         )
 
     def iteration_end(
@@ -186,32 +428,60 @@ class Journal:
         repo_changed: bool = False,
     ) -> None:
         """Log iteration end."""
-        self.log(
-            ActionType.ITERATION_END,
-            f"Completed iteration {iteration}",
-            phase=phase,
-            iteration=iteration,
-            details={
-                "tasks_left": tasks_left,
-                "has_findings": has_findings,
-                "repo_changed": repo_changed,
-            },
+        if not self._enabled:
+            return
+        message = f"Completed iteration {iteration}"
+        if not (
+            isinstance(phase, str)
+            and type(iteration) is int
+            and (tasks_left is None or type(tasks_left) is int)
+            and type(has_findings) is bool
+            and type(repo_changed) is bool
+        ):
+            self.log(
+                _ITERATION_END,
+                message,
+                phase=phase,
+                iteration=iteration,
+                details={
+                    "tasks_left": tasks_left,
+                    "has_findings": has_findings,
+                    "repo_changed": repo_changed,
+                },
+            )
+            return
+        head = self._head_json(_ITERATION_END.value, message)
+        tasks = "null" if tasks_left is None else tasks_left
+        findings = "true" if has_findings else "false"
+        changed = "true" if repo_changed else "false"
+        self._enqueue(
+            f'{head},"phase":{_ESC(phase)},"iteration":{iteration},'
+            f'"details":{{"tasks_left":{tasks},"has_findings":{findings},'
+            f'"repo_changed":{changed}}}}}\n'.encode()
         )
 
     def runner_start(
         self, runner_name: str, phase: str, prompt_preview: str = ""
     ) -> None:
         """Log runner execution start."""
-        preview = (
-            prompt_preview[:200] + "..."
-            if len(prompt_preview) > 200
-            else prompt_preview
-        )
-        self.log(
-            ActionType.RUNNER_START,
-            f"Launching {runner_name}",
-            phase=phase,
-            details={"runner": runner_name, "prompt_preview": preview},
+        if not self._enabled:
+            return
+        message = f"Launching {runner_name}"
+        if not (isinstance(phase, str) and isinstance(runner_name, str)):
+            self.log(
+                _RUNNER_START,
+                message,
+                phase=phase,
+                details={
+                    "runner": runner_name,
+                    "prompt_preview": _preview(prompt_preview),
+                },
+            )
+            return
+        head = self._head_json(_RUNNER_START.value, message)
+        self._enqueue(
+            f'{head},"phase":{_ESC(phase)},"details":{{"runner":{_ESC(runner_name)},'
+            f'"prompt_preview":{_ESC(_preview(prompt_preview))}}}}}\n'.encode()
         )
 
     def runner_end(
@@ -223,18 +493,33 @@ class Journal:
         output_preview: str = "",
     ) -> None:
         """Log runner execution end."""
-        preview = (
-            output_preview[:200] + "..."
-            if len(output_preview) > 200
-            else output_preview
-        )
-        self.log(
-            ActionType.RUNNER_END,
-            f"{runner_name} {'completed' if success else 'failed'}",
-            phase=phase,
-            success=success,
-            duration_ms=duration_ms,
-            details={"runner": runner_name, "output_preview": preview},
+        if not self._enabled:
+            return
+        message = f"{runner_name} {'completed' if success else 'failed'}"
+        if not (
+            isinstance(phase, str)
+            and isinstance(runner_name, str)
+            and type(success) is bool
+            and (duration_ms is None or type(duration_ms) is int)
+        ):
+            self.log(
+                _RUNNER_END,
+                message,
+                phase=phase,
+                success=success,
+                duration_ms=duration_ms,
+                details={
+                    "runner": runner_name,
+                    "output_preview": _preview(output_preview),
+                },
+            )
+            return
+        head = self._head_json(_RUNNER_END.value, message)
+        duration = "" if duration_ms is None else f',"duration_ms":{duration_ms}'
+        self._enqueue(
+            f'{head},"phase":{_ESC(phase)},"details":{{"runner":{_ESC(runner_name)},'
+            f'"output_preview":{_ESC(_preview(output_preview))}}}{duration},'
+            f'"success":{"true" if success else "false"}}}\n'.encode()
         )
 
     def git_operation(
@@ -244,11 +529,18 @@ class Journal:
         details: dict[str, Any] | None = None,
     ) -> None:
         """Log a git operation."""
+        if not self._enabled:
+            return
+        # Caller details are layered over the operation in place rather than
+        # unpacked into a fresh literal.
+        entry_details: dict[str, Any] = {"operation": operation}
+        if details:
+            entry_details.update(details)
         self.log(
-            ActionType.GIT_OP,
+            _GIT_OP,
             f"Git {operation}",
             success=success,
-            details={"operation": operation, **(details or {})},
+            details=entry_details,
         )
 
     def api_call(
@@ -259,26 +551,35 @@ class Journal:
         details: dict[str, Any] | None = None,
     ) -> None:
         """Log an API call."""
+        if not self._enabled:
+            return
+        entry_details: dict[str, Any] = {"endpoint": endpoint}
+        if details:
+            entry_details.update(details)
         self.log(
-            ActionType.API_CALL,
+            _API_CALL,
             f"API call to {endpoint}",
             success=success,
             duration_ms=duration_ms,
-            details={"endpoint": endpoint, **(details or {})},
+            details=entry_details,
         )
 
     def checkpoint_saved(self, phase: str, state_summary: str) -> None:
         """Log checkpoint save."""
+        if not self._enabled:
+            return
         self.log(
-            ActionType.CHECKPOINT_SAVE,
+            _CHECKPOINT_SAVE,
             f"Checkpoint saved: {state_summary}",
             phase=phase,
         )
 
     def checkpoint_restored(self, phase: str, state_summary: str) -> None:
         """Log checkpoint restore."""
+        if not self._enabled:
+            return
         self.log(
-            ActionType.CHECKPOINT_RESTORE,
+            _CHECKPOINT_RESTORE,
             f"Checkpoint restored: {state_summary}",
             phase=phase,
         )
@@ -292,8 +593,10 @@ class Journal:
         recoverable: bool = True,
     ) -> None:
         """Log an error."""
+        if not self._enabled:
+            return
         self.log(
-            ActionType.ERROR,
+            _ERROR,
             message,
             phase=phase,
             success=False,
@@ -305,20 +608,29 @@ class Journal:
 
     def warning(self, message: str, *, phase: str | None = None) -> None:
         """Log a warning."""
+        if not self._enabled:
+            return
         self.log(
-            ActionType.WARNING,
+            _WARNING,
             message,
             phase=phase,
         )
 
     def milestone(self, message: str, *, phase: str | None = None) -> None:
         """Log a significant milestone."""
+        if not self._enabled:
+            return
         self.log(
-            ActionType.MILESTONE,
+            _MILESTONE,
             message,
             phase=phase,
         )
 
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are being written."""
+        return self._enabled
+
     @property
     def journal_path(self) -> Path:
         """Get the path to the journal file."""
@@ -330,6 +642,28 @@ class Journal:
         return self._entry_count
 
 
+def _journal_path(session_id: str, journal_dir: Path | None) -> Path:
+    if journal_dir is None:
+        journal_dir = Journal._get_default_journal_dir()
+    return journal_dir / f"{session_id}.jsonl"
+
+
+def _iter_journal_entries(journal_path: Path) -> Iterator[dict[str, Any]]:
+    """Yield entries one line at a time, skipping malformed lines."""
+    loads = orjson.loads if HAS_ORJSON else json.loads
+    try:
+        with open(journal_path, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        yield loads(line)
+                    except ValueError:
+                        continue
+    except OSError as e:
+        logger.warning("Failed to load journal %s: %s", journal_path, e)
+
+
 def load_journal(
     session_id: str, journal_dir: Path | None = None
 ) -> list[dict[str, Any]]:
@@ -342,109 +676,132 @@ def load_journal(
     Returns:
         List of journal entry dictionaries.
     """
-    if journal_dir is None:
-        xdg_config = os.getenv("XDG_CONFIG_HOME", None)
-        if xdg_config and xdg_config.strip():
-            base_config = Path(xdg_config).expanduser()
-        else:
-            base_config = Path.home() / ".config"
-        journal_dir = base_config / "aprd" / "journals"
-
-    journal_path = journal_dir / f"{session_id}.jsonl"
+    journal_path = _journal_path(session_id, journal_dir)
     if not journal_path.exists():
         return []
 
-    entries = []
     try:
-        with open(journal_path) as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        entries.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
+        data = journal_path.read_bytes()
     except OSError as e:
         logger.warning("Failed to load journal %s: %s", journal_path, e)
+        return []
+
+    loads = orjson.loads if HAS_ORJSON else json.loads
+    entries = []
+    for line in data.splitlines():
+        line = line.strip()
+        if line:
+            try:
+                entries.append(loads(line))
+            except ValueError:
+                # Covers json/orjson decode errors and undecodable bytes
+                continue
 
     return entries
 
 
+def stream_summarize(
+    session_id: str, journal_dir: Path | None = None
+) -> dict[str, Any]:
+    """Summarize a session journal while reading it, without loading all entries.
+
+    Args:
+        session_id: Session identifier.
+        journal_dir: Optional directory containing journals.
+
+    Returns:
+        Summary dictionary, as produced by summarize_journal.
+    """
+    journal_path = _journal_path(session_id, journal_dir)
+    if not journal_path.exists():
+        return {"total_entries": 0}
+    return summarize_journal(_iter_journal_entries(journal_path), journal_path)
+
+
 def summarize_journal(
-    entries: list[dict[str, Any]], journal_path: Path | None = None
+    entries: Iterable[dict[str, Any]], journal_path: Path | None = None
 ) -> dict[str, Any]:
     """Generate a summary of journal entries.
 
     Args:
-        entries: List of journal entry dictionaries.
+        entries: Journal entry dictionaries; consumed in a single pass.
         journal_path: Optional path to the journal file (for error context).
 
     Returns:
         Summary dictionary with statistics and key events.
     """
-    if not entries:
-        return {"total_entries": 0}
-
-    summary: dict[str, Any] = {
-        "total_entries": len(entries),
-        "phases": {},
-        "errors": [],
-        "milestones": [],
-        "duration_ms": None,
-    }
+    total_entries = 0
 
     # Track phase statistics
-    phase_stats: dict[str, dict[str, Any]] = {}
+    phase_stats: defaultdict[str, dict[str, Any]] = defaultdict(
+        lambda: {"iterations": 0, "runner_calls": 0, "errors": 0}
+    )
+    errors: list[dict[str, Any]] = []
+    milestones: list[dict[str, Any]] = []
     start_time = None
     end_time = None
 
+    # Resolve enum values once instead of per entry and comparison.
+    iteration_end = ActionType.ITERATION_END.value
+    runner_end = ActionType.RUNNER_END.value
+    error = ActionType.ERROR.value
+    milestone = ActionType.MILESTONE.value
+
     for entry in entries:
-        action = entry.get("action", "")
-        phase = entry.get("phase")
-        timestamp = entry.get("timestamp", "")
+        total_entries += 1
+        get = entry.get
+        action = get("action", "")
+        phase = get("phase")
+        timestamp = get("timestamp", "")
 
         # Track overall duration
-        if start_time is None and timestamp:
-            start_time = timestamp
         if timestamp:
+            if start_time is None:
+                start_time = timestamp
             end_time = timestamp
 
         # Track phase stats
-        if phase and phase not in phase_stats:
-            phase_stats[phase] = {
-                "iterations": 0,
-                "runner_calls": 0,
-                "errors": 0,
-                "started_at": timestamp,
-            }
-
-        if action == ActionType.ITERATION_END.value and phase:
-            phase_stats[phase]["iterations"] += 1
-
-        if action == ActionType.RUNNER_END.value and phase:
-            phase_stats[phase]["runner_calls"] += 1
-
-        if action == ActionType.ERROR.value:
-            summary["errors"].append(
+        stats = None
+        if phase:
+            stats = phase_stats[phase]
+            stats.setdefault("started_at", timestamp)
+
+        # The action types are mutually exclusive, so stop at the first match.
+        if action == iteration_end:
+            if stats is not None:
+                stats["iterations"] += 1
+        elif action == runner_end:
+            if stats is not None:
+                stats["runner_calls"] += 1
+        elif action == error:
+            errors.append(
                 {
-                    "message": entry.get("message", "Unknown error"),
+                    "message": get("message", "Unknown error"),
                     "phase": phase,
                     "timestamp": timestamp,
                 }
             )
-            if phase and phase in phase_stats:
-                phase_stats[phase]["errors"] += 1
-
-        if action == ActionType.MILESTONE.value:
-            summary["milestones"].append(
+            if stats is not None:
+                stats["errors"] += 1
+        elif action == milestone:
+            milestones.append(
                 {
-                    "message": entry.get("message", ""),
+                    "message": get("message", ""),
                     "phase": phase,
                     "timestamp": timestamp,
                 }
             )
 
-    summary["phases"] = phase_stats
+    if not total_entries:
+        return {"total_entries": 0}
+
+    summary: dict[str, Any] = {
+        "total_entries": total_entries,
+        "phases": dict(phase_stats),
+        "errors": errors,
+        "milestones": milestones,
+        "duration_ms": None,
+    }
 
     # Calculate duration if we have timestamps
     if start_time and end_time:
@@ -7,7 +7,9 @@ providing automated code review feedback between iterations.
 
 from __future__ import annotations
 
+import random
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -17,16 +19,16 @@ from .agents import (
     coderabbit_prompt_only,
     codex_exec,
 )
-from .checkpoint import save_checkpoint, update_phase_state
+from .checkpoint import save_checkpoint, save_checkpoint_async, update_phase_state
 from .command import CalledProcessError, TimeoutExpired
 from .constants import (
     CODERABBIT_FINDINGS_CHAR_LIMIT,
     CODEX_READONLY_ERROR_MSG,
     get_tool_allowlist,
 )
-from .git_ops import git_head_sha, git_status_snapshot
+from .git_ops import git_status_and_head
 from .logging_utils import logger
-from .policy import policy_runner
+from .policy import policy_runner, warm_runner
 from .utils import checkbox_stats, detect_readonly_block, parse_tasks_left
 
 LOCAL_QA_SNIPPET = """
@@ -51,7 +53,8 @@ NO_CHANGES_ERROR = (
 MAX_IMPL_RETRIES = 2
 
 # Base delay for exponential backoff between retries (seconds).
-# Uses formula: IMPL_RETRY_BACKOFF_BASE * (2**attempt) for delays of 10s, 20s.
+# Uses formula: IMPL_RETRY_BACKOFF_BASE * (2**attempt) for delays of 10s, 20s,
+# each scaled by a random factor in [0.5, 1.5).
 IMPL_RETRY_BACKOFF_BASE = 10
 
 # Exit codes that indicate non-retryable conditions.
@@ -62,6 +65,18 @@ IMPL_RETRY_BACKOFF_BASE = 10
 NON_RETRYABLE_EXIT_CODES = frozenset({126, 127, 137, 139})
 
 
+def _start_review(base_branch: str | None, repo_root: Path) -> Future[str]:
+    """Run the CodeRabbit prompt-only review on a background thread."""
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="coderabbit")
+    try:
+        return executor.submit(
+            coderabbit_prompt_only, base_branch=base_branch, repo_root=repo_root
+        )
+    finally:
+        # Lets the submitted review finish; the thread exits once it does.
+        executor.shutdown(wait=False)
+
+
 def should_stop_for_completion(
     done_by_checkboxes: bool,
     done_by_codex: bool,
@@ -145,9 +160,13 @@ def orchestrate_local_loop(
     qa_context_shared = local_state.get("qa_context_shared", False)
     empty_change_streak = local_state.get("empty_change_streak", 0)
 
-    # Get current git state
-    previous_status = git_status_snapshot(repo_root)
-    previous_head = git_head_sha(repo_root)
+    # Get current git state; one `git status` run yields both values and the
+    # pair is carried between iterations instead of being re-read. Dry runs
+    # never compare against a fresh snapshot, so they skip git altogether.
+    if not dry_run:
+        previous_status, previous_head = git_status_and_head(repo_root)
+    else:
+        previous_status, previous_head = frozenset(), ""
 
     # If resuming, restore from checkpoint state if available
     if start_iteration > 1:
@@ -165,6 +184,18 @@ def orchestrate_local_loop(
         )
         return tasks_left if tasks_left is not None else -1, appears_complete
 
+    # Only the QA section varies between iterations, so build both variants once.
+    impl_prompt_first, impl_prompt_reminder = (
+        f"""
+Read the spec at '{prd_path}'. Implement the NEXT uncompleted tasks in '{repo_root}'.
+
+{qa_section}
+
+At the end, print: TASKS_LEFT=<N>
+"""
+        for qa_section in (LOCAL_QA_SNIPPET, LOCAL_QA_REMINDER)
+    )
+
     for i in range(start_iteration, max_iters + 1):
         print(
             f"\n=== Iteration {i}/{max_iters}: Codex implements next chunk ===",
@@ -174,14 +205,7 @@ def orchestrate_local_loop(
         before_status = previous_status
         before_head = previous_head
 
-        qa_section = LOCAL_QA_SNIPPET if not qa_context_shared else LOCAL_QA_REMINDER
-        impl_prompt = f"""
-Read the spec at '{prd_path}'. Implement the NEXT uncompleted tasks in '{repo_root}'.
-
-{qa_section}
-
-At the end, print: TASKS_LEFT=<N>
-"""
+        impl_prompt = impl_prompt_reminder if qa_context_shared else impl_prompt_first
         runner, runner_name = policy_runner(None, i=i, phase="implement")
         print("→ Launching implementation pass with", runner_name, "…", flush=True)
         runner_kwargs: dict[str, Any] = {
@@ -230,9 +254,13 @@ At the end, print: TASKS_LEFT=<N>
                     break
 
                 if impl_attempt < MAX_IMPL_RETRIES:
+                    # Jitter spreads retries from loops that failed together (e.g.
+                    # on a shared rate limit) instead of realigning them on the
+                    # same backoff boundaries.
                     wait_time = IMPL_RETRY_BACKOFF_BASE * (2**impl_attempt)
+                    wait_time *= 0.5 + random.random()
                     logger.warning(
-                        "%s implementation pass %s (attempt %d/%d); retrying in %ds",
+                        "%s implementation pass %s (attempt %d/%d); retrying in %.0fs",
                         runner_name,
                         error_type,
                         impl_attempt + 1,
@@ -241,7 +269,7 @@ At the end, print: TASKS_LEFT=<N>
                     )
                     print(
                         f"  ⚠️  {runner_name} {error_type}. "
-                        f"Retrying in {wait_time}s "
+                        f"Retrying in {wait_time:.0f}s "
                         f"(attempt {impl_attempt + 1}/{MAX_IMPL_RETRIES + 1})…",
                         flush=True,
                     )
@@ -295,9 +323,26 @@ At the end, print: TASKS_LEFT=<N>
 
         qa_context_shared = True
 
+        tasks_progress = (
+            previous_tasks_left is not None
+            and tasks_left is not None
+            and tasks_left < previous_tasks_left
+        )
+        # The review and fix pass take a while; warm the next iteration's CLI
+        # in the meantime so its launch doesn't pay the cold start.
+        if not dry_run and i < max_iters:
+            warm_runner(policy_runner(None, i=i + 1, phase="implement")[0])
+
+        # Task progress makes the review unconditional, so start it before the
+        # status snapshot and let the two overlap. Without progress the snapshot
+        # decides whether a review runs at all.
+        review_future: Future[str] | None = None
+        if tasks_progress:
+            print("\n=== CodeRabbit CLI review (prompt-only) ===", flush=True)
+            review_future = _start_review(base_branch, repo_root)
+
         if not dry_run:
-            status_after_impl = git_status_snapshot(repo_root)
-            head_after_impl = git_head_sha(repo_root)
+            status_after_impl, head_after_impl = git_status_and_head(repo_root)
         else:
             status_after_impl = before_status
             head_after_impl = before_head
@@ -305,11 +350,6 @@ At the end, print: TASKS_LEFT=<N>
         repo_changed_before_review = (
             status_after_impl != before_status or head_after_impl != before_head
         )
-        tasks_progress = (
-            previous_tasks_left is not None
-            and tasks_left is not None
-            and tasks_left < previous_tasks_left
-        )
 
         has_findings = False
         fix_pass_failed = False  # Track if fix pass was attempted but failed
@@ -323,9 +363,17 @@ At the end, print: TASKS_LEFT=<N>
             )
             print(f"CodeRabbit skip streak: {skipped_review_streak}")
         else:
-            print("\n=== CodeRabbit CLI review (prompt-only) ===", flush=True)
-            cr = coderabbit_prompt_only(base_branch=base_branch, repo_root=repo_root)
+            if review_future is not None:
+                cr = review_future.result()
+            else:
+                print("\n=== CodeRabbit CLI review (prompt-only) ===", flush=True)
+                cr = coderabbit_prompt_only(
+                    base_branch=base_branch, repo_root=repo_root
+                )
             has_findings = coderabbit_has_findings(cr)
+            # Only the truncated findings are used from here on; drop the full
+            # review text now rather than holding it through the fix pass.
+            cr = cr[:CODERABBIT_FINDINGS_CHAR_LIMIT]
             skipped_review_streak = 0
             if has_findings:
                 no_findings_streak = 0
@@ -334,7 +382,7 @@ At the end, print: TASKS_LEFT=<N>
 You are fixing findings reported by CodeRabbit CLI:
 
 <CODE_RABBIT_FINDINGS>
-{cr[:CODERABBIT_FINDINGS_CHAR_LIMIT]}
+{cr}
 </CODE_RABBIT_FINDINGS>
 
 Apply targeted changes, commit frequently, and re-run the QA gates until green.
@@ -404,13 +452,15 @@ Apply targeted changes, commit frequently, and re-run the QA gates until green.
                         f"Codex reported TASKS_LEFT={tasks_left} after applying findings"
                     )
                 if not dry_run:
-                    status_after_iteration = git_status_snapshot(repo_root)
-                    head_after_iteration = git_head_sha(repo_root)
+                    status_after_iteration, head_after_iteration = git_status_and_head(
+                        repo_root
+                    )
             else:
                 no_findings_streak += 1
                 if not dry_run:
-                    status_after_iteration = git_status_snapshot(repo_root)
-                    head_after_iteration = git_head_sha(repo_root)
+                    status_after_iteration, head_after_iteration = git_status_and_head(
+                        repo_root
+                    )
                 print("No CodeRabbit findings detected in this pass.")
                 print(f"CodeRabbit no-findings streak: {no_findings_streak}")
 
@@ -419,9 +469,13 @@ Apply targeted changes, commit frequently, and re-run the QA gates until green.
             or head_after_iteration != before_head
         )
 
-        unchecked, total_checkboxes = checkbox_stats(prd_path)
-        done_by_checkboxes = total_checkboxes > 0 and unchecked == 0
         done_by_codex = tasks_left == 0 if tasks_left is not None else False
+        # The checkbox heuristic can only change the outcome when nothing
+        # else has already decided it, so skip re-reading the PRD otherwise.
+        done_by_checkboxes = False
+        if not has_findings and not done_by_codex:
+            unchecked, total_checkboxes = checkbox_stats(prd_path)
+            done_by_checkboxes = total_checkboxes > 0 and unchecked == 0
 
         should_stop, completion_msg = should_stop_for_completion(
             done_by_checkboxes, done_by_codex, has_findings, tasks_left
@@ -441,12 +495,14 @@ Apply targeted changes, commit frequently, and re-run the QA gates until green.
                     "skipped_review_streak": skipped_review_streak,
                     "qa_context_shared": qa_context_shared,
                     "last_head_sha": head_after_iteration,
-                    "last_status_snapshot": list(status_after_iteration),
+                    "last_status_snapshot": sorted(status_after_iteration),
                     "fix_pass_failed": fix_pass_failed,
                 },
             )
-            save_checkpoint(checkpoint)
-            logger.debug("Saved checkpoint at iteration %d", i)
+            # Written in the background while the next iteration's runner starts;
+            # the next synchronous save_checkpoint() waits for it.
+            save_checkpoint_async(checkpoint)
+            logger.debug("Queued checkpoint save at iteration %d", i)
 
         if not repo_changed_after_actions:
             if should_stop:
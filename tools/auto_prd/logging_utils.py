@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import builtins
+import contextvars
 import io
 import logging
+import os
+import stat
 import sys
 import threading
 from pathlib import Path
@@ -23,6 +26,11 @@ USER_LOG_LEVEL = logging.INFO
 ORIGINAL_PRINT = builtins.print
 PRINT_HOOK_INSTALLED = False
 PRINT_HOOK_LOCK = threading.Lock()
+# Set while tee_print is handing a record to logging, so a handler that prints
+# goes straight to the real print instead of back through the hook.
+_IN_TEE_PRINT: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "_in_tee_print", default=False
+)
 SETUP_LOCK = threading.Lock()
 
 
@@ -39,14 +47,21 @@ def resolve_log_level(level_name: str) -> int:
     )
 
 
+def _ensure_mode(path: Path, mode: int) -> None:
+    """chmod ``path`` to ``mode`` unless it already has exactly those bits."""
+    try:
+        if stat.S_IMODE(path.stat().st_mode) == mode:
+            return
+        path.chmod(mode)
+    except Exception:  # pragma: no cover - permissions vary by platform
+        logger.debug("Unable to enforce permissions on %s", path)
+
+
 def setup_file_logging(log_path: Path, level_name: str) -> None:
     global CURRENT_LOG_PATH, USER_LOG_LEVEL
     numeric_level = resolve_log_level(level_name)
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    try:
-        log_path.parent.chmod(0o700)
-    except Exception:  # pragma: no cover - permissions vary by platform
-        logger.debug("Unable to enforce permissions on %s", log_path.parent)
+    _ensure_mode(log_path.parent, 0o700)
 
     with SETUP_LOCK:
         USER_LOG_LEVEL = numeric_level
@@ -78,11 +93,11 @@ def setup_file_logging(log_path: Path, level_name: str) -> None:
         root_logger.addHandler(file_handler)
         CURRENT_LOG_PATH = log_path
         logger.setLevel(numeric_level)
+        # The print hook asks this logger whether a print is worth formatting,
+        # so it has to follow the user's level rather than stay at INFO.
+        logging.getLogger(PRINT_LOGGER_NAME).setLevel(numeric_level)
 
-    try:
-        log_path.chmod(0o600)
-    except Exception:  # pragma: no cover - permissions vary by platform
-        logger.debug("Unable to enforce permissions on %s", log_path)
+    _ensure_mode(log_path, 0o600)
 
     install_print_logger()
 
@@ -100,8 +115,6 @@ def format_print_message(*args, **kwargs) -> str:
 
 def ensure_line_buffering() -> None:
     """Ensure stdout/stderr are line-buffered when piped to prevent stalls."""
-    import os
-
     # Set PYTHONUNBUFFERED early for maximum effect
     os.environ["PYTHONUNBUFFERED"] = "1"
 
@@ -150,44 +163,72 @@ def install_print_logger() -> None:
         ensure_line_buffering()
 
         print_logger = logging.getLogger(PRINT_LOGGER_NAME)
-        print_logger.setLevel(logging.INFO)
+        print_logger.setLevel(USER_LOG_LEVEL)
+
+        # Resolved once: tee_print runs for every print in the process.
+        try:
+            stderr_fd: int | None = sys.stderr.fileno()
+        except (AttributeError, ValueError, io.UnsupportedOperation):
+            stderr_fd = None
+        try:
+            stdout_is_tty = sys.stdout.isatty()
+        except (AttributeError, ValueError):
+            stdout_is_tty = False
+
+        def is_stderr_stream(stream) -> bool:
+            if stream is sys.stderr or stream is getattr(sys, "__stderr__", None):
+                return True
+            if stderr_fd is None:
+                return False
+            try:
+                return stream.fileno() == stderr_fd
+            except (AttributeError, ValueError, io.UnsupportedOperation):
+                return False
 
         def tee_print(*args, **kwargs):
-            message = format_print_message(*args, **kwargs)
-            if message:
-                stream = kwargs.get("file") or sys.stdout
-                is_stderr = False
-                try:
-                    is_stderr = stream.fileno() == sys.stderr.fileno()
-                except (AttributeError, ValueError, io.UnsupportedOperation):
-                    is_stderr = stream is sys.stderr or stream is getattr(
-                        sys, "__stderr__", None
-                    )
-                target_level = logging.WARNING if is_stderr else logging.INFO
+            if _IN_TEE_PRINT.get():
+                ORIGINAL_PRINT(*args, **kwargs)
+                return
+            stream = kwargs.get("file") or sys.stdout
+            # Only classify the stream, and stringify and join the arguments,
+            # when the record will be kept; with the level above WARNING this
+            # hook reduces to the flush decision below.
+            if print_logger.isEnabledFor(logging.INFO):
+                target_level = (
+                    logging.WARNING if is_stderr_stream(stream) else logging.INFO
+                )
+            elif print_logger.isEnabledFor(logging.WARNING) and is_stderr_stream(
+                stream
+            ):
+                target_level = logging.WARNING
+            else:
+                target_level = None
+            if target_level is not None:
+                message = format_print_message(*args, **kwargs)
                 log_message = message[:-1] if message.endswith("\n") else message
                 if log_message:
                     # Logging already appends its own newline, so trim the print newline to avoid doubles.
-                    print_logger.log(target_level, log_message)
-
-            # Force flush=True for all output to prevent buffering stalls.
-            # Python switches to block buffering for stdout when output is piped (as opposed to line buffering for terminals),
-            # so setting flush=True ensures immediate output regardless of buffering mode.
-            # Unbuffered mode is enabled via PYTHONUNBUFFERED=1 or the -u flag; setting flush=True provides additional
-            # assurance for immediate output, especially for critical messages.
-            kwargs["flush"] = True
+                    token = _IN_TEE_PRINT.set(True)
+                    try:
+                        print_logger.log(target_level, log_message)
+                    finally:
+                        _IN_TEE_PRINT.reset(token)
+
+            # Force flush=True to prevent buffering stalls: Python block-buffers stdout
+            # when it is piped, so flushing keeps output immediate regardless of
+            # buffering mode. A terminal stdout is already line-buffered, so a print
+            # that ends its line there is flushed without the extra call.
+            end = kwargs.get("end")
+            if not (
+                stdout_is_tty
+                and stream is sys.stdout
+                and (end is None or end.endswith("\n"))
+            ):
+                kwargs["flush"] = True
 
-            # Call original print
+            # Call original print; print(flush=True) flushes the stream itself.
             ORIGINAL_PRINT(*args, **kwargs)
 
-            # Additional explicit flush of the target stream for maximum reliability
-            try:
-                stream = kwargs.get("file") or sys.stdout
-                if hasattr(stream, "flush"):
-                    stream.flush()
-            except Exception as exc:
-                # Log flush errors at debug level for troubleshooting
-                logger.debug("Failed to flush stream: %s", exc)
-
         builtins.print = tee_print
         PRINT_HOOK_INSTALLED = True
 
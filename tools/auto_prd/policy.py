@@ -6,14 +6,17 @@ import os
 import subprocess
 import threading
 from collections.abc import Callable
+from functools import cache
 
 from .agents import claude_exec, codex_exec
+from .command import run_cmd
+from .constants import COMMAND_VERIFICATION_TIMEOUT_SECONDS
 from .logging_utils import logger
 
 EXECUTOR_CHOICES = {"codex-first", "codex-only", "claude-only"}
 EXECUTOR_POLICY_DEFAULT = "codex-first"
 EXECUTOR_POLICY = os.getenv("AUTO_PRD_EXECUTOR_POLICY") or EXECUTOR_POLICY_DEFAULT
-_EXECUTOR_POLICY_LOCK = threading.RLock()
+_EXECUTOR_POLICY_LOCK = threading.Lock()
 
 FALLBACK_POLICIES = {"codex-first": "codex-only"}
 
@@ -40,15 +43,19 @@ def get_fallback_policy(policy: str) -> str | None:
     return FALLBACK_POLICIES.get(policy)
 
 
+_CORE_DEPS = ("coderabbit", "git", "gh")
+_REQUIRED_BY_POLICY = {
+    "codex-first": (*_CORE_DEPS, "codex", "claude"),
+    "codex-only": (*_CORE_DEPS, "codex"),
+    "claude-only": (*_CORE_DEPS, "claude"),
+}
+
+
 def build_required_list(policy: str) -> list[str]:
-    core_deps = ["coderabbit", "git", "gh"]
-    if policy == "codex-first":
-        return [*core_deps, "codex", "claude"]
-    if policy == "codex-only":
-        return [*core_deps, "codex"]
-    if policy == "claude-only":
-        return [*core_deps, "claude"]
-    raise ValueError(f"Unknown executor policy: {policy}")
+    try:
+        return list(_REQUIRED_BY_POLICY[policy])
+    except KeyError:
+        raise ValueError(f"Unknown executor policy: {policy}") from None
 
 
 def set_executor_policy(value: str) -> None:
@@ -61,8 +68,14 @@ def set_executor_policy(value: str) -> None:
 
 
 def get_executor_policy() -> str:
-    with _EXECUTOR_POLICY_LOCK:
-        return EXECUTOR_POLICY
+    # Writers hold the lock; reading the module global is a single atomic load.
+    return EXECUTOR_POLICY
+
+
+@cache
+def _executor_override(env_key: str) -> str:
+    """Read a per-phase executor override once; the environment is set at launch."""
+    return (os.getenv(env_key) or "").strip().lower()
 
 
 def policy_runner(
@@ -84,7 +97,7 @@ def policy_runner(
     }
     override_key = env_key_map.get(phase)
     if override_key:
-        override = (os.getenv(override_key) or "").strip().lower()
+        override = _executor_override(override_key)
         if override in ("codex", "claude"):
             return (
                 (codex_exec, "Codex")
@@ -114,6 +127,42 @@ def policy_runner(
     return claude_exec, "Claude"
 
 
+_RUNNER_BINARIES: dict[Callable[..., tuple[str, str]], str] = {
+    codex_exec: "codex",
+    claude_exec: "claude",
+}
+
+
+def _run_warmup(binary: str) -> None:
+    try:
+        run_cmd(
+            [binary, "--version"],
+            check=False,
+            timeout=COMMAND_VERIFICATION_TIMEOUT_SECONDS,
+            log_stdout=False,
+        )
+    except (OSError, subprocess.SubprocessError) as exc:
+        logger.debug("Warmup of %s failed: %s", binary, exc)
+
+
+def warm_runner(runner: Callable[..., tuple[str, str]]) -> threading.Thread | None:
+    """Launch the runner's CLI once in the background to warm its start-up path.
+
+    The executors spawn a fresh CLI process per call, so there is no connection
+    to keep open; a throwaway ``--version`` run pulls the binary and its runtime
+    into the OS page cache while the caller is busy with something else.
+    Returns the warmup thread, or ``None`` for runners without a known CLI.
+    """
+    binary = _RUNNER_BINARIES.get(runner)
+    if binary is None:
+        return None
+    thread = threading.Thread(
+        target=_run_warmup, args=(binary,), name=f"warmup-{binary}", daemon=True
+    )
+    thread.start()
+    return thread
+
+
 def policy_fallback_runner(
     command_name: str,
     policy: str,
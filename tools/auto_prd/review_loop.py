@@ -25,6 +25,7 @@ from .constants import (
 )
 from .gh_ops import (
     acknowledge_review_items,
+    format_feedback_summary,
     get_unresolved_feedback,
     should_stop_review_after_push,
     trigger_copilot,
@@ -53,6 +54,14 @@ MAX_CONSECUTIVE_FAILURES = 3
 # ~200-400 chars depending on item count, keeping total context injection under ~3KB.
 MAX_COMPACTED_HISTORY = 5
 
+# Upper bound on processed review comment IDs kept in memory and in the checkpoint.
+# Long-running review loops (--infinite-reviews) would otherwise grow this set without
+# limit. GitHub databaseIds increase monotonically, so trimming the smallest IDs drops
+# the oldest comments first; those threads have already been resolved and no longer
+# appear in get_unresolved_feedback() results, so forgetting them cannot cause
+# duplicate acknowledgements.
+MAX_PROCESSED_COMMENT_IDS = 5000
+
 # Bounded FIFO cache for deduplicating warnings about malformed comment entries.
 # Prevents log spam when the same malformed comment appears in every poll cycle.
 #
@@ -181,6 +190,18 @@ _JITTER_RNG = random.Random()
 _JITTER_RNG.seed()  # Uses current time by default for variety
 
 
+def _trim_processed_comment_ids(
+    processed_ids: set[int], limit: int = MAX_PROCESSED_COMMENT_IDS
+) -> None:
+    """Drop the oldest (smallest) comment IDs in place so at most ``limit`` remain."""
+    excess = len(processed_ids) - limit
+    if excess <= 0:
+        return
+    for comment_id in sorted(processed_ids)[:excess]:
+        processed_ids.discard(comment_id)
+    logger.debug("Trimmed %d oldest processed comment IDs (limit %d)", excess, limit)
+
+
 def _decode_stderr(stderr: bytes | str | None) -> str:
     """Decode stderr from CalledProcessError to string."""
     if not stderr:
@@ -443,6 +464,7 @@ def review_fix_loop(
                 flush=True,
             )
         processed_comment_ids = valid_ids
+        _trim_processed_comment_ids(processed_comment_ids)
     else:
         logger.error(
             "Checkpoint 'processed_comment_ids' has invalid type %s; data corruption detected. "
@@ -832,6 +854,7 @@ After pushing, print: REVIEW_FIXES_PUSHED=YES
             acknowledge_review_items(
                 owner_repo, pr_number, unresolved, processed_comment_ids
             )
+            _trim_processed_comment_ids(processed_comment_ids)
 
             # Add compact summary for context continuity in future iterations.
             # This summary is created AFTER the fix attempt completes (actual_runner returned
@@ -849,7 +872,7 @@ After pushing, print: REVIEW_FIXES_PUSHED=YES
             #      useless in the examples list
             summary_items: list[str] = []
             for item in unresolved[:3]:
-                summary = item.get("summary")
+                summary = format_feedback_summary(item)
                 if isinstance(summary, str) and summary:
                     summary_items.append(summary[:100])
             # Handle empty summary_items gracefully - omit Examples section if none exist
@@ -914,7 +937,7 @@ After pushing, print: REVIEW_FIXES_PUSHED=YES
 def format_unresolved_bullets(unresolved: list[dict], limit: int) -> str:
     lines: list[str] = []
     for entry in unresolved:
-        summary = entry.get("summary")
+        summary = format_feedback_summary(entry)
         if not isinstance(summary, str):
             # Use module-level bounded FIFO cache to track which comment_ids have been warned
             # about. This prevents duplicate warnings when the same malformed entry appears
@@ -949,7 +972,7 @@ def format_unresolved_bullets(unresolved: list[dict], limit: int) -> str:
                 logger.warning(
                     "Skipping unresolved entry with invalid summary type: comment_id=%s, type=%s",
                     comment_id,
-                    type(summary).__name__,
+                    type(entry.get("summary", entry.get("body"))).__name__,
                 )
             else:
                 # Already warned about this comment_id; log at DEBUG to avoid spam.
@@ -957,7 +980,7 @@ def format_unresolved_bullets(unresolved: list[dict], limit: int) -> str:
                 logger.debug(
                     "Skipping previously-warned malformed entry: comment_id=%s, type=%s",
                     comment_id,
-                    type(summary).__name__,
+                    type(entry.get("summary", entry.get("body"))).__name__,
                 )
             continue
         lines.append(f"* {summary.strip()}")
@@ -26,6 +26,7 @@ from .git_ops import (
     git_current_branch,
     git_has_staged_changes,
     git_head_sha,
+    invalidate_branch_refs,
 )
 from .logging_utils import logger
 from .tracker_generator import load_tracker, save_tracker
@@ -473,6 +474,7 @@ def rollback_to_checkpoint(
             cwd=repo_root,
             check=True,
         )
+        invalidate_branch_refs()
         logger.info("Created backup branch: %s", backup_branch)
     except subprocess.CalledProcessError as e:
         result.warnings.append(f"Could not create backup branch: {e}")
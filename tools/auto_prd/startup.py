@@ -17,6 +17,7 @@ This ensures consistent state before any work begins.
 from __future__ import annotations
 
 import os
+import shutil
 import subprocess
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -24,7 +25,7 @@ from typing import Any, ClassVar
 
 from .checkpoint import prd_changed_since_checkpoint
 from .command import run_cmd
-from .git_ops import git_current_branch, git_head_sha, git_root, git_status_snapshot
+from .git_ops import git_rev_parse_bundle, git_root, git_status_snapshot
 from .logging_utils import logger
 from .tracker_generator import (
     compute_prd_hash,
@@ -235,18 +236,17 @@ class SessionStartup:
         details: dict[str, Any] = {}
 
         try:
-            # Get current branch
-            current_branch = git_current_branch(self.repo_root)
+            # Get current branch and HEAD SHA in one rev-parse
+            rev_info = git_rev_parse_bundle(self.repo_root)
+            current_branch = rev_info.branch
             details["current_branch"] = current_branch
-
-            # Get HEAD SHA
-            head_sha = git_head_sha(self.repo_root)
+            head_sha = rev_info.head_sha
             details["head_sha"] = head_sha
 
             # Get working directory status
             status = git_status_snapshot(self.repo_root)
             details["dirty_files"] = len(status)
-            details["status_snapshot"] = list(status)[:10]  # Limit for readability
+            details["status_snapshot"] = sorted(status)[:10]  # Limit for readability
 
             # Check for uncommitted changes
             if status and self.require_clean:
@@ -541,12 +541,8 @@ class SessionStartup:
         )
 
     def _command_exists(self, cmd: str) -> bool:
-        """Check if a command exists in PATH."""
-        try:
-            run_cmd(["which", cmd], cwd=self.repo_root, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        """Check if a command exists in PATH (looked up in-process)."""
+        return shutil.which(cmd) is not None
 
 
 def run_startup(
@@ -28,6 +28,11 @@ create_checkpoint = safe_import(
 load_checkpoint = safe_import(
     "tools.auto_prd.checkpoint", "..checkpoint", "load_checkpoint"
 )
+save_checkpoint_async, flush_checkpoint_saves = safe_import(
+    "tools.auto_prd.checkpoint",
+    "..checkpoint",
+    ["save_checkpoint_async", "flush_checkpoint_saves"],
+)
 
 
 class CheckpointPermissionTests(TestCase):
@@ -250,6 +255,52 @@ class CheckpointPermissionTests(TestCase):
             self.assertIn("updated_at", loaded)  # Should be added by save_checkpoint
 
 
+class AsyncCheckpointSaveTests(TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.sessions_dir = Path(tmp.name)
+        patcher = mock.patch(
+            "tools.auto_prd.checkpoint.get_sessions_dir",
+            return_value=self.sessions_dir,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_async_save_matches_sync_file_and_snapshots_the_dict(self) -> None:
+        checkpoint = {"session_id": "async-1", "version": 1, "phases": {"n": 1}}
+        save_checkpoint_async(checkpoint)
+        checkpoint["phases"]["n"] = 2  # mutation after submit is not written
+        flush_checkpoint_saves()
+
+        path = self.sessions_dir / "async-1.json"
+        written = json.loads(path.read_text())
+        self.assertEqual(written["phases"], {"n": 1})
+        self.assertEqual(stat.S_IMODE(path.stat().st_mode), 0o600)
+        self.assertEqual(list(self.sessions_dir.glob("*.tmp")), [])
+
+    def test_sync_save_lands_after_queued_async_saves(self) -> None:
+        checkpoint = {"session_id": "async-2", "version": 1, "status": "in_progress"}
+        for _ in range(5):
+            save_checkpoint_async(checkpoint)
+        checkpoint["status"] = "failed"
+        save_checkpoint(checkpoint)
+        flush_checkpoint_saves()
+
+        written = json.loads((self.sessions_dir / "async-2.json").read_text())
+        self.assertEqual(written["status"], "failed")
+
+    def test_flush_reports_background_failure(self) -> None:
+        with mock.patch(
+            "tools.auto_prd.checkpoint.tempfile.mkstemp",
+            side_effect=OSError("disk full"),
+        ):
+            save_checkpoint_async({"session_id": "async-3", "version": 1})
+            with self.assertRaises(OSError):
+                flush_checkpoint_saves()
+        flush_checkpoint_saves()  # the error is reported once
+
+
 class CheckpointLoadTests(TestCase):
     """Test suite for loading checkpoints with proper permissions."""
 
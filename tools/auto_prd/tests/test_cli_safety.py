@@ -122,6 +122,40 @@ class RunCmdTests(TestCase):
     def setUp(self):
         register_safe_cwd(Path(__file__).parent)
 
+    @mock.patch("tools.auto_prd.command.subprocess.run")
+    @mock.patch("tools.auto_prd.command.env_with_zsh", return_value={})
+    @mock.patch("tools.auto_prd.command.shutil.which", return_value="/usr/bin/git")
+    def test_timeout_exit_code_returns_partial_output(
+        self, _mock_which, _mock_env_with_zsh, mock_run
+    ) -> None:
+        mock_run.side_effect = subprocess.TimeoutExpired(
+            ["git", "fetch"], 5, output=b"partial", stderr=b"slow"
+        )
+
+        stdout, stderr, code = run_cmd(
+            ["git", "fetch"], check=False, timeout=5, timeout_exit_code=124
+        )
+
+        self.assertEqual((stdout, stderr, code), ("partial", "slow", 124))
+
+    @mock.patch("tools.auto_prd.command.subprocess.run")
+    @mock.patch("tools.auto_prd.command.env_with_zsh", return_value={})
+    @mock.patch("tools.auto_prd.command.shutil.which", return_value="/usr/bin/git")
+    def test_discard_stdout_sends_stdout_to_devnull(
+        self, _mock_which, _mock_env_with_zsh, mock_run
+    ) -> None:
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=["git"], returncode=1, stdout=None, stderr=b""
+        )
+
+        stdout, _, code = run_cmd(
+            ["git", "diff", "--quiet"], check=False, discard_stdout=True
+        )
+
+        self.assertEqual((stdout, code), ("", 1))
+        self.assertIs(mock_run.call_args.kwargs["stdout"], subprocess.DEVNULL)
+        self.assertIs(mock_run.call_args.kwargs["stderr"], subprocess.PIPE)
+
     @mock.patch("tools.auto_prd.command.subprocess.run")
     @mock.patch("tools.auto_prd.command.env_with_zsh", return_value={})
     @mock.patch("tools.auto_prd.command.shutil.which", return_value="/usr/bin/gh")
@@ -147,6 +181,53 @@ class RunCmdTests(TestCase):
         self.assertEqual(executed_cmd[body_index], "contains 'code'")
         self.assertNotIn("`", executed_cmd[body_index])
 
+    @mock.patch("tools.auto_prd.command.subprocess.run")
+    @mock.patch("tools.auto_prd.command.env_with_zsh", return_value={})
+    @mock.patch("tools.auto_prd.command.shutil.which", return_value="/usr/bin/gh")
+    def test_binary_mode_returns_raw_stdout_bytes(
+        self, _mock_which, _mock_env_with_zsh, mock_run
+    ) -> None:
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=["gh"],
+            returncode=0,
+            stdout=b'{"data": {}}',
+            stderr=b"warning",
+        )
+
+        stdout, stderr, code = run_cmd(["gh", "api", "graphql"], binary=True)
+
+        self.assertEqual(stdout, b'{"data": {}}')
+        self.assertEqual(stderr, "warning")
+        self.assertEqual(code, 0)
+
+    @mock.patch("tools.auto_prd.command.time.sleep")
+    @mock.patch("tools.auto_prd.command.subprocess.run")
+    @mock.patch("tools.auto_prd.command.env_with_zsh", return_value={})
+    @mock.patch("tools.auto_prd.command.shutil.which", return_value="/usr/bin/git")
+    def test_retries_when_stderr_matches_transient_pattern(
+        self, _mock_which, _mock_env_with_zsh, mock_run, _mock_sleep
+    ) -> None:
+        mock_run.side_effect = [
+            subprocess.CompletedProcess(
+                args=["git"],
+                returncode=1,
+                stdout=b"",
+                stderr=b"fatal: the remote end hung up unexpectedly",
+            ),
+            subprocess.CompletedProcess(
+                args=["git"], returncode=0, stdout=b"ok", stderr=b""
+            ),
+        ]
+
+        stdout, _, code = run_cmd(
+            ["git", "fetch", "origin"],
+            retries=1,
+            retry_on_stderr=["Connection refused", "remote end hung up"],
+        )
+
+        self.assertEqual((stdout, code), ("ok", 0))
+        self.assertEqual(mock_run.call_count, 2)
+
 
 class OpenOrGetPrTests(TestCase):
     def setUp(self):
@@ -4,10 +4,12 @@ This module tests that the executor resolution for tracker generation
 correctly maps policy strings to executor names.
 """
 
+import os
 import unittest
 from unittest.mock import patch
 
-from auto_prd.policy import policy_runner
+from auto_prd import policy as policy_mod
+from auto_prd.policy import policy_runner, warm_runner
 
 
 class PolicyRunnerExecutorResolutionTests(unittest.TestCase):
@@ -69,6 +71,83 @@ class PolicyRunnerExecutorResolutionTests(unittest.TestCase):
                 )
 
 
+class PolicyRunnerOverrideTests(unittest.TestCase):
+    """Tests for per-phase executor overrides from the environment."""
+
+    def setUp(self) -> None:
+        policy_mod._executor_override.cache_clear()
+        self.addCleanup(policy_mod._executor_override.cache_clear)
+
+    def test_phase_override_is_read_once(self) -> None:
+        """The override env var should be honoured and then served from cache."""
+        with patch.dict(os.environ, {"AUTO_PRD_EXECUTOR_IMPLEMENT": " Claude "}):
+            _, label = policy_runner("codex-only", i=1, phase="implement")
+        self.assertEqual(label, "Claude")
+
+        with patch.dict(os.environ, {"AUTO_PRD_EXECUTOR_IMPLEMENT": "codex"}):
+            _, label = policy_runner("codex-only", i=1, phase="implement")
+        self.assertEqual(label, "Claude")
+
+
+class BuildRequiredListTests(unittest.TestCase):
+    """Tests for the commands each executor policy requires."""
+
+    def test_required_commands_per_policy(self) -> None:
+        """Each policy should require the core tools plus its executors."""
+        core = ["coderabbit", "git", "gh"]
+        self.assertEqual(
+            policy_mod.build_required_list("codex-first"), [*core, "codex", "claude"]
+        )
+        self.assertEqual(policy_mod.build_required_list("codex-only"), [*core, "codex"])
+        self.assertEqual(
+            policy_mod.build_required_list("claude-only"), [*core, "claude"]
+        )
+
+    def test_returned_list_is_a_fresh_copy(self) -> None:
+        """Mutating a result must not leak into later calls."""
+        policy_mod.build_required_list("codex-only").append("extra")
+        self.assertNotIn("extra", policy_mod.build_required_list("codex-only"))
+
+    def test_unknown_policy_raises(self) -> None:
+        """Unknown policies should still raise ValueError."""
+        with self.assertRaises(ValueError):
+            policy_mod.build_required_list("bogus")
+
+
+class WarmRunnerTests(unittest.TestCase):
+    """Tests for background warmup of runner CLIs."""
+
+    def test_warmup_runs_the_runner_cli_version_off_thread(self) -> None:
+        """Each known runner should launch its own CLI with --version."""
+        for runner, binary in (
+            (policy_mod.codex_exec, "codex"),
+            (policy_mod.claude_exec, "claude"),
+        ):
+            with (
+                self.subTest(binary=binary),
+                patch.object(policy_mod, "run_cmd") as run_cmd,
+            ):
+                thread = warm_runner(runner)
+                self.assertIsNotNone(thread)
+                thread.join(timeout=5)
+                self.assertEqual(run_cmd.call_args.args[0], [binary, "--version"])
+
+    def test_warmup_failures_are_swallowed(self) -> None:
+        """A missing CLI should not surface from the warmup thread."""
+        with patch.object(
+            policy_mod, "run_cmd", side_effect=FileNotFoundError("codex")
+        ):
+            thread = warm_runner(policy_mod.codex_exec)
+            thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+
+    def test_unknown_runner_is_not_warmed(self) -> None:
+        """Runners without a known CLI should be ignored."""
+        with patch.object(policy_mod, "run_cmd") as run_cmd:
+            self.assertIsNone(warm_runner(policy_mod.policy_runner))
+        run_cmd.assert_not_called()
+
+
 class TrackerExecutorResolutionIntegrationTests(unittest.TestCase):
     """Integration tests to verify the bug fix for codex-first policy."""
 
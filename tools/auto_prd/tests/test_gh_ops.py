@@ -0,0 +1,650 @@
+import json
+import subprocess
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import TestCase, main, mock
+
+try:
+    from tools.auto_prd import gh_ops
+except ImportError:
+    from .. import gh_ops
+
+
+class ParseIso8601Tests(TestCase):
+    def test_parses_zulu_suffix_with_stdlib_fallback(self) -> None:
+        with mock.patch.object(gh_ops, "HAS_CISO8601", False):
+            parsed = gh_ops._parse_iso8601("2025-10-27T14:12:49Z")
+        self.assertEqual(
+            parsed, datetime(2025, 10, 27, 14, 12, 49, tzinfo=timezone.utc)
+        )
+
+    def test_parses_offset_timestamp(self) -> None:
+        parsed = gh_ops._parse_iso8601(" 2025-10-27T16:12:49+02:00 ")
+        self.assertIsNotNone(parsed)
+        self.assertEqual(
+            parsed, datetime(2025, 10, 27, 14, 12, 49, tzinfo=timezone.utc)
+        )
+
+    def test_returns_none_for_blank_or_invalid_values(self) -> None:
+        self.assertIsNone(gh_ops._parse_iso8601(None))
+        self.assertIsNone(gh_ops._parse_iso8601("   "))
+        self.assertIsNone(gh_ops._parse_iso8601("not-a-timestamp"))
+
+
+class GraphqlPayloadTests(TestCase):
+    def test_minifies_query_and_serializes_variables(self) -> None:
+        payload = gh_ops._graphql_payload(
+            gh_ops.RESOLVE_REVIEW_THREAD_MUTATION, {"threadId": "T_1"}
+        )
+        self.assertEqual(
+            json.loads(payload),
+            {
+                "query": "mutation($threadId:ID!){resolveReviewThread("
+                "input:{threadId:$threadId}){thread{id isResolved}}}",
+                "variables": {"threadId": "T_1"},
+            },
+        )
+
+    def test_stdlib_and_orjson_encodings_agree(self) -> None:
+        variables = {"body": 'Fix ✅ "quoted"\n', "id": 7, "cursor": None}
+        with mock.patch.object(gh_ops, "HAS_ORJSON", False):
+            stdlib = gh_ops._graphql_payload("query{a}", variables)
+        self.assertEqual(json.loads(stdlib)["variables"], variables)
+        if gh_ops.HAS_ORJSON:
+            fast = gh_ops._graphql_payload("query{a}", variables)
+            self.assertEqual(json.loads(fast), json.loads(stdlib))
+
+    def test_keeps_inline_fragment_spacing(self) -> None:
+        minified = gh_ops._minify_graphql(gh_ops.COMMIT_STATUS_ROLLUP_QUERY)
+        self.assertNotIn("\n", minified)
+        self.assertIn("... on CheckRun{name conclusion}", minified)
+
+
+class CollectCommitStatusContextsTests(TestCase):
+    def test_maps_fields_per_typename(self) -> None:
+        nodes = [
+            {"__typename": "CheckRun", "name": "ci", "conclusion": "SUCCESS"},
+            {"__typename": "StatusContext", "context": "CodeRabbit", "state": "OK"},
+            {"__typename": "Other", "name": "misc", "state": "PENDING"},
+            "garbage",
+        ]
+        response = {
+            "data": {
+                "repository": {
+                    "object": {"statusCheckRollup": {"contexts": {"nodes": nodes}}}
+                }
+            }
+        }
+        with mock.patch.object(gh_ops, "gh_graphql", return_value=response):
+            contexts = gh_ops._collect_commit_status_contexts("octo/repo", "abc")
+
+        self.assertEqual(
+            [(c["__typename"], c["name"], c["state"]) for c in contexts],
+            [
+                ("CheckRun", "ci", "SUCCESS"),
+                ("StatusContext", "CodeRabbit", "OK"),
+                ("Other", "misc", "PENDING"),
+            ],
+        )
+
+
+class GithubApiRequestTests(TestCase):
+    def setUp(self) -> None:
+        gh_ops.invalidate_graphql_cache()
+        self.addCleanup(gh_ops.invalidate_graphql_cache)
+
+    def _response(self, status_code: int, content: bytes, headers=None):
+        return mock.Mock(
+            status_code=status_code,
+            reason_phrase="Forbidden" if status_code >= 400 else "OK",
+            content=content,
+            text=content.decode(),
+            headers=headers or {},
+        )
+
+    def test_returns_none_without_client(self) -> None:
+        with mock.patch.object(gh_ops, "_http_client", return_value=None):
+            self.assertIsNone(
+                gh_ops._github_api_request("POST", "/graphql", "{}", timeout=5)
+            )
+
+    def test_gh_graphql_prefers_http_client(self) -> None:
+        client = mock.Mock()
+        client.request.return_value = self._response(200, b'{"data": {"ok": true}}')
+        with (
+            mock.patch.object(gh_ops, "_http_client", return_value=client),
+            mock.patch.object(gh_ops, "run_cmd") as mock_run_cmd,
+        ):
+            result = gh_ops.gh_graphql("query{viewer{login}}", {})
+
+        self.assertEqual(result, {"data": {"ok": True}})
+        mock_run_cmd.assert_not_called()
+        method, path = client.request.call_args.args
+        self.assertEqual((method, path), ("POST", "/graphql"))
+
+    def test_error_status_raises_gh_style_called_process_error(self) -> None:
+        client = mock.Mock()
+        client.request.return_value = self._response(
+            403, b"secondary rate limit", headers={"Retry-After": "12"}
+        )
+        with mock.patch.object(gh_ops, "_http_client", return_value=client):
+            with self.assertRaises(subprocess.CalledProcessError) as ctx:
+                gh_ops._github_api_request("POST", "/graphql", "{}", timeout=5)
+
+        self.assertIn("HTTP 403", ctx.exception.stderr)
+        self.assertIn("Retry-After: 12", ctx.exception.stderr)
+
+    def _sleeps_for_403(self, headers: dict[str, str]) -> list[float]:
+        client = mock.Mock()
+        client.request.return_value = self._response(
+            403, b"Resource not accessible", headers=headers
+        )
+        with (
+            mock.patch.object(gh_ops, "_http_client", return_value=client),
+            mock.patch("time.sleep") as mock_sleep,
+        ):
+            with self.assertRaises(subprocess.CalledProcessError):
+                gh_ops.call_with_backoff(
+                    lambda: gh_ops._github_api_request(
+                        "GET", "/repos/o/r", "", timeout=5
+                    )
+                )
+        return [c.args[0] for c in mock_sleep.call_args_list]
+
+    def test_reset_header_is_ignored_while_quota_remains(self) -> None:
+        reset = str(int(time.time()) + 600)
+        sleeps = self._sleeps_for_403(
+            {"X-RateLimit-Reset": reset, "X-RateLimit-Remaining": "4999"}
+        )
+        self.assertTrue(sleeps)
+        self.assertLess(max(sleeps), 10)
+
+    def test_reset_header_is_honored_once_quota_is_exhausted(self) -> None:
+        reset = str(int(time.time()) + 600)
+        sleeps = self._sleeps_for_403(
+            {"X-RateLimit-Reset": reset, "X-RateLimit-Remaining": "0"}
+        )
+        self.assertGreater(min(sleeps), 500)
+
+
+class BranchHasCommitsSinceTests(TestCase):
+    def test_checks_for_a_single_commit_in_range(self) -> None:
+        with mock.patch.object(
+            gh_ops, "run_cmd", side_effect=[(b"abc123\n", "", 0), (b"", "", 0)]
+        ) as mock_run_cmd:
+            self.assertTrue(gh_ops.branch_has_commits_since("main", Path("/repo")))
+            self.assertFalse(gh_ops.branch_has_commits_since("main", Path("/repo")))
+
+        cmd = mock_run_cmd.call_args.args[0]
+        self.assertEqual(cmd, ["git", "rev-list", "--max-count=1", "main..HEAD"])
+
+
+class PostFinalCommentTests(TestCase):
+    def test_async_mode_posts_on_a_background_thread(self) -> None:
+        with (
+            mock.patch.object(
+                gh_ops, "_github_api_request", return_value=b"{}"
+            ) as mock_request,
+            mock.patch("builtins.print"),
+        ):
+            thread = gh_ops.post_final_comment(
+                7, "octo/repo", Path("PRD.md"), Path("/repo"), async_mode=True
+            )
+            self.assertIsNotNone(thread)
+            thread.join(timeout=5)
+
+        self.assertFalse(thread.is_alive())
+        method, path, _payload = mock_request.call_args.args
+        self.assertEqual((method, path), ("POST", "/repos/octo/repo/issues/7/comments"))
+
+    def test_dry_run_returns_without_thread(self) -> None:
+        with mock.patch.object(gh_ops, "_github_api_request") as mock_request:
+            thread = gh_ops.post_final_comment(
+                7, "octo/repo", Path("PRD.md"), Path("/repo"), True, async_mode=True
+            )
+        self.assertIsNone(thread)
+        mock_request.assert_not_called()
+
+
+class HttpClientTests(TestCase):
+    def test_borrows_gh_auth_token_when_environment_has_none(self) -> None:
+        fake_httpx = mock.Mock()
+        with (
+            mock.patch.dict("os.environ", {"GH_TOKEN": "", "GITHUB_TOKEN": ""}),
+            mock.patch.object(gh_ops, "HAS_HTTPX", True),
+            mock.patch.object(gh_ops, "httpx", fake_httpx, create=True),
+            mock.patch.object(gh_ops, "_HTTP_CLIENT", None),
+            mock.patch.object(gh_ops, "_HTTP_CLIENT_INITIALIZED", False),
+            mock.patch.object(gh_ops.atexit, "register"),
+            mock.patch.object(gh_ops, "_gh_auth_token", return_value="gho_abc"),
+            mock.patch.object(gh_ops, "_github_host", return_value="github.com"),
+        ):
+            client = gh_ops._http_client()
+
+        self.assertIs(client, fake_httpx.Client.return_value)
+        headers = fake_httpx.Client.call_args.kwargs["headers"]
+        self.assertEqual(headers["Authorization"], "Bearer gho_abc")
+
+    def test_enterprise_hosts_use_the_gh_cli(self) -> None:
+        fake_httpx = mock.Mock()
+        with (
+            mock.patch.dict("os.environ", {"GH_HOST": "ghe.example.com"}),
+            mock.patch.object(gh_ops, "HAS_HTTPX", True),
+            mock.patch.object(gh_ops, "httpx", fake_httpx, create=True),
+            mock.patch.object(gh_ops, "_HTTP_CLIENT", None),
+            mock.patch.object(gh_ops, "_HTTP_CLIENT_INITIALIZED", False),
+            mock.patch.object(gh_ops, "_gh_auth_token") as mock_token,
+        ):
+            self.assertIsNone(gh_ops._http_client())
+
+        fake_httpx.Client.assert_not_called()
+        mock_token.assert_not_called()
+
+    def test_github_host_falls_back_to_origin_remote(self) -> None:
+        cases = {
+            "git@ghe.example.com:octo/repo.git": "ghe.example.com",
+            "ssh://git@GHE.example.com:2222/octo/repo": "ghe.example.com",
+            "https://github.com/octo/repo.git": "github.com",
+            "/srv/mirror/repo.git": "github.com",
+        }
+        for url, expected in cases.items():
+            with (
+                self.subTest(url=url),
+                mock.patch.dict("os.environ", {"GH_HOST": ""}),
+                mock.patch.object(gh_ops, "run_cmd", return_value=(url + "\n", "", 0)),
+            ):
+                self.assertEqual(gh_ops._github_host(), expected)
+
+    def test_gh_auth_token_is_not_logged(self) -> None:
+        with mock.patch.object(
+            gh_ops, "run_cmd", return_value=("gho_abc\n", "", 0)
+        ) as mock_run_cmd:
+            self.assertEqual(gh_ops._gh_auth_token(), "gho_abc")
+        self.assertIs(mock_run_cmd.call_args.kwargs["log_stdout"], False)
+
+
+class GhGraphqlCacheTests(TestCase):
+    def setUp(self) -> None:
+        gh_ops.invalidate_graphql_cache()
+        self.addCleanup(gh_ops.invalidate_graphql_cache)
+
+    def _run(self, env: dict[str, str], calls: int = 2) -> mock.Mock:
+        with (
+            mock.patch.dict("os.environ", env),
+            mock.patch.object(gh_ops, "_http_client", return_value=None),
+            mock.patch.object(
+                gh_ops, "run_cmd", return_value=(b'{"data": {}}', "", 0)
+            ) as mock_run_cmd,
+        ):
+            for _ in range(calls):
+                self.assertEqual(gh_ops.gh_graphql("query{a}", {"x": 1}), {"data": {}})
+        return mock_run_cmd
+
+    def test_identical_requests_within_ttl_hit_the_cache(self) -> None:
+        self.assertEqual(self._run({"AUTO_PRD_GQL_CACHE_TTL": "60"}).call_count, 1)
+
+    def test_zero_ttl_disables_the_cache(self) -> None:
+        self.assertEqual(self._run({"AUTO_PRD_GQL_CACHE_TTL": "0"}).call_count, 2)
+
+    def test_mutations_invalidate_cached_results(self) -> None:
+        self._run({"AUTO_PRD_GQL_CACHE_TTL": "60"}, calls=1)
+        with (
+            mock.patch.object(gh_ops, "_http_client", return_value=None),
+            mock.patch.object(gh_ops, "run_cmd", return_value=("", "", 0)),
+        ):
+            gh_ops.resolve_review_thread("T1")
+        self.assertEqual(self._run({"AUTO_PRD_GQL_CACHE_TTL": "60"}, 1).call_count, 1)
+
+
+def _threads_page(threads: list[dict]) -> dict:
+    return {
+        "data": {
+            "repository": {
+                "pullRequest": {
+                    "reviewThreads": {
+                        "nodes": threads,
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    }
+                }
+            }
+        }
+    }
+
+
+def _comments_block(comments: list[dict], next_cursor: str | None = None) -> dict:
+    return {
+        "comments": {
+            "nodes": comments,
+            "pageInfo": {
+                "hasNextPage": next_cursor is not None,
+                "endCursor": next_cursor,
+            },
+        }
+    }
+
+
+def _bot_comment(db_id: int, body: str = "Please fix") -> dict:
+    return {
+        "id": f"C{db_id}",
+        "author": {"login": "coderabbitai"},
+        "body": body,
+        "url": f"https://example.test/{db_id}",
+        "commit": {"oid": "abc123"},
+        "databaseId": db_id,
+    }
+
+
+class GetUnresolvedFeedbackTests(TestCase):
+    def setUp(self) -> None:
+        gh_ops._thread_comments_cache.clear()
+        gh_ops._resolved_thread_prefix.clear()
+        self.addCleanup(gh_ops._thread_comments_cache.clear)
+        self.addCleanup(gh_ops._resolved_thread_prefix.clear)
+
+    def test_fetches_comments_only_for_unresolved_bot_threads(self) -> None:
+        threads = [
+            {
+                "id": "resolved",
+                "isResolved": True,
+                "comments": {"nodes": [{"author": {"login": "coderabbitai"}}]},
+            },
+            {
+                "id": "human",
+                "isResolved": False,
+                "comments": {"nodes": [{"author": {"login": "octocat"}}]},
+            },
+            {
+                "id": "bot",
+                "isResolved": False,
+                "comments": {
+                    "nodes": [
+                        {"id": "C6", "author": {"login": "octocat"}},
+                        {"id": "C7", "author": {"login": "coderabbitai"}},
+                    ]
+                },
+            },
+        ]
+        calls: list[dict] = []
+
+        def fake_graphql(query, variables):
+            calls.append(variables)
+            if query is gh_ops.REVIEW_THREADS_QUERY:
+                return _threads_page(threads)
+            self.assertIs(query, gh_ops.COMMENT_NODES_QUERY)
+            self.assertEqual(variables, {"ids": ["C7"]})
+            return {"data": {"nodes": [_bot_comment(7)]}}
+
+        with mock.patch.object(gh_ops, "gh_graphql", side_effect=fake_graphql):
+            unresolved = gh_ops.get_unresolved_feedback("octo/repo", 1, "abc123")
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual([item["comment_id"] for item in unresolved], [7])
+        self.assertEqual(unresolved[0]["thread_id"], "bot")
+        self.assertEqual(
+            gh_ops.format_feedback_summary(unresolved[0]),
+            "- coderabbitai: Please fix\n  https://example.test/7",
+        )
+
+    def test_reuses_comments_for_unchanged_threads(self) -> None:
+        thread = {
+            "id": "bot",
+            "isResolved": False,
+            "comments": {
+                "totalCount": 1,
+                "nodes": [
+                    {
+                        "id": "C7",
+                        "author": {"login": "coderabbitai"},
+                        "updatedAt": "2025-10-27T14:12:49Z",
+                    }
+                ],
+            },
+        }
+        batch_calls: list[dict] = []
+
+        def fake_graphql(query, variables):
+            if query is gh_ops.REVIEW_THREADS_QUERY:
+                return _threads_page([thread])
+            batch_calls.append(variables)
+            return {"data": {"nodes": [_bot_comment(7)]}}
+
+        with mock.patch.object(gh_ops, "gh_graphql", side_effect=fake_graphql):
+            first = gh_ops.get_unresolved_feedback("octo/repo", 1)
+            second = gh_ops.get_unresolved_feedback("octo/repo", 1)
+            self.assertEqual(len(batch_calls), 1)
+            self.assertEqual(first, second)
+
+            thread["comments"]["totalCount"] = 2
+            gh_ops.get_unresolved_feedback("octo/repo", 1)
+        self.assertEqual(len(batch_calls), 2)
+
+    def test_paginates_threads_with_more_comments_than_the_listing(self) -> None:
+        thread = {
+            "id": "long",
+            "isResolved": False,
+            "comments": {
+                "nodes": [{"id": "C1", "author": {"login": "octocat"}}],
+                "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+            },
+        }
+
+        def fake_graphql(query, variables):
+            if query is gh_ops.REVIEW_THREADS_QUERY:
+                return _threads_page([thread])
+            self.assertEqual(variables, {"threadId0": "long", "cursor0": None})
+            return {"data": {"t0": _comments_block([_bot_comment(9)])}}
+
+        with mock.patch.object(gh_ops, "gh_graphql", side_effect=fake_graphql):
+            unresolved = gh_ops.get_unresolved_feedback("octo/repo", 1)
+
+        self.assertEqual([item["comment_id"] for item in unresolved], [9])
+
+    def test_refetches_threads_with_truncated_listings_on_every_poll(self) -> None:
+        thread = {
+            "id": "long",
+            "isResolved": False,
+            "comments": {
+                "totalCount": 30,
+                "nodes": [{"id": "C1", "author": {"login": "coderabbitai"}}],
+                "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+            },
+        }
+        bodies = iter(["Please fix", "Please fix (edited)"])
+
+        def fake_graphql(query, variables):
+            if query is gh_ops.REVIEW_THREADS_QUERY:
+                return _threads_page([thread])
+            return {"data": {"t0": _comments_block([_bot_comment(9, next(bodies))])}}
+
+        with mock.patch.object(gh_ops, "gh_graphql", side_effect=fake_graphql):
+            gh_ops.get_unresolved_feedback("octo/repo", 1)
+            unresolved = gh_ops.get_unresolved_feedback("octo/repo", 1)
+
+        self.assertEqual(unresolved[0]["body"], "Please fix (edited)")
+        self.assertNotIn("long", gh_ops._thread_comments_cache)
+
+    def test_skips_leading_pages_of_resolved_threads_on_later_polls(self) -> None:
+        resolved_page = _threads_page([{"id": "old", "isResolved": True}])
+        resolved_page["data"]["repository"]["pullRequest"]["reviewThreads"][
+            "pageInfo"
+        ] = {"hasNextPage": True, "endCursor": "page1"}
+        cursors: list[str | None] = []
+
+        def fake_graphql(query, variables):
+            cursors.append(variables["cursor"])
+            if variables["cursor"] is None:
+                return resolved_page
+            return _threads_page([{"id": "new", "isResolved": True}])
+
+        with mock.patch.object(gh_ops, "gh_graphql", side_effect=fake_graphql):
+            gh_ops.get_unresolved_feedback("octo/repo", 1)
+            gh_ops.get_unresolved_feedback("octo/repo", 1)
+
+        self.assertEqual(cursors, [None, "page1", "page1"])
+
+    def test_rescans_the_resolved_prefix_once_its_budget_runs_out(self) -> None:
+        old_thread = {"id": "old", "isResolved": True}
+        first_page = _threads_page([old_thread])
+        first_page["data"]["repository"]["pullRequest"]["reviewThreads"]["pageInfo"] = {
+            "hasNextPage": True,
+            "endCursor": "page1",
+        }
+        cursors: list[str | None] = []
+
+        def fake_graphql(query, variables):
+            if query is gh_ops.COMMENT_NODES_QUERY:
+                return {"data": {"nodes": [_bot_comment(5)]}}
+            cursors.append(variables["cursor"])
+            if variables["cursor"] is None:
+                return first_page
+            return _threads_page([])
+
+        with mock.patch.object(gh_ops, "gh_graphql", side_effect=fake_graphql):
+            gh_ops.get_unresolved_feedback("octo/repo", 1)
+            # A thread inside the skipped prefix flips back to unresolved.
+            old_thread["isResolved"] = False
+            old_thread["comments"] = {
+                "nodes": [{"id": "C5", "author": {"login": "coderabbitai"}}]
+            }
+            for _ in range(gh_ops.RESOLVED_PREFIX_MAX_REUSES):
+                self.assertEqual(gh_ops.get_unresolved_feedback("octo/repo", 1), [])
+            unresolved = gh_ops.get_unresolved_feedback("octo/repo", 1)
+
+        self.assertEqual([item["comment_id"] for item in unresolved], [5])
+        self.assertEqual(
+            cursors,
+            [None, "page1"]
+            + ["page1"] * gh_ops.RESOLVED_PREFIX_MAX_REUSES
+            + [None, "page1"],
+        )
+        self.assertNotIn(("octo/repo", 1), gh_ops._resolved_thread_prefix)
+
+
+class GatherCommentsForThreadsTests(TestCase):
+    def test_batches_threads_and_follows_cursors(self) -> None:
+        calls: list[dict] = []
+
+        def fake_graphql(query, variables):
+            calls.append(variables)
+            if len(calls) == 1:
+                self.assertIn("t1:node(id:$threadId1)", gh_ops._minify_graphql(query))
+                return {
+                    "data": {
+                        "t0": _comments_block([_bot_comment(1)], next_cursor="c1"),
+                        "t1": _comments_block([_bot_comment(2)]),
+                    }
+                }
+            self.assertEqual(variables, {"threadId0": "A", "cursor0": "c1"})
+            return {"data": {"t0": _comments_block([_bot_comment(3)])}}
+
+        with mock.patch.object(gh_ops, "gh_graphql", side_effect=fake_graphql):
+            comments = gh_ops._gather_comments_for_threads(["A", "B", "A"])
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(
+            {tid: [c["databaseId"] for c in nodes] for tid, nodes in comments.items()},
+            {"A": [1, 3], "B": [2]},
+        )
+
+    def test_splits_large_thread_sets_into_batches(self) -> None:
+        thread_ids = [f"T{i}" for i in range(gh_ops.THREAD_COMMENTS_BATCH_SIZE + 1)]
+        with mock.patch.object(
+            gh_ops, "gh_graphql", return_value={"data": {}}
+        ) as mock_graphql:
+            comments = gh_ops._gather_comments_for_threads(thread_ids)
+
+        self.assertEqual(mock_graphql.call_count, 2)
+        self.assertEqual(list(comments), thread_ids)
+
+
+class FormatFeedbackSummaryTests(TestCase):
+    def test_prefers_precomputed_summary(self) -> None:
+        self.assertEqual(
+            gh_ops.format_feedback_summary({"summary": "Fix this", "body": "x"}),
+            "Fix this",
+        )
+
+    def test_rejects_malformed_entries(self) -> None:
+        self.assertIsNone(gh_ops.format_feedback_summary({"summary": 42}))
+        self.assertIsNone(gh_ops.format_feedback_summary({"comment_id": 1}))
+
+
+class AcknowledgeReviewItemsTests(TestCase):
+    def test_resolves_each_thread_once_in_one_batch(self) -> None:
+        items = [
+            {"comment_id": 1, "thread_id": "T1", "is_resolved": False},
+            {"comment_id": 2, "thread_id": "T1", "is_resolved": False},
+            {"comment_id": 3, "thread_id": "T2", "is_resolved": False},
+        ]
+        resolved = {"thread": {"isResolved": True}}
+        processed: set[int] = set()
+        with (
+            mock.patch.object(
+                gh_ops,
+                "_graphql_mutation",
+                return_value={"data": {"m0": resolved, "m1": resolved}},
+            ) as mock_mutation,
+            mock.patch.object(gh_ops, "resolve_review_thread") as mock_resolve,
+        ):
+            result = gh_ops.acknowledge_review_items("octo/repo", 1, items, processed)
+
+        self.assertIs(result, processed)
+        self.assertEqual(processed, {1, 2, 3})
+        query, variables = mock_mutation.call_args.args
+        self.assertIn("m1:resolveReviewThread", gh_ops._minify_graphql(query))
+        self.assertEqual(variables, {"threadId0": "T1", "threadId1": "T2"})
+        mock_resolve.assert_not_called()
+
+    def test_retries_unconfirmed_threads_individually(self) -> None:
+        items = [
+            {"comment_id": 1, "thread_id": "T1"},
+            {"comment_id": 2, "thread_id": "T2"},
+            {"comment_id": 3, "thread_id": "T3"},
+        ]
+        response = {"data": {"m0": {"thread": {"isResolved": True}}, "m1": None}}
+        error = subprocess.CalledProcessError(1, ["gh"], output=b"", stderr=b"boom")
+        with (
+            mock.patch.object(gh_ops, "_graphql_mutation", return_value=response),
+            mock.patch.object(
+                gh_ops, "resolve_review_thread", side_effect=[error, None]
+            ) as mock_resolve,
+        ):
+            processed = gh_ops.acknowledge_review_items("octo/repo", 1, items, set())
+
+        self.assertEqual(processed, {1, 2, 3})
+        self.assertEqual(
+            sorted(call.args[0] for call in mock_resolve.call_args_list), ["T2", "T3"]
+        )
+
+    def test_failed_batch_falls_back_to_single_resolutions(self) -> None:
+        items = [{"comment_id": 1, "thread_id": "T1"}]
+        error = subprocess.CalledProcessError(1, ["gh"], output=b"", stderr=b"boom")
+        with (
+            mock.patch.object(gh_ops, "_graphql_mutation", side_effect=error),
+            mock.patch.object(gh_ops, "resolve_review_thread") as mock_resolve,
+        ):
+            gh_ops.acknowledge_review_items("octo/repo", 1, items, set())
+
+        mock_resolve.assert_called_once_with("T1")
+
+
+class ReplyToReviewCommentTests(TestCase):
+    def test_thread_replies_use_graphql_mutation(self) -> None:
+        with (
+            mock.patch.object(gh_ops, "_graphql_mutation") as mock_mutation,
+            mock.patch.object(gh_ops, "run_cmd") as mock_run_cmd,
+        ):
+            gh_ops.reply_to_review_comment(
+                "octo", "repo", 1, 7, "Fixed", thread_id="T1"
+            )
+
+        mock_mutation.assert_called_once_with(
+            gh_ops.ADD_REVIEW_THREAD_REPLY_MUTATION,
+            {"threadId": "T1", "body": "Fixed"},
+        )
+        mock_run_cmd.assert_not_called()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,11 @@ Tests for incremental log flushing behavior in the auto_prd logging system.
 """
 
 import io
+import logging
 import sys
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
 try:
@@ -37,6 +40,30 @@ class IncrementalLogFlushingTests(unittest.TestCase):
         # Ensure print hook is not installed after each test
         uninstall_print_logger()
 
+    def _setup_file_logging(self, level_name):
+        """Configure logging through the real entry point, undone after the test."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root_logger = logging.getLogger()
+        for lg in (
+            root_logger,
+            logging_utils.logger,
+            logging.getLogger(logging_utils.PRINT_LOGGER_NAME),
+        ):
+            self.addCleanup(lg.setLevel, lg.level)
+        for name in ("CURRENT_LOG_PATH", "USER_LOG_LEVEL"):
+            self.addCleanup(setattr, logging_utils, name, getattr(logging_utils, name))
+        original_handlers = list(root_logger.handlers)
+
+        def remove_added_handlers():
+            for handler in list(root_logger.handlers):
+                if handler not in original_handlers:
+                    root_logger.removeHandler(handler)
+                    handler.close()
+
+        self.addCleanup(remove_added_handlers)
+        logging_utils.setup_file_logging(Path(tmp.name) / "run.log", level_name)
+
     def test_print_hook_installs_and_uninstalls(self):
         """Test that print hook can be installed and uninstalled."""
         # Initially should not be installed
@@ -139,6 +166,74 @@ class IncrementalLogFlushingTests(unittest.TestCase):
             )
             self.assertIn("Message without newline", output)
 
+    def test_filtered_prints_are_not_formatted_for_logging(self):
+        """Prints the print logger would drop skip building the log message."""
+        self._setup_file_logging("WARNING")
+
+        with (
+            patch("sys.stdout", new_callable=io.StringIO) as mock_stdout,
+            patch.object(
+                logging_utils,
+                "format_print_message",
+                wraps=logging_utils.format_print_message,
+            ) as format_message,
+        ):
+            print("info only")
+            self.assertEqual(format_message.call_count, 0)
+            print("to stderr", file=sys.__stderr__)
+            self.assertEqual(format_message.call_count, 1)
+
+        self.assertEqual(mock_stdout.getvalue(), "info only\n")
+
+    def test_prints_skip_stream_checks_when_logging_is_off(self):
+        """Above WARNING the hook neither classifies streams nor formats."""
+        self._setup_file_logging("ERROR")
+
+        stream = io.StringIO()
+        with (
+            patch.object(stream, "fileno") as fileno,
+            patch.object(logging_utils, "format_print_message") as format_message,
+        ):
+            print("quiet", file=stream)
+
+        fileno.assert_not_called()
+        format_message.assert_not_called()
+        self.assertEqual(stream.getvalue(), "quiet\n")
+
+    def test_print_from_a_log_handler_bypasses_the_hook(self):
+        """A handler that prints must not feed its output back into logging."""
+        install_print_logger()
+        print_logger = logging.getLogger(logging_utils.PRINT_LOGGER_NAME)
+
+        class PrintingHandler(logging.Handler):
+            def __init__(self):
+                super().__init__()
+                self.messages = []
+
+            def emit(self, record):
+                self.messages.append(record.getMessage())
+                print(f"echo: {record.getMessage()}")
+
+        handler = PrintingHandler()
+        print_logger.addHandler(handler)
+        self.addCleanup(print_logger.removeHandler, handler)
+
+        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+            print("hello")
+
+        self.assertEqual(handler.messages, ["hello"])
+        self.assertEqual(mock_stdout.getvalue(), "echo: hello\nhello\n")
+
+    def test_piped_print_flushes_once(self):
+        """print(flush=True) already flushes; the hook adds no second flush."""
+        install_print_logger()
+
+        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+            with patch.object(mock_stdout, "flush", wraps=mock_stdout.flush) as flush:
+                print("one line")
+
+        self.assertEqual(flush.call_count, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -7,9 +7,15 @@ import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
-from auto_prd.initializer import BaselineResult, InitializerAgent, InitResult
-from auto_prd.tracker_generator import TRACKER_VERSION
+from auto_prd.initializer import (
+    BaselineResult,
+    InitializerAgent,
+    InitResult,
+    _output_tail,
+)
+from auto_prd.tracker_generator import TRACKER_VERSION, get_tracker_path
 
 
 class InitResultTests(unittest.TestCase):
@@ -73,6 +79,20 @@ class BaselineResultTests(unittest.TestCase):
         self.assertEqual(len(result.errors), 1)
 
 
+class OutputTailTests(unittest.TestCase):
+    """Tests for bounding baseline test output."""
+
+    def test_short_output_is_joined_unchanged(self) -> None:
+        self.assertEqual(_output_tail("out", "err", limit=100), "out\nerr")
+        self.assertEqual(_output_tail("out", "", limit=100), "out")
+
+    def test_long_output_keeps_only_the_tail(self) -> None:
+        out, err = "a" * 50, "b" * 20
+        tail = _output_tail(out, err, limit=30)
+        self.assertTrue(tail.endswith(("a" * 9) + "\n" + ("b" * 20)))
+        self.assertEqual(tail.split("\n", 1)[1], (out + "\n" + err)[-30:])
+
+
 class InitializerAgentTests(unittest.TestCase):
     """Tests for InitializerAgent class."""
 
@@ -121,6 +141,26 @@ class InitializerAgentTests(unittest.TestCase):
         self.assertIsNotNone(result.tracker)
         self.assertEqual(result.tracker.get("version"), TRACKER_VERSION)
 
+    def test_commit_failure_does_not_lose_baseline_result(self) -> None:
+        """Baseline tests still run and report when the tracker commit fails."""
+        prd_path = self.repo_root / "test.md"
+        prd_path.write_text("# Test PRD\n\nThis is a test PRD.")
+        agent = InitializerAgent(repo_root=self.repo_root, dry_run=True)
+        baseline = BaselineResult(success=False, output="1 failed", exit_code=1)
+        with (
+            mock.patch.object(
+                agent, "_commit_tracker", side_effect=RuntimeError("locked")
+            ),
+            mock.patch.object(
+                agent, "_run_baseline_tests", return_value=baseline
+            ) as mock_baseline,
+        ):
+            result = agent.run(prd_path)
+
+        mock_baseline.assert_called_once_with()
+        self.assertFalse(result.baseline_passed)
+        self.assertEqual(result.baseline_output, "1 failed")
+
     def test_command_exists_returns_false_for_nonexistent(self) -> None:
         """_command_exists should return False for nonexistent commands."""
         agent = InitializerAgent(
@@ -130,6 +170,105 @@ class InitializerAgentTests(unittest.TestCase):
         result = agent._command_exists("nonexistent_command_xyz123")
         self.assertFalse(result)
 
+    def test_command_exists_caches_path_lookups(self) -> None:
+        """_command_exists should look each command up in PATH only once."""
+        agent = InitializerAgent(
+            repo_root=self.repo_root, executor="claude", dry_run=True
+        )
+        with mock.patch(
+            "auto_prd.initializer.shutil.which", return_value="/usr/bin/make"
+        ) as mock_which:
+            self.assertTrue(agent._command_exists("make"))
+            self.assertTrue(agent._command_exists("make"))
+        mock_which.assert_called_once_with("make")
+
+    def test_commit_tracker_skips_git_when_fingerprint_matches(self) -> None:
+        """An unchanged tracker should not be re-staged on later runs."""
+        tracker_path = get_tracker_path(self.repo_root)
+        tracker_path.parent.mkdir(parents=True)
+        tracker_path.write_text('{"version": "2.0.0"}')
+        agent = InitializerAgent(repo_root=self.repo_root, executor="claude")
+        with (
+            mock.patch(
+                "auto_prd.initializer.git_has_staged_changes",
+                side_effect=[False, True, False, True],
+            ),
+            mock.patch("auto_prd.initializer.git_head_sha", return_value="abc"),
+            mock.patch("auto_prd.initializer.git_add") as mock_add,
+            mock.patch("auto_prd.initializer.git_commit") as mock_commit,
+        ):
+            agent._commit_tracker()
+            agent._commit_tracker()
+            self.assertEqual(mock_add.call_count, 1)
+            tracker_path.write_text('{"version": "2.0.1"}')
+            agent._commit_tracker()
+
+        self.assertEqual(mock_add.call_count, 2)
+        self.assertEqual(mock_commit.call_count, 2)
+
+    def test_commit_tracker_rechecks_after_head_moves(self) -> None:
+        """An identical tracker is re-checked after a branch switch or reset."""
+        tracker_path = get_tracker_path(self.repo_root)
+        tracker_path.parent.mkdir(parents=True)
+        tracker_path.write_text('{"version": "2.0.0"}')
+        agent = InitializerAgent(repo_root=self.repo_root, executor="claude")
+        with (
+            mock.patch(
+                "auto_prd.initializer.git_has_staged_changes",
+                side_effect=[False, True, False, True],
+            ),
+            mock.patch(
+                "auto_prd.initializer.git_head_sha", return_value="abc"
+            ) as mock_head,
+            mock.patch("auto_prd.initializer.git_add") as mock_add,
+            mock.patch("auto_prd.initializer.git_commit") as mock_commit,
+        ):
+            agent._commit_tracker()
+            mock_head.return_value = "other-branch"
+            agent._commit_tracker()
+
+        self.assertEqual(mock_add.call_count, 2)
+        self.assertEqual(mock_commit.call_count, 2)
+
+    def test_tracker_commit_finishes_before_baseline_tests_start(self) -> None:
+        """The tracker commit must not race the test suite for the git index."""
+        prd_path = self.repo_root / "test.md"
+        prd_path.write_text("# Test PRD\n\nThis is a test PRD.")
+        agent = InitializerAgent(repo_root=self.repo_root, dry_run=True)
+        order: list[str] = []
+        baseline = BaselineResult(success=True, output="", exit_code=0)
+        with (
+            mock.patch.object(
+                agent, "_commit_tracker", side_effect=lambda: order.append("commit")
+            ),
+            mock.patch.object(
+                agent,
+                "_run_baseline_tests",
+                side_effect=lambda: order.append("tests") or baseline,
+            ),
+        ):
+            agent.run(prd_path)
+
+        self.assertEqual(order, ["commit", "tests"])
+
+    def test_baseline_skips_runners_without_marker_files(self) -> None:
+        """Only runners whose marker file exists should be probed in PATH."""
+        (self.repo_root / "go.mod").write_text("module example\n")
+        agent = InitializerAgent(repo_root=self.repo_root, executor="claude")
+        with (
+            mock.patch(
+                "auto_prd.initializer.shutil.which", return_value="/usr/bin/go"
+            ) as mock_which,
+            mock.patch(
+                "auto_prd.initializer.run_cmd", return_value=("ok", "", 0)
+            ) as mock_run_cmd,
+        ):
+            result = agent._run_baseline_tests()
+
+        self.assertTrue(result.success)
+        mock_which.assert_called_once_with("go")
+        self.assertEqual(mock_run_cmd.call_args.args[0], ["go", "test", "./..."])
+
 
 class InitializerWithExistingTrackerTests(unittest.TestCase):
     """Tests for InitializerAgent with an existing tracker."""
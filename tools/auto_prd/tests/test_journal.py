@@ -0,0 +1,318 @@
+import gc
+import json
+import os
+import tempfile
+import threading
+import weakref
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import TestCase, main, mock
+
+try:
+    from tools.auto_prd import journal
+except ImportError:
+    from .. import journal
+
+
+class JournalBufferingTests(TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.journal_dir = Path(tmp.name)
+        self.journal = journal.Journal("session", journal_dir=self.journal_dir)
+        self.addCleanup(self.journal.close)
+
+    def test_entries_are_readable_after_flush(self) -> None:
+        self.journal.milestone("first")
+        self.journal.milestone("second")
+        self.journal.flush()
+
+        entries = journal.load_journal("session", journal_dir=self.journal_dir)
+        self.assertEqual([e["message"] for e in entries], ["first", "second"])
+
+    def test_entries_are_written_off_the_calling_thread(self) -> None:
+        writer_threads = []
+        real_writev = os.writev
+
+        def record_writev(fd, buffers):
+            writer_threads.append(threading.current_thread())
+            return real_writev(fd, buffers)
+
+        with mock.patch.object(journal.os, "writev", side_effect=record_writev):
+            for n in range(5):
+                self.journal.milestone(f"m{n}")
+            self.journal.flush()
+
+        self.assertTrue(writer_threads)
+        self.assertNotIn(threading.current_thread(), writer_threads)
+        entries = journal.load_journal("session", journal_dir=self.journal_dir)
+        self.assertEqual([e["message"] for e in entries], [f"m{n}" for n in range(5)])
+
+    def test_short_writes_are_resumed(self) -> None:
+        chunks = []
+
+        def short_writev(fd, buffers):
+            data = b"".join(buffers)[:3]
+            chunks.append(data)
+            return len(data)
+
+        with mock.patch.object(journal.os, "writev", side_effect=short_writev):
+            journal._write_lines(-1, [b"abcd", b"ef", b"ghij"])
+
+        self.assertEqual(b"".join(chunks), b"abcdefghij")
+
+    def test_batches_fall_back_to_one_write_without_writev(self) -> None:
+        chunks = []
+
+        def short_write(fd, data):
+            chunks.append(bytes(data[:3]))
+            return min(len(data), 3)
+
+        with (
+            mock.patch.object(journal, "HAS_WRITEV", False),
+            mock.patch.object(journal.os, "write", side_effect=short_write),
+        ):
+            journal._write_lines(-1, [b"abcd", b"ef", b"ghij"])
+
+        self.assertEqual(b"".join(chunks), b"abcdefghij")
+
+    def test_load_skips_malformed_lines(self) -> None:
+        self.journal.milestone("first")
+        self.journal.close()
+        path = self.journal_dir / "session.jsonl"
+        with open(path, "ab") as f:
+            f.write(b"{not json\n\n  \n")
+        self.journal.milestone("second")
+        self.journal.flush()
+
+        for has_orjson in (True, False) if journal.HAS_ORJSON else (False,):
+            with (
+                self.subTest(has_orjson=has_orjson),
+                mock.patch.object(journal, "HAS_ORJSON", has_orjson),
+            ):
+                entries = journal.load_journal("session", journal_dir=self.journal_dir)
+                self.assertEqual([e["message"] for e in entries], ["first", "second"])
+
+    def test_session_end_closes_and_later_entries_reopen(self) -> None:
+        self.journal.session_end(success=True)
+        self.journal.warning("after end")
+        self.journal.close()
+
+        entries = journal.load_journal("session", journal_dir=self.journal_dir)
+        self.assertEqual([e["action"] for e in entries], ["session_end", "warning"])
+        self.assertEqual(self.journal.entry_count, 2)
+
+    def test_disabled_journal_writes_nothing(self) -> None:
+        journal_dir = self.journal_dir / "off"
+        j = journal.Journal("off", journal_dir=journal_dir, enabled=False)
+        with mock.patch.object(j, "_write_entry") as write_entry:
+            j.iteration_start("local", 1, 5)
+            j.runner_end("codex", "local", success=True, output_preview="x" * 500)
+            j.session_end(success=True)
+
+        write_entry.assert_not_called()
+        self.assertFalse(j.enabled)
+        self.assertFalse(journal_dir.exists())
+
+    def test_templated_helpers_match_generic_encoding(self) -> None:
+        j = journal.Journal('s\u00e9ss"ion', journal_dir=self.journal_dir)
+        self.addCleanup(j.close)
+        name, phase, text = 'c\u00f6dex "x"', "lo\ncal", "y" * 300 + "\u2603\t"
+        cases = [
+            (
+                lambda: j.iteration_start(phase, 3, 10),
+                lambda: j.log(
+                    journal.ActionType.ITERATION_START,
+                    "Starting iteration 3/10",
+                    phase=phase,
+                    iteration=3,
+                    details={"max_iterations": 10},
+                ),
+            ),
+            (
+                lambda: j.iteration_end(phase, 3, tasks_left=None, has_findings=True),
+                lambda: j.log(
+                    journal.ActionType.ITERATION_END,
+                    "Completed iteration 3",
+                    phase=phase,
+                    iteration=3,
+                    details={
+                        "tasks_left": None,
+                        "has_findings": True,
+                        "repo_changed": False,
+                    },
+                ),
+            ),
+            (
+                lambda: j.runner_start(name, phase, text),
+                lambda: j.log(
+                    journal.ActionType.RUNNER_START,
+                    f"Launching {name}",
+                    phase=phase,
+                    details={"runner": name, "prompt_preview": text[:200] + "..."},
+                ),
+            ),
+        ]
+        for success, duration_ms in ((True, 1234), (False, None)):
+            cases.append(
+                (
+                    lambda s=success, d=duration_ms: j.runner_end(
+                        name, phase, s, d, text
+                    ),
+                    lambda s=success, d=duration_ms: j.log(
+                        journal.ActionType.RUNNER_END,
+                        f"{name} {'completed' if s else 'failed'}",
+                        phase=phase,
+                        success=s,
+                        duration_ms=d,
+                        details={"runner": name, "output_preview": text[:200] + "..."},
+                    ),
+                )
+            )
+
+        with (
+            mock.patch.object(journal, "_fmt_ts", return_value="2024-01-01T00:00:00Z"),
+            mock.patch.object(j, "_enqueue") as enqueue,
+        ):
+            for n, (templated, generic) in enumerate(cases):
+                with self.subTest(case=n):
+                    templated()
+                    generic()
+                    fast, slow = (c.args[0] for c in enqueue.call_args_list[-2:])
+                    self.assertEqual(fast, slow)
+
+    def test_templated_helpers_fall_back_for_untemplatable_values(self) -> None:
+        cases = {
+            "iteration_start": lambda: self.journal.iteration_start(None, 1, 5),
+            "iteration_end": lambda: self.journal.iteration_end(None, 1),
+            "runner_start": lambda: self.journal.runner_start(None, None),
+            "runner_end_phase": lambda: self.journal.runner_end("codex", None, True),
+            "runner_end_nan": lambda: self.journal.runner_end(
+                "codex", "local", True, float("nan")
+            ),
+            "runner_end_inf": lambda: self.journal.runner_end(
+                "codex", "local", False, float("inf")
+            ),
+        }
+        with mock.patch.object(self.journal, "_enqueue") as enqueue:
+            for name, helper in cases.items():
+                with self.subTest(helper=name):
+                    helper()
+                    line = enqueue.call_args.args[0]
+                    entry = json.loads(line, parse_constant=self.fail)
+                    self.assertNotIn("duration_ms", entry)
+
+    def test_templated_entries_with_non_int_fields_load_back(self) -> None:
+        self.journal.iteration_start("local", 1, None)
+        self.journal.iteration_start("local", True, 5)
+        self.journal.iteration_end("local", 2, tasks_left=1.5, has_findings=None)
+        self.journal.runner_end("codex", "local", True, 12.5)
+        self.journal.flush()
+
+        entries = journal.load_journal("session", journal_dir=self.journal_dir)
+        self.assertEqual(len(entries), 4)
+        self.assertIsNone(entries[0]["details"]["max_iterations"])
+        self.assertIs(entries[1]["iteration"], True)
+        self.assertEqual(entries[2]["details"]["tasks_left"], 1.5)
+        self.assertIsNone(entries[2]["details"]["has_findings"])
+        self.assertEqual(entries[3]["duration_ms"], 12.5)
+
+    def test_journals_are_closed_at_exit_without_being_kept_alive(self) -> None:
+        self.journal.milestone("pending")
+        extra = journal.Journal("extra", journal_dir=self.journal_dir)
+        ref = weakref.ref(extra)
+        del extra
+        gc.collect()
+        self.assertIsNone(ref())
+
+        journal._close_open_journals()
+
+        self.assertIsNone(self.journal._writer)
+        entries = journal.load_journal("session", journal_dir=self.journal_dir)
+        self.assertEqual([e["message"] for e in entries], ["pending"])
+
+
+class FormatTimestampTests(TestCase):
+    def test_matches_isoformat_in_utc(self) -> None:
+        ns = 1_700_000_000_123_456_789
+        formatted = journal._fmt_ts(ns)
+
+        self.assertEqual(formatted, "2023-11-14T22:13:20.123456Z")
+        self.assertEqual(
+            datetime.fromisoformat(formatted.replace("Z", "+00:00")),
+            datetime.fromtimestamp(ns // 1000 / 1_000_000, tz=timezone.utc),
+        )
+
+
+class SummarizeJournalTests(TestCase):
+    def test_counts_phase_actions_and_collects_events(self) -> None:
+        entries = [
+            {
+                "action": "phase_start",
+                "phase": "local",
+                "timestamp": "2024-01-01T00:00:00Z",
+            },
+            {
+                "action": "iteration_end",
+                "phase": "local",
+                "timestamp": "2024-01-01T00:00:01Z",
+            },
+            {
+                "action": "runner_end",
+                "phase": "local",
+                "timestamp": "2024-01-01T00:00:02Z",
+            },
+            {
+                "action": "error",
+                "phase": "local",
+                "message": "boom",
+                "timestamp": "2024-01-01T00:00:03Z",
+            },
+            {
+                "action": "milestone",
+                "message": "done",
+                "timestamp": "2024-01-01T00:00:04.500000Z",
+            },
+        ]
+
+        summary = journal.summarize_journal(entries)
+
+        self.assertEqual(
+            summary["phases"],
+            {
+                "local": {
+                    "iterations": 1,
+                    "runner_calls": 1,
+                    "errors": 1,
+                    "started_at": "2024-01-01T00:00:00Z",
+                }
+            },
+        )
+        self.assertEqual([e["message"] for e in summary["errors"]], ["boom"])
+        self.assertEqual([m["message"] for m in summary["milestones"]], ["done"])
+        self.assertEqual(summary["duration_ms"], 4500)
+
+    def test_stream_summarize_matches_loaded_summary(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            journal_dir = Path(tmp)
+            j = journal.Journal("s", journal_dir=journal_dir)
+            j.phase_start("local")
+            j.iteration_end("local", 1, tasks_left=2)
+            j.error("boom", phase="local")
+            j.milestone("done")
+            j.close()
+            with open(journal_dir / "s.jsonl", "ab") as f:
+                f.write(b"{truncated\n")
+
+            self.assertEqual(
+                journal.stream_summarize("s", journal_dir=journal_dir),
+                journal.summarize_journal(journal.load_journal("s", journal_dir)),
+            )
+            self.assertEqual(
+                journal.stream_summarize("missing", journal_dir=journal_dir),
+                {"total_entries": 0},
+            )
+
+
+if __name__ == "__main__":
+    main()
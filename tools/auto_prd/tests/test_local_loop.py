@@ -0,0 +1,113 @@
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+from unittest import TestCase, main, mock
+
+try:
+    from tools.auto_prd import local_loop
+except ImportError:
+    from .. import local_loop
+
+
+class OrchestrateLocalLoopReviewTests(TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo_root = Path(tmp.name)
+        self.prd_path = self.repo_root / "prd.md"
+        self.prd_path.write_text("- [ ] task\n- [x] done\n")
+        # Main-thread events, in the order the loop performs them.
+        self.events: list[str] = []
+        self.review_threads: list[threading.Thread] = []
+
+    def _run(self, impl_outputs, statuses, review_side_effect=None):
+        statuses = iter(statuses)
+
+        def status_and_head(_repo_root):
+            self.events.append("status")
+            return next(statuses)
+
+        def review(**_kwargs):
+            self.review_threads.append(threading.current_thread())
+            return ""
+
+        real_start_review = local_loop._start_review
+
+        def start_review(base_branch, repo_root):
+            self.events.append("start_review")
+            return real_start_review(base_branch, repo_root)
+
+        runner = mock.Mock(side_effect=[(out, "") for out in impl_outputs])
+        with (
+            mock.patch.object(
+                local_loop, "policy_runner", return_value=(runner, "codex")
+            ),
+            mock.patch.object(local_loop, "warm_runner"),
+            mock.patch.object(
+                local_loop, "git_status_and_head", side_effect=status_and_head
+            ),
+            mock.patch.object(
+                local_loop, "_start_review", side_effect=start_review
+            ) as start_review_mock,
+            mock.patch.object(
+                local_loop,
+                "coderabbit_prompt_only",
+                side_effect=review_side_effect or review,
+            ) as review_mock,
+            mock.patch.object(
+                local_loop, "coderabbit_has_findings", return_value=False
+            ),
+        ):
+            local_loop.orchestrate_local_loop(
+                prd_path=self.prd_path,
+                repo_root=self.repo_root,
+                base_branch="main",
+                max_iters=len(impl_outputs),
+                codex_model="model",
+                allow_unsafe_execution=False,
+                dry_run=False,
+            )
+        return start_review_mock, review_mock
+
+    def test_review_overlaps_the_snapshot_only_when_tasks_progress(self) -> None:
+        unchanged = (frozenset({" M a.py"}), "head1")
+        start_review, review = self._run(
+            ["TASKS_LEFT=3", "TASKS_LEFT=1"], [unchanged] * 4
+        )
+
+        # Iteration 1 made no progress and changed nothing: no review at all.
+        # Iteration 2 progressed, so the review started before its snapshot.
+        self.assertEqual(
+            self.events, ["status", "status", "start_review", "status", "status"]
+        )
+        start_review.assert_called_once_with("main", self.repo_root)
+        review.assert_called_once_with(base_branch="main", repo_root=self.repo_root)
+        self.assertIsNot(self.review_threads[0], threading.current_thread())
+
+    def test_without_progress_the_snapshot_decides_on_the_review(self) -> None:
+        before = (frozenset(), "head1")
+        after = (frozenset({" M a.py"}), "head1")
+        start_review, review = self._run(["TASKS_LEFT=3"], [before, after, after])
+
+        self.assertEqual(self.events, ["status", "status", "status"])
+        start_review.assert_not_called()
+        review.assert_called_once_with(base_branch="main", repo_root=self.repo_root)
+        self.assertIs(self.review_threads[0], threading.current_thread())
+
+    def test_background_review_errors_propagate(self) -> None:
+        unchanged = (frozenset(), "head1")
+        error = subprocess.CalledProcessError(1, ["coderabbit"])
+        with self.assertRaises(subprocess.CalledProcessError) as ctx:
+            self._run(
+                ["TASKS_LEFT=3", "TASKS_LEFT=1"],
+                [unchanged] * 4,
+                review_side_effect=error,
+            )
+
+        self.assertIs(ctx.exception, error)
+        self.assertEqual(self.events, ["status", "status", "start_review", "status"])
+
+
+if __name__ == "__main__":
+    main()
@@ -588,5 +588,17 @@ class ReviewFixLoopTests(TestCase):
                 )
 
 
+class TrimProcessedCommentIdsTests(TestCase):
+    def test_drops_oldest_ids_beyond_limit(self) -> None:
+        processed = {5, 1, 4, 2, 3}
+        review_loop._trim_processed_comment_ids(processed, limit=3)
+        self.assertEqual(processed, {3, 4, 5})
+
+    def test_leaves_small_sets_untouched(self) -> None:
+        processed = {1, 2}
+        review_loop._trim_processed_comment_ids(processed, limit=3)
+        self.assertEqual(processed, {1, 2})
+
+
 if __name__ == "__main__":
     main()
@@ -3,6 +3,7 @@
 This module tests the PRD analysis and tracker generation functionality.
 """
 
+import json
 import tempfile
 import unittest
 from pathlib import Path
@@ -141,6 +142,19 @@ class LoadSaveTrackerTests(unittest.TestCase):
         self.assertEqual(loaded["version"], TRACKER_VERSION)
         self.assertEqual(loaded["metadata"]["prd_source"], "test.md")
 
+    def test_save_replaces_tracker_without_leaving_temp_files(self) -> None:
+        """Saving should swap the tracker in atomically and clean up."""
+        tracker_path = get_tracker_path(self.repo_root)
+        tracker_path.write_text("stale")
+
+        save_tracker({"version": TRACKER_VERSION}, self.repo_root)
+
+        self.assertEqual(
+            json.loads(tracker_path.read_text(encoding="utf-8")),
+            {"version": TRACKER_VERSION},
+        )
+        self.assertEqual(list(self.aprd_dir.iterdir()), [tracker_path])
+
     def test_load_returns_none_when_missing(self) -> None:
         """Loading nonexistent tracker should return None."""
         result = load_tracker(self.repo_root)
@@ -1,8 +1,18 @@
+import os
 import subprocess
+import tempfile
+import time
 import unittest
+from pathlib import Path
+from unittest import mock
 
 from .test_helpers import safe_import
 
+try:
+    from tools.auto_prd import utils
+except ImportError:
+    from .. import utils
+
 CLI_ARG_REPLACEMENTS = safe_import(
     "tools.auto_prd.constants", "..constants", "CLI_ARG_REPLACEMENTS"
 )
@@ -15,8 +25,15 @@ extract_called_process_error_details = safe_import(
 extract_http_status = safe_import(
     "tools.auto_prd.utils", "..utils", "extract_http_status"
 )
+extract_rate_limit_wait = safe_import(
+    "tools.auto_prd.utils", "..utils", "extract_rate_limit_wait"
+)
+call_with_backoff = safe_import("tools.auto_prd.utils", "..utils", "call_with_backoff")
 is_valid_int = safe_import("tools.auto_prd.utils", "..utils", "is_valid_int")
 is_valid_numeric = safe_import("tools.auto_prd.utils", "..utils", "is_valid_numeric")
+detect_readonly_block = safe_import(
+    "tools.auto_prd.utils", "..utils", "detect_readonly_block"
+)
 parse_tasks_left = safe_import("tools.auto_prd.utils", "..utils", "parse_tasks_left")
 sanitize_for_cli = safe_import("tools.auto_prd.utils", "..utils", "sanitize_for_cli")
 scrub_cli_text = safe_import("tools.auto_prd.utils", "..utils", "scrub_cli_text")
@@ -99,6 +116,52 @@ class ExtractHttpStatusTests(unittest.TestCase):
         self.assertIsNone(extract_http_status(exc))
 
 
+class ExtractRateLimitWaitTests(unittest.TestCase):
+    def _exc(self, stderr: str) -> subprocess.CalledProcessError:
+        return subprocess.CalledProcessError(
+            1, ["gh", "api"], output=b"", stderr=stderr
+        )
+
+    def test_prefers_retry_after_header(self) -> None:
+        exc = self._exc("HTTP 403: secondary rate limit\nRetry-After: 42")
+        self.assertEqual(extract_rate_limit_wait(exc), 42.0)
+
+    def test_uses_rate_limit_reset_timestamp(self) -> None:
+        exc = self._exc("HTTP 429\nX-RateLimit-Reset: 1030")
+        with mock.patch("tools.auto_prd.utils.time.time", return_value=1000.0):
+            self.assertEqual(extract_rate_limit_wait(exc), 30.0)
+
+    def test_secondary_rate_limit_without_headers_waits_a_minute(self) -> None:
+        exc = self._exc("HTTP 403: You have exceeded a secondary rate limit")
+        self.assertEqual(extract_rate_limit_wait(exc), 60.0)
+
+    def test_returns_none_without_hints(self) -> None:
+        self.assertIsNone(extract_rate_limit_wait(self._exc("HTTP 403: Forbidden")))
+
+
+class CallWithBackoffTests(unittest.TestCase):
+    def test_sleeps_for_hinted_wait_then_retries(self) -> None:
+        exc = subprocess.CalledProcessError(
+            1, ["gh", "api"], output=b"", stderr="HTTP 429\nRetry-After: 7"
+        )
+        action = mock.Mock(side_effect=[exc, "ok"])
+        with (
+            mock.patch("tools.auto_prd.utils.time.sleep") as mock_sleep,
+            mock.patch("tools.auto_prd.utils.random.uniform", return_value=0.0),
+        ):
+            self.assertEqual(call_with_backoff(action), "ok")
+        mock_sleep.assert_called_once_with(7.0)
+
+    def test_non_rate_limit_errors_are_not_retried(self) -> None:
+        exc = subprocess.CalledProcessError(
+            1, ["gh", "api"], output=b"", stderr="HTTP 404: Not Found"
+        )
+        action = mock.Mock(side_effect=exc)
+        with self.assertRaises(subprocess.CalledProcessError):
+            call_with_backoff(action)
+        action.assert_called_once()
+
+
 class ParseTasksLeftTests(unittest.TestCase):
     def test_parses_value_when_present(self) -> None:
         self.assertEqual(parse_tasks_left("TASKS_LEFT=3"), 3)
@@ -106,6 +169,70 @@ class ParseTasksLeftTests(unittest.TestCase):
     def test_returns_none_when_missing(self) -> None:
         self.assertIsNone(parse_tasks_left("no counter here"))
 
+    def test_prefers_the_final_report(self) -> None:
+        self.assertEqual(parse_tasks_left("TASKS_LEFT=5\nworking\nTASKS_LEFT=2\n"), 2)
+
+    def test_falls_back_to_full_scan_outside_tail(self) -> None:
+        padding = "x" * 20_000
+        self.assertEqual(parse_tasks_left(f"TASKS_LEFT=4\n{padding}"), 4)
+        self.assertEqual(parse_tasks_left(f"TASKS_LEFT=4\n{padding}\nTASKS_LEFT=1"), 1)
+
+
+class CheckboxStatsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.prd = Path(tmp.name) / "prd.md"
+        utils._checkbox_stats_cached.cache_clear()
+        self.addCleanup(utils._checkbox_stats_cached.cache_clear)
+
+    def _write(self, text: str, age_seconds: float) -> None:
+        self.prd.write_text(text, encoding="utf-8")
+        stamp = time.time() - age_seconds
+        os.utime(self.prd, (stamp, stamp))
+
+    def test_unchanged_file_is_scanned_once(self) -> None:
+        self._write("- [ ] one\n- [x] two\n", age_seconds=60)
+        with mock.patch.object(
+            utils, "_count_checkboxes", wraps=utils._count_checkboxes
+        ) as count:
+            self.assertEqual(utils.checkbox_stats(self.prd), (1, 2))
+            self.assertEqual(utils.checkbox_stats(self.prd), (1, 2))
+            self.assertEqual(count.call_count, 1)
+
+            self._write("- [x] one\n- [x] two\n", age_seconds=30)
+            self.assertEqual(utils.checkbox_stats(self.prd), (0, 2))
+            self.assertEqual(count.call_count, 2)
+
+    def test_recently_modified_file_is_always_rescanned(self) -> None:
+        self._write("- [ ] one\n", age_seconds=0)
+        with mock.patch.object(
+            utils, "_count_checkboxes", wraps=utils._count_checkboxes
+        ) as count:
+            utils.checkbox_stats(self.prd)
+            utils.checkbox_stats(self.prd)
+
+        self.assertEqual(count.call_count, 2)
+
+    def test_missing_file_has_no_checkboxes(self) -> None:
+        self.assertEqual(utils.checkbox_stats(self.prd), (0, 0))
+
+
+class DetectReadonlyBlockTests(unittest.TestCase):
+    def test_matches_phrases_case_insensitively(self) -> None:
+        self.assertEqual(
+            detect_readonly_block("error: SANDBOX IS READ-ONLY here"),
+            "sandbox is read-only",
+        )
+
+    def test_reports_first_phrase_in_table_order(self) -> None:
+        output = "EPERM first, then later: sandbox: read-only"
+        self.assertEqual(detect_readonly_block(output), "sandbox: read-only")
+
+    def test_clean_output_has_no_block(self) -> None:
+        self.assertIsNone(detect_readonly_block("All tests passed.\nTASKS_LEFT=0"))
+        self.assertIsNone(detect_readonly_block(""))
+
 
 class ScrubCliTextTests(unittest.TestCase):
     def test_replaces_unsafe_characters(self) -> None:
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import re
 import time
 from datetime import datetime, timezone
@@ -861,7 +862,7 @@ def generate_tracker(
     # Save tracker
     tracker_path = get_tracker_path(repo_root)
     tracker_path.parent.mkdir(parents=True, exist_ok=True)
-    tracker_path.write_text(json.dumps(tracker, indent=2))
+    _atomic_write_tracker(tracker_path, json.dumps(tracker, indent=2).encode("utf-8"))
 
     logger.info(
         "Tracker generated: %d features, %d total tasks",
@@ -872,6 +873,33 @@ def generate_tracker(
     return tracker
 
 
+def _atomic_write_tracker(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` with one write and one sync, then rename.
+
+    The body goes out in a single unbuffered write followed by fdatasync (fsync
+    where unavailable), and the temp file replaces ``path`` atomically so
+    readers and ``git add`` never see a half-written tracker.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+            getattr(os, "fdatasync", os.fsync)(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            # Ignore cleanup errors; the temp file may already be gone.
+            pass
+        raise
+
+
 def save_tracker(tracker: dict[str, Any], repo_root: Path) -> None:
     """Save tracker to disk.
 
@@ -881,7 +909,7 @@ def save_tracker(tracker: dict[str, Any], repo_root: Path) -> None:
     """
     tracker_path = get_tracker_path(repo_root)
     tracker_path.parent.mkdir(parents=True, exist_ok=True)
-    tracker_path.write_text(json.dumps(tracker, indent=2))
+    _atomic_write_tracker(tracker_path, json.dumps(tracker, indent=2).encode("utf-8"))
     logger.debug("Tracker saved to %s", tracker_path)
 
 
@@ -7,6 +7,7 @@ import re
 import subprocess
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -16,8 +17,14 @@ from .constants import (
     CLI_ARG_REPLACEMENTS,
     CODEX_READONLY_ERROR_MSG,
     CODEX_READONLY_PATTERNS,
+    CODEX_READONLY_RE,
+    RATE_LIMIT_MAX_WAIT_SECONDS,
+    RATE_LIMIT_RESET_RE,
     RATE_LIMIT_STATUS,
+    RETRY_AFTER_RE,
+    SECONDARY_RATE_LIMIT_WAIT_SECONDS,
     TASKS_LEFT_RE,
+    TASKS_LEFT_TAIL_SCAN_CHARS,
     UNSAFE_ARG_CHARS,
 )
 from .logging_utils import decode_output, logger
@@ -68,22 +75,49 @@ def now_stamp() -> str:
     return datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
 
 
-def checkbox_stats(md: Path) -> tuple[int, int]:
-    if not md.exists():
-        return 0, 0
+# A file modified this recently may change again within the same mtime tick
+# without its stat signature changing (ticking a box keeps the size), so its
+# counts are recomputed rather than memoized.
+CHECKBOX_STATS_RACY_NS = 2_000_000_000
+
+
+def _count_checkboxes(md: Path) -> tuple[int, int]:
     txt = md.read_text(encoding="utf-8", errors="ignore")
     total = len(CHECKBOX_ANY_RE.findall(txt))
     unchecked = len(CHECKBOX_UNCHECKED_RE.findall(txt))
     return unchecked, total
 
 
+@lru_cache(maxsize=16)
+def _checkbox_stats_cached(
+    md: Path, _ino: int, _mtime_ns: int, _size: int
+) -> tuple[int, int]:
+    return _count_checkboxes(md)
+
+
+def checkbox_stats(md: Path) -> tuple[int, int]:
+    # Keyed on the stat signature so an unchanged PRD is not re-read and
+    # re-scanned on every loop iteration.
+    try:
+        st = md.stat()
+    except OSError:
+        return 0, 0
+    if time.time_ns() - st.st_mtime_ns < CHECKBOX_STATS_RACY_NS:
+        return _count_checkboxes(md)
+    return _checkbox_stats_cached(md, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
 def parse_tasks_left(output: str) -> int | None:
+    """Return the last TASKS_LEFT=<N> value reported in ``output``, if any."""
     if not output:
         return None
-    match = TASKS_LEFT_RE.search(output)
-    if match:
+    tail_start = max(0, len(output) - TASKS_LEFT_TAIL_SCAN_CHARS)
+    values = TASKS_LEFT_RE.findall(output, tail_start)
+    if not values and tail_start:
+        values = TASKS_LEFT_RE.findall(output)
+    if values:
         try:
-            return int(match.group(1))
+            return int(values[-1])
         except ValueError:
             return None
     return None
@@ -98,6 +132,31 @@ def extract_http_status(exc: subprocess.CalledProcessError) -> str | None:
     return None
 
 
+def extract_rate_limit_wait(exc: subprocess.CalledProcessError) -> float | None:
+    """Return how long GitHub asked us to wait before retrying, if it said so.
+
+    Honors a Retry-After header, then an X-RateLimit-Reset epoch timestamp, then
+    falls back to GitHub's recommended minimum wait for secondary rate limits. The
+    result is capped at RATE_LIMIT_MAX_WAIT_SECONDS. Returns None when the output
+    carries no rate-limit hint so callers can use their own backoff schedule.
+    """
+    stdout, stderr = _extract_stdout_stderr(exc)
+    text = (stderr or "") + "\n" + (stdout or "")
+    wait: float | None = None
+    match = RETRY_AFTER_RE.search(text)
+    if match:
+        wait = float(match.group(1))
+    else:
+        match = RATE_LIMIT_RESET_RE.search(text)
+        if match:
+            wait = max(0.0, float(match.group(1)) - time.time())
+        elif "secondary rate limit" in text.lower():
+            wait = SECONDARY_RATE_LIMIT_WAIT_SECONDS
+    if wait is None:
+        return None
+    return min(wait, RATE_LIMIT_MAX_WAIT_SECONDS)
+
+
 def _coerce_text(data: Any) -> str:
     if data is None:
         return ""
@@ -168,13 +227,28 @@ def call_with_backoff(action, *, retries: int = 3, base_delay: float = 1.0) -> A
             status = extract_http_status(exc)
             if status not in RATE_LIMIT_STATUS or attempt >= retries:
                 raise
-            sleep_for = base_delay * (2**attempt) + random.uniform(0.0, 0.5)
+            # Sleep exactly as long as GitHub asked when it says so; otherwise fall
+            # back to jittered exponential backoff.
+            hinted = extract_rate_limit_wait(exc)
+            if hinted is not None:
+                sleep_for = hinted + random.uniform(0.0, 0.5)
+                logger.warning(
+                    "GitHub rate limit hit (HTTP %s); waiting %.1fs before retry %d/%d",
+                    status,
+                    sleep_for,
+                    attempt + 1,
+                    retries,
+                )
+            else:
+                sleep_for = base_delay * (2**attempt) + random.uniform(0.0, 0.5)
             time.sleep(sleep_for)
             attempt += 1
 
 
 def detect_readonly_block(output: str) -> str | None:
-    if not output:
+    # One compiled pass over the output, without a lowercased copy, for the
+    # common no-match case; on a hit, report the first phrase in table order.
+    if not output or not CODEX_READONLY_RE.search(output):
         return None
     lowered = output.lower()
     for pattern in CODEX_READONLY_PATTERNS: